@@ -0,0 +1,110 @@
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import nepali_datetime
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR.parent))
+
+from core.dates import parse_date_series
+
+
+# -----------------------------
+# Old per-row parser (copied from data/finance/index.py)
+# -----------------------------
+def legacy_parse_mixed_date(value):
+    if pd.isna(value):
+        return pd.NaT
+
+    if isinstance(value, (int, float)):
+        if value < 40000:
+            return pd.NaT
+        try:
+            dt = pd.to_datetime(value, origin="1899-12-30", unit="D")
+            if dt.year < 1990:
+                return pd.NaT
+            return dt
+        except Exception:
+            return pd.NaT
+
+    value = str(value).strip()
+
+    bs_match = re.match(r"^(20\d{2})[/-](\d{1,2})[/-](\d{1,2})$", value)
+    if bs_match:
+        try:
+            y, m, d = map(int, bs_match.groups())
+            if 2070 <= y <= 2090:
+                bs_date = nepali_datetime.date(y, m, d)
+                return pd.to_datetime(bs_date.to_datetime_date())
+        except Exception:
+            return pd.NaT
+
+    try:
+        dt = pd.to_datetime(value, errors="coerce")
+        if pd.isna(dt):
+            return pd.NaT
+        if dt.year < 1990 or dt.year > 2035:
+            return pd.NaT
+        return dt
+    except Exception:
+        return pd.NaT
+
+
+# -----------------------------
+# Synthetic "Date" column
+# -----------------------------
+def make_column(n, seed=0):
+    rng = np.random.default_rng(seed)
+
+    ad = pd.date_range("2014-01-01", "2030-12-31", freq="D")
+    picks = rng.integers(0, len(ad), n)
+    kind = rng.integers(0, 5, n)
+
+    values = []
+    for k, i in zip(kind, picks):
+        day = ad[i]
+        if k == 0:
+            values.append(day)
+        elif k == 1:
+            values.append(day.strftime("%Y-%m-%d"))
+        elif k == 2:
+            values.append(float((day - pd.Timestamp("1899-12-30")).days))
+        elif k == 3:
+            bs = nepali_datetime.date.from_datetime_date(day.date())
+            values.append(f"{bs.year}/{bs.month:02d}/{bs.day:02d}")
+        else:
+            values.append(rng.choice(["", "Total", None, "2078/13/40", "1985-01-01"]))
+
+    return pd.Series(values, dtype=object, name="Date")
+
+
+def bench(n):
+    col = make_column(n)
+
+    start = time.perf_counter()
+    old = pd.to_datetime(col.apply(legacy_parse_mixed_date))
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = parse_date_series(col)
+    new_time = time.perf_counter() - start
+
+    mismatch = ~((old.to_numpy() == new.to_numpy()) | (old.isna() & new.isna()).to_numpy())
+    if mismatch.any():
+        bad = pd.DataFrame({"value": col, "old": old, "new": new})[mismatch]
+        raise AssertionError(f"parser mismatch:\n{bad.head(20)}")
+
+    print(
+        f"{n:>8} rows | row-wise {n / old_time:>12,.0f} rows/s"
+        f" | vectorized {n / new_time:>12,.0f} rows/s"
+        f" | x{old_time / new_time:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    for n in [1_000, 10_000, 50_000]:
+        bench(n)
@@ -0,0 +1,100 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR.parent))
+
+from core.excel_cache import read_excel_cached
+from core.rotation import rotation_backtest
+
+
+# -----------------------------
+# Old per-date loop (copied from moneyflow.py); tests/test_rotation.py
+# checks that both give the same results
+# -----------------------------
+def legacy_rotation_backtest(df_base, lookback=20, transaction_cost=0.002):
+
+    momentum = df_base.pct_change(lookback)
+    momentum = momentum.dropna(how="all")
+
+    daily_returns = df_base.pct_change().fillna(0)
+
+    leader = momentum.idxmax(axis=1)
+
+    strategy_returns = []
+    current_sector = None
+
+    for date in df_base.index:
+
+        if date not in leader.index:
+            strategy_returns.append(0)
+            continue
+
+        new_sector = leader.loc[date]
+
+        if current_sector is not None and new_sector != current_sector:
+            cost = transaction_cost
+        else:
+            cost = 0
+
+        daily_ret = daily_returns.loc[date, new_sector] - cost
+        strategy_returns.append(daily_ret)
+
+        current_sector = new_sector
+
+    strategy_returns = pd.Series(strategy_returns, index=df_base.index)
+
+    equity_curve = (1 + strategy_returns).cumprod()
+
+    total_return = equity_curve.iloc[-1] - 1
+
+    rolling_max = equity_curve.cummax()
+    drawdown = (equity_curve - rolling_max) / rolling_max
+    max_dd = drawdown.min()
+
+    sharpe = (strategy_returns.mean() / strategy_returns.std()) * np.sqrt(252)
+
+    return {
+        "Lookback": lookback,
+        "Total Return %": total_return * 100,
+        "Max Drawdown %": max_dd * 100,
+        "Sharpe Ratio": sharpe,
+        "Equity Curve": equity_curve
+    }
+
+
+def load_df_base():
+    df = read_excel_cached(BASE_DIR.parent / "data" / "annual" / "main.xlsx", sheet_name="Sheet1")
+    df.columns = df.columns.str.strip()
+    df["BUSINESS_DATE"] = pd.to_datetime(df["BUSINESS_DATE"], errors="coerce")
+    df = df.sort_values("BUSINESS_DATE").reset_index(drop=True)
+
+    sector_df = df[df.columns.drop("BUSINESS_DATE")]
+    return sector_df / sector_df.iloc[0] * 100
+
+
+def timed(func, *args, repeat=5, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+if __name__ == "__main__":
+    df_base = load_df_base()
+    print(f"main.xlsx: {df_base.shape[0]} days x {df_base.shape[1]} sectors\n")
+
+    for lookback in [10, 20, 30, 60, 90, 120]:
+        for cost in [0.0, 0.002]:
+            _, old_time = timed(legacy_rotation_backtest, df_base, lookback, cost)
+            _, new_time = timed(rotation_backtest, df_base, lookback, cost)
+            print(
+                f"lookback {lookback:>3} cost {cost:.3f} | loop {old_time * 1e3:8.2f} ms"
+                f" | vectorized {new_time * 1e3:6.2f} ms | x{old_time / new_time:.0f}"
+            )
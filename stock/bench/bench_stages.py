@@ -0,0 +1,267 @@
+"""
+Stage-by-stage timings of the analysis scripts on synthetic inputs at
+1x, 10x and 100x the size of the real files.
+
+    python bench/bench_stages.py                 # all stages, all scales
+    python bench/bench_stages.py --scales 1 10 --stages excel_parse rotation_backtest
+
+Every run is appended to bench/history.json together with the commit
+it ran on, and compared with the last run of the same stage and scale.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR.parent))
+
+from core import sectors
+from core.correlation import rolling_corr
+from core.dates import normalize_date_column, parse_date_series
+from core.downsample import plot_line
+from core.render import new_figure, render
+from core.rotation import rotation_backtest
+from core.sector_matrix import SectorMatrix
+from core.sectors import canonicalize_columns
+
+from synthetic import CSV_SECTORS, dataset, mixed_dates, sector_index_frame
+
+HISTORY_FILE = BASE_DIR / "history.json"
+
+SCALES = [1, 10, 100]
+REPEAT = 3
+
+# A stage this much slower than its last recorded run is flagged
+REGRESSION = 1.20
+
+
+# -----------------------------
+# Stages
+# -----------------------------
+# Each stage takes a scale and returns (setup, run): setup() builds the
+# inputs outside the timer, run(inputs) is the part that is timed and
+# returns the number of rows it processed.
+
+def stage_excel_parse(scale):
+    index_path = dataset("index", scale)
+    broker_path = dataset("broker", scale)
+
+    def run(_):
+        df = pd.read_excel(index_path)
+        brokers = pd.read_excel(
+            broker_path, sheet_name="Brokerwise Trading Amount", header=7, usecols=[0, 1, 2]
+        )
+        return len(df) + len(brokers)
+
+    return lambda: None, run
+
+
+def stage_csv_load(scale):
+    csv_path = dataset("csv", scale)
+
+    def run(_):
+        df = pd.read_csv(csv_path, parse_dates=["businessDate"])
+        df.groupby(["businessDate", "sectorName"])["turnOverValues"].sum().unstack()
+        return len(df)
+
+    return lambda: None, run
+
+
+def stage_csv_stream(scale):
+    csv_path = dataset("csv", scale)
+
+    def run(_):
+        # Same (date x sector) turnover as csv_load, one chunk in memory at a time
+        return SectorMatrix.from_csv(csv_path).shape[0] * len(CSV_SECTORS)
+
+    return lambda: None, run
+
+
+def stage_parse_mixed_date(scale):
+    n = 10_000 * scale
+
+    def run(col):
+        parse_date_series(col)
+        return len(col)
+
+    return lambda: mixed_dates(n), run
+
+
+def stage_normalize_columns(scale):
+    def setup():
+        return sector_index_frame(scale)
+
+    def run(df):
+        # Measure a cold lookup, as a fresh script run would see it
+        sectors.canonical_sector.cache_clear()
+        df = canonicalize_columns(df.copy(), source="bench")
+        normalize_date_column(df)
+        return len(df)
+
+    return setup, run
+
+
+def _index_levels(scale):
+    df = canonicalize_columns(sector_index_frame(scale))
+    return df.set_index(pd.to_datetime(df["Date"])).drop(columns="Date")
+
+
+def stage_pct_change_corr(scale):
+    def run(df):
+        returns = df.pct_change().dropna()
+        returns.corr()
+        rolling_corr(returns.to_numpy(), window=60)
+        return len(df)
+
+    return lambda: _index_levels(scale), run
+
+
+def stage_rotation_backtest(scale):
+    def run(df):
+        rotation_backtest(df, lookback=20)
+        return len(df)
+
+    return lambda: _index_levels(scale), run
+
+
+def stage_savefig(scale):
+    def draw(df):
+        fig, ax = new_figure("line")
+        for col in df.columns:
+            plot_line(ax, df.index, df[col], label=col)
+        ax.legend()
+        fig.tight_layout()
+        return fig
+
+    def run(df):
+        # A fresh directory each time, so the content-hash skip never hits
+        with tempfile.TemporaryDirectory() as tmp:
+            render(Path(tmp) / "chart.png", lambda: draw(df), preview=False)
+        return len(df)
+
+    return lambda: _index_levels(scale), run
+
+
+STAGES = {
+    "excel_parse": stage_excel_parse,
+    "csv_load": stage_csv_load,
+    "csv_stream": stage_csv_stream,
+    "parse_mixed_date": stage_parse_mixed_date,
+    "normalize_columns": stage_normalize_columns,
+    "pct_change_corr": stage_pct_change_corr,
+    "rotation_backtest": stage_rotation_backtest,
+    "savefig": stage_savefig,
+}
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+def time_stage(name, scale, repeat=REPEAT):
+    setup, run = STAGES[name](scale)
+    inputs = setup()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run(inputs)
+        times.append(time.perf_counter() - start)
+
+    return {
+        "stage": name,
+        "scale": scale,
+        "rows": int(rows),
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "repeat": repeat,
+    }
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path=HISTORY_FILE):
+    if not path.exists():
+        return []
+    return json.loads(path.read_text())
+
+
+def last_result(history, stage, scale):
+    for run in reversed(history):
+        for res in run["results"]:
+            if res["stage"] == stage and res["scale"] == scale:
+                return res
+    return None
+
+
+def print_results(results, history):
+    print(f"\n{'stage':<20}{'scale':>6}{'rows':>12}{'min s':>10}{'median s':>10}{'vs last':>10}")
+    print("-" * 68)
+
+    for res in results:
+        prev = last_result(history, res["stage"], res["scale"])
+        change, flag = "", ""
+        if prev:
+            ratio = res["min_s"] / prev["min_s"]
+            change = f"{(ratio - 1) * 100:+.0f}%"
+            if ratio > REGRESSION:
+                flag = "  ⚠️ slower"
+
+        print(
+            f"{res['stage']:<20}{res['scale']:>6}{res['rows']:>12,}"
+            f"{res['min_s']:>10.3f}{res['median_s']:>10.3f}{change:>10}{flag}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each analysis stage on synthetic data")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    parser.add_argument("--no-save", action="store_true", help="Don't append to the history")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scales:
+        for name in args.stages:
+            print(f"⏱️  {name} x{scale} ...", flush=True)
+            results.append(time_stage(name, scale, args.repeat))
+
+    history = load_history(args.history)
+    print_results(results, history)
+
+    if not args.no_save:
+        history.append({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "results": results,
+        })
+        args.history.write_text(json.dumps(history, indent=2))
+        print(f"\n✅ Appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR.parent))
+
+from core.excel_cache import CACHE_DIR
+
+
+# -----------------------------
+# Sizes of the real inputs (scale 1)
+# -----------------------------
+INDEX_DAYS = 696        # data/annual/main.xlsx
+CSV_DAYS = 231          # nepse_sector_data.csv (16 sectors a day)
+BROKERS = 92            # Brokerwise Trading Amount sheet
+
+DATA_DIR = CACHE_DIR.parent / "bench"
+
+# Headers as they appear in main.xlsx
+INDEX_HEADERS = [
+    "Banking SubIndex", "Hotels And Tourism Index", "Others Index",
+    "HydroPower Index", "Development Bank Index", "Manufacturing And Processing",
+    "Microfinance Index", "Life Insurance", "Mutual Fund", "Investment Index",
+    "Non Life Insurance", "Finance Index", "Trading Index",
+]
+
+# Sector names as the sector API returns them
+CSV_SECTORS = [
+    "Commercial Banks", "Corporate Debenture", "Development Banks", "Finance",
+    "Hotels And Tourism", "Hydro Power", "Investment", "Life Insurance",
+    "Manufacturing And Processing", "Microfinance", "Mutual Fund",
+    "Non Life Insurance", "Others", "Promoter Share", "Tradings",
+    "Preference Share",
+]
+
+
+def trading_days(n, start="2000-01-02"):
+    """n Sunday-Thursday dates, like NEPSE's trading calendar."""
+    days = pd.bdate_range(start, periods=n * 2, freq="C", weekmask="Sun Mon Tue Wed Thu")
+    return days[:n]
+
+
+# -----------------------------
+# Generators
+# -----------------------------
+def sector_index_frame(scale=1, seed=0):
+    """main.xlsx layout: BUSINESS_DATE text column + sector index levels."""
+    rng = np.random.default_rng(seed)
+    n = INDEX_DAYS * scale
+
+    returns = rng.normal(0.0003, 0.012, size=(n, len(INDEX_HEADERS)))
+    levels = 1000 * np.exp(np.cumsum(returns, axis=0))
+
+    df = pd.DataFrame(levels.round(4), columns=INDEX_HEADERS)
+    df.insert(0, "BUSINESS_DATE", trading_days(n).strftime("%Y-%m-%d"))
+    return df
+
+
+def sector_csv_frame(scale=1, seed=0):
+    """nepse_sector_data.csv layout: one row per (day, sector)."""
+    rng = np.random.default_rng(seed)
+    days = trading_days(CSV_DAYS * scale).strftime("%Y-%m-%d")
+    k = len(CSV_SECTORS)
+
+    n = len(days) * k
+    volume = rng.integers(1_000, 5_000_000, n)
+
+    return pd.DataFrame({
+        "businessDate": np.repeat(days, k),
+        "sectorName": np.tile(CSV_SECTORS, len(days)),
+        "turnOverValues": (volume * rng.uniform(200, 2000, n)).round(2),
+        "turnOverVolume": volume,
+        "totalTransaction": rng.integers(50, 20_000, n),
+        "business_date": np.repeat(days, k),
+    })
+
+
+def broker_frame(scale=1, seed=0):
+    """
+    Brokerwise Trading Amount layout: 7 rows of letterhead, the header
+    on row 8 and member/buy/sell (plus repeated columns) below it.
+    """
+    rng = np.random.default_rng(seed)
+    n = BROKERS * scale
+
+    members = [f"Broker {i:05d} Securities Ltd." for i in range(n)]
+    buy = rng.uniform(1e9, 1e11, n).round(2)
+    sell = (buy * rng.uniform(0.7, 1.3, n)).round(2)
+
+    rows = [["."] + ["Nepal Stock Exchange Limited"] + [None] * 6]
+    rows += [[None] * 8 for _ in range(5)]
+    rows += [[None, "Brokerwise Trading Amount, Fiscal Year 2081/82"] + [None] * 6]
+    rows += [["MEMBER NAME", "Buy", "Sell", "MEMBER_NAME", "Buy", "MEMBER_NAME", "Buy", "Sell"]]
+    rows += [[m, b, s, m, b, m, b, s] for m, b, s in zip(members, buy, sell)]
+
+    return pd.DataFrame(rows)
+
+
+def mixed_dates(n, seed=0):
+    """Date column mixing Timestamps, AD/BS text, Excel serials and junk."""
+    from bench_dates import make_column
+    return make_column(n, seed=seed)
+
+
+# -----------------------------
+# Files on disk (generated once per scale)
+# -----------------------------
+def dataset(kind, scale=1, seed=0):
+    """
+    Path to a generated input file, written on first use under
+    .cache/bench. kind is "index" (xlsx), "csv" or "broker" (xlsx).
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    writers = {
+        "index": ("xlsx", lambda p: sector_index_frame(scale, seed).to_excel(p, index=False)),
+        "csv": ("csv", lambda p: sector_csv_frame(scale, seed).to_csv(p, index=False)),
+        "broker": ("xlsx", lambda p: broker_frame(scale, seed).to_excel(
+            p, sheet_name="Brokerwise Trading Amount", index=False, header=False
+        )),
+    }
+    if kind not in writers:
+        raise ValueError(f"Unknown dataset: {kind}")
+
+    ext, write = writers[kind]
+    path = DATA_DIR / f"{kind}_x{scale}_s{seed}.{ext}"
+
+    if not path.exists():
+        # Write under a temp name so an interrupted run leaves no half file
+        tmp = path.with_name(f"tmp_{path.name}")
+        write(tmp)
+        tmp.replace(path)
+
+    return path
@@ -0,0 +1,210 @@
+"""
+One entry point for every report:
+
+    python cli.py rotation
+    python cli.py momentum --years 2081 2080
+    python cli.py momentum --events 2024-07-15 2025-09-15 --per-page 1
+    python cli.py fm-impact --style base100 --workers 4
+    python cli.py panel --export panel.csv --start 2023-01-01
+    python cli.py serve --port 8765
+
+Several commands can run in one process, separated by "+". Datasets
+are then loaded once and shared, e.g.:
+
+    python cli.py rotation --no-charts + brokers --top 5 + overview
+"""
+import argparse
+import importlib
+import sys
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+# Handlers import their report module on first use, so "--help" or
+# "scrape" never pay for pandas/matplotlib they don't need.
+
+def cmd_overview(args, datasets):
+    overview = importlib.import_module("reports.overview")
+    return overview.run(datasets, top_n=args.top, out_dir=args.out_dir, charts=args.charts)
+
+
+def cmd_rotation(args, datasets):
+    rotation = importlib.import_module("reports.rotation")
+    return rotation.run(datasets, lookbacks=args.lookbacks, cost=args.cost, charts=args.charts)
+
+
+def cmd_momentum(args, datasets):
+    momentum = importlib.import_module("reports.momentum")
+    options = dict(per_page=args.per_page, workers=args.workers, charts=args.charts)
+    if args.events:
+        return momentum.run_events(datasets, args.events, before=args.before, after=args.after, **options)
+    return momentum.run(datasets, years=args.years, how=args.sectors, **options)
+
+
+def cmd_levels(args, datasets):
+    momentum = importlib.import_module("reports.momentum")
+    return momentum.run_levels(datasets, year=args.year)
+
+
+def cmd_brokers(args, datasets):
+    brokers = importlib.import_module("reports.brokers")
+    return brokers.run(datasets, top_n=args.top, period=args.period, side=args.side,
+                       out_dir=args.out_dir, charts=args.charts)
+
+
+def cmd_fm_impact(args, datasets):
+    fm_impact = importlib.import_module("reports.fm_impact")
+    panel = datasets.get("sector_panel") if args.panel else None
+    return fm_impact.run(style=args.style, files=args.files, workers=args.workers, panel=panel)
+
+
+def cmd_event_study(args, datasets):
+    event_study = importlib.import_module("reports.event_study")
+    return event_study.run(datasets, events=args.events, pre=args.pre, post=args.post,
+                           model=args.model, estimation=args.estimation,
+                           bootstrap=args.bootstrap, workers=args.workers, charts=args.charts,
+                           source=args.source,
+                           benchmark=None if args.benchmark == "equal" else args.benchmark)
+
+
+def cmd_panel(args, datasets):
+    panel = importlib.import_module("reports.panel")
+    return panel.run(datasets, start=args.start, end=args.end, export=args.export)
+
+
+def cmd_scrape(args, datasets):
+    scrap = importlib.import_module("scrap")
+    return scrap.get_sector_data(concurrency=args.concurrency, rate=args.rate)
+
+
+def cmd_serve(args, datasets):
+    server = importlib.import_module("reports.server")
+    return server.serve(datasets, host=args.host, port=args.port, socket_path=args.socket, interval=args.poll)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="NEPSE sector reports",
+        epilog='Chain commands with "+" to share loaded data in one process.',
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, summary, charts=True):
+        p = sub.add_parser(name, help=summary)
+        p.set_defaults(func=func)
+        if charts:
+            p.add_argument("--no-charts", dest="charts", action="store_false",
+                           help="print the report without rendering charts")
+        return p
+
+    p = add("overview", cmd_overview, "market cap, activity and top sectors by turnover")
+    p.add_argument("--top", type=int, default=5)
+    p.add_argument("--out-dir", default=".")
+
+    p = add("rotation", cmd_rotation, "sector rotation, correlation, drawdowns and lookback test")
+    p.add_argument("--lookbacks", type=int, nargs="+", default=[10, 20, 30, 60, 90, 120])
+    p.add_argument("--cost", type=float, default=0.002, help="transaction cost per switch")
+
+    p = add("momentum", cmd_momentum, "daily %% change of several years or event windows side by side")
+    p.add_argument("--years", type=int, nargs="+", default=None,
+                   help="years to compare (default: every data/nonelection file)")
+    p.add_argument("--sectors", choices=["inner", "outer"], default="inner",
+                   help="sectors every year has, or any year has")
+    p.add_argument("--events", nargs="+", default=None, metavar="DATE",
+                   help="compare windows of the sector index around these dates instead")
+    p.add_argument("--before", type=int, default=20, help="trading days before each event")
+    p.add_argument("--after", type=int, default=60, help="trading days after each event")
+    p.add_argument("--per-page", type=int, default=6, help="sectors per chart (1 = one file each)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="parallel processes (default: all cores, 1 = serial)")
+
+    p = add("levels", cmd_levels, "one year's sector levels", charts=False)
+    p.add_argument("--year", type=int, default=2080)
+
+    p = add("brokers", cmd_brokers, "top brokers by net buy/sell percentage, concentration and flow changes")
+    p.add_argument("--top", type=int, default=10)
+    p.add_argument("--period", default=None, help="fiscal year, e.g. 2081/82 (default: latest)")
+    p.add_argument("--side", choices=["abs", "buy", "sell"], default="abs",
+                   help="rank by net % magnitude, biggest net buyers or biggest net sellers")
+    p.add_argument("--out-dir", default=".")
+
+    p = add("fm-impact", cmd_fm_impact, "Finance Minister event charts", charts=False)
+    p.add_argument("--style", choices=["sectors", "base100"], default="sectors")
+    p.add_argument("--files", nargs="+", default=None, help="event workbooks (default: all)")
+    p.add_argument("--panel", action="store_true",
+                   help="chart each file's dates from the merged sector panel (every source)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="parallel processes (default: all cores, 1 = serial)")
+
+    p = add("event-study", cmd_event_study, "abnormal sector returns around events with bootstrap CIs")
+    p.add_argument("--events", default="fm",
+                   help='"fm" (Finance Minister changes) or a CSV/Excel file with a Date column')
+    p.add_argument("--pre", type=int, default=10, help="trading days before each event")
+    p.add_argument("--post", type=int, default=30, help="trading days after each event")
+    p.add_argument("--model", choices=["adjusted", "market"], default="adjusted",
+                   help="sector minus benchmark, or minus a market-model fit")
+    p.add_argument("--estimation", type=int, default=120,
+                   help="trading days before the window used to fit the market model")
+    p.add_argument("--bootstrap", type=int, default=2000, help="resamples (0 = none)")
+    p.add_argument("--source", choices=["sector_index", "sector_panel"], default="sector_index",
+                   help="main.xlsx only, or the panel merged from every workbook")
+    p.add_argument("--benchmark", default="NEPSE",
+                   help='benchmark column, or "equal" for the equal-weighted sectors')
+    p.add_argument("--workers", type=int, default=None,
+                   help="parallel processes (default: all cores, 1 = serial)")
+
+    p = add("panel", cmd_panel, "merge every sector workbook into one panel and report its sources",
+            charts=False)
+    p.add_argument("--start", default=None, help="first date of --export")
+    p.add_argument("--end", default=None, help="last date of --export")
+    p.add_argument("--export", default=None, help="write the panel slice to this CSV")
+
+    p = add("scrape", cmd_scrape, "fetch missing sector-wise data from NEPSE", charts=False)
+    p.add_argument("--concurrency", type=int, default=4,
+                   help="parallel requests (1 = one date at a time)")
+    p.add_argument("--rate", type=float, default=2.0,
+                   help="max requests per second across all workers")
+
+    p = add("serve", cmd_serve, "keep data in memory and answer report queries over HTTP", charts=False)
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--socket", default=None, help="listen on this Unix socket instead of TCP")
+    p.add_argument("--poll", type=float, default=2.0,
+                   help="seconds between checks for changed source files")
+
+    return parser
+
+
+def split_commands(argv):
+    """["a", "-x", "+", "b"] -> [["a", "-x"], ["b"]]"""
+    commands = [[]]
+    for arg in argv:
+        if arg == "+":
+            commands.append([])
+        else:
+            commands[-1].append(arg)
+    return [cmd for cmd in commands if cmd]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    parser = build_parser()
+    commands = [parser.parse_args(cmd) for cmd in split_commands(argv) or [[]]]
+
+    from core.trace import enable
+    from reports.datasets import Datasets
+
+    enable("cli_" + "_".join(args.command for args in commands))
+
+    # One cache for every command in this process
+    datasets = Datasets()
+
+    for args in commands:
+        args.func(args, datasets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import io
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from core import trace
+
+
+class Skipped(Exception):
+    """Raised by a batch function when an item has nothing to do."""
+
+
+def _init_worker(initializer=None, initargs=()):
+    # Workers only ever write files, never open windows
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _call(func, item):
+    log = io.StringIO()
+    since = trace.mark()
+    try:
+        with redirect_stdout(log):
+            result = func(item)
+        res = {"item": item, "status": "ok", "result": result, "log": log.getvalue()}
+    except Skipped as e:
+        res = {"item": item, "status": "skipped", "result": None, "error": str(e), "log": log.getvalue()}
+    except Exception as e:
+        res = {
+            "item": item,
+            "status": "error",
+            "result": None,
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc(),
+            "log": log.getvalue(),
+        }
+    res["trace"] = trace.take_records(since)
+    return res
+
+
+def run_batch(func, items, workers=None, initializer=None, initargs=()):
+    """
+    Run func(item) for every item on a process pool (Agg backend).
+
+    func must be a module-level function so it can be pickled. Anything
+    it prints is captured per item, and errors are caught instead of
+    stopping the batch. Results come back in input order as dicts with
+    item, status ("ok"/"error"/"skipped" when func raised Skipped),
+    result, error and log, so output is the same whatever order the
+    workers finish in. Stages recorded with core.trace inside func are
+    merged into this process's trace. workers=1 runs everything in this
+    process.
+
+    initializer(*initargs) runs once per worker before any item, e.g. to
+    hand every worker one large object instead of pickling it per item.
+    """
+    items = list(items)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(items)))
+
+    if workers == 1:
+        _init_worker(initializer, initargs)
+        results = [_call(func, item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(initializer, initargs)) as pool:
+            futures = [pool.submit(_call, func, item) for item in items]
+            results = [future.result() for future in futures]
+
+    # Stage timings recorded inside func join this process's trace
+    for res in results:
+        trace.merge_records(res["trace"])
+
+    return results
+
+
+def print_batch_logs(results):
+    for res in results:
+        if res["log"]:
+            print(res["log"], end="")
+
+
+def print_batch_summary(results):
+    failed = [res for res in results if res["status"] == "error"]
+    skipped = [res for res in results if res["status"] == "skipped"]
+
+    ok = len(results) - len(failed) - len(skipped)
+    print(f"\n{ok}/{len(results)} succeeded" + (f", {len(skipped)} skipped" if skipped else ""))
+    for res in skipped:
+        print(f"⏭️  Skipped {res['item']}: {res['error']}")
+    for res in failed:
+        print(f"\n❌ Error processing {res['item']}:")
+        print(f"   {res['error']}")
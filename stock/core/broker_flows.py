@@ -0,0 +1,261 @@
+import json
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.excel_cache import CACHE_DIR, read_excel_cached
+from core.ranking import top_n_indices, top_n_per_row
+
+
+# -----------------------------
+# Sheet detection
+# -----------------------------
+# Only this many leading rows are read to find a sheet's header
+HEADER_SCAN_ROWS = 30
+
+MEMBER_RE = re.compile(r"member|broker", re.IGNORECASE)
+PERIOD_RE = re.compile(r"fiscal\s+year\s*(\d{4}\s*/\s*\d{2,4})", re.IGNORECASE)
+
+
+def _cell(value):
+    return str(value).strip().lower() if value is not None else ""
+
+
+def find_header(rows):
+    """
+    (header row, member column, buy column, sell column) of the first
+    row that names a member/broker column followed by Buy and Sell
+    columns, or None when the rows hold no broker table.
+    """
+    for r, row in enumerate(rows):
+        cells = [_cell(value) for value in row]
+        for m, cell in enumerate(cells):
+            if not MEMBER_RE.search(cell):
+                continue
+            rest = cells[m + 1:]
+            if "buy" in rest and "sell" in rest:
+                return r, m, m + 1 + rest.index("buy"), m + 1 + rest.index("sell")
+    return None
+
+
+def find_period(rows, default):
+    """The "Fiscal Year 2081/82" of a sheet's title rows, or default."""
+    for row in rows:
+        for value in row:
+            match = PERIOD_RE.search(str(value)) if isinstance(value, str) else None
+            if match:
+                return re.sub(r"\s+", "", match.group(1))
+    return default
+
+
+def scan_workbook(path):
+    """
+    (sheet, header, member, buy, sell, period) of every broker table in
+    a workbook. Only the first HEADER_SCAN_ROWS rows of each sheet are
+    read (openpyxl read-only), so sheets without one cost almost nothing.
+    """
+    from openpyxl import load_workbook
+
+    tables = []
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            rows = list(ws.iter_rows(max_row=HEADER_SCAN_ROWS, values_only=True))
+            head = find_header(rows)
+            if head is None:
+                continue
+            header, member, buy, sell = head
+            period = find_period(rows[:header], default=f"{Path(path).stem}:{ws.title}")
+            tables.append((ws.title, header, member, buy, sell, period))
+    finally:
+        wb.close()
+    return tables
+
+
+def scan_workbook_cached(path, cache_dir=None):
+    """scan_workbook() kept next to the Excel cache until the file changes."""
+    path = Path(path).resolve()
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+
+    stat = path.stat()
+    entry = cache_dir / f"{path.stem}-scan-{stat.st_mtime_ns}-{stat.st_size}.json"
+    if entry.exists():
+        return [tuple(table) for table in json.loads(entry.read_text())]
+
+    tables = scan_workbook(path)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for old in cache_dir.glob(f"{path.stem}-scan-*.json"):
+        old.unlink()
+    tmp = entry.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(tables))
+    os.replace(tmp, entry)
+    return tables
+
+
+def normalize_broker(name):
+    """Broker names compared across sheets: trimmed, single spaces."""
+    return " ".join(str(name).split())
+
+
+def read_workbook(path):
+    """
+    Every broker table of one workbook as long rows (period, broker,
+    buy, sell, source, sheet). Module-level so run_batch() can send it
+    to a worker.
+    """
+    frames = []
+    for sheet, header, member, buy, sell, period in scan_workbook_cached(path):
+        df = read_excel_cached(path, sheet_name=sheet, header=header, usecols=[member, buy, sell])
+        # usecols comes back in file order, whatever order Buy and Sell are in
+        df.columns = [name for _, name in sorted([(member, "broker"), (buy, "buy"), (sell, "sell")])]
+        df = df[["broker", "buy", "sell"]]
+        df = df.dropna(subset=["broker"])
+
+        df["broker"] = df["broker"].map(normalize_broker)
+        df["buy"] = pd.to_numeric(df["buy"], errors="coerce")
+        df["sell"] = pd.to_numeric(df["sell"], errors="coerce")
+        df = df.dropna(subset=["buy", "sell"], how="all")
+        # Grand-total rows aren't brokers
+        df = df[~df["broker"].str.fullmatch(r"(grand\s+)?total", case=False)]
+
+        df.insert(0, "period", period)
+        df["source"] = Path(path).name
+        df["sheet"] = sheet
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=["period", "broker", "buy", "sell", "source", "sheet"])
+    return pd.concat(frames, ignore_index=True)
+
+
+# -----------------------------
+# Matrix
+# -----------------------------
+class BrokerFlows:
+    """
+    Buy and sell amounts as (period x broker) float64 arrays, with
+    brokers as categorical codes. Every query is a whole-array
+    operation; a broker without a row in a period has 0 buy and sell.
+    """
+
+    def __init__(self, periods, brokers, buy, sell):
+        self.periods = pd.Index(periods, name="period")
+        self.brokers = pd.CategoricalIndex(brokers, name="broker")
+        self.buy = np.ascontiguousarray(buy, dtype=np.float64)
+        self.sell = np.ascontiguousarray(sell, dtype=np.float64)
+        self._code = {broker: i for i, broker in enumerate(self.brokers.categories)}
+
+    @classmethod
+    def from_long(cls, df):
+        """
+        Long (period, broker, buy, sell) rows. When the same period and
+        broker appear in several sheets, the last row read wins.
+        """
+        df = df.drop_duplicates(["period", "broker"], keep="last")
+
+        period_codes, periods = pd.factorize(df["period"], sort=True)
+        broker_codes, brokers = pd.factorize(df["broker"], sort=True)
+
+        shape = (len(periods), len(brokers))
+        buy = np.zeros(shape)
+        sell = np.zeros(shape)
+        buy[period_codes, broker_codes] = df["buy"].fillna(0).to_numpy(dtype=np.float64)
+        sell[period_codes, broker_codes] = df["sell"].fillna(0).to_numpy(dtype=np.float64)
+
+        return cls(periods, pd.Categorical(brokers, categories=brokers), buy, sell)
+
+    @property
+    def shape(self):
+        return self.buy.shape
+
+    def __len__(self):
+        return len(self.periods)
+
+    def _row(self, period):
+        """Row number of a period; None is the latest one."""
+        return len(self.periods) - 1 if period is None else self.periods.get_loc(period)
+
+    # -----------------------------
+    # Fields
+    # -----------------------------
+    def field(self, name):
+        """(period x broker) array of buy, sell, total, net or net_pct."""
+        if name == "buy":
+            return self.buy
+        if name == "sell":
+            return self.sell
+        if name == "total":
+            return self.buy + self.sell
+        if name == "net":
+            return self.buy - self.sell
+        if name == "net_pct":
+            total = self.buy + self.sell
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(total > 0, (self.buy - self.sell) / total * 100, np.nan)
+        raise ValueError(f"Unknown field: {name}")
+
+    def frame(self, name):
+        return pd.DataFrame(self.field(name), index=self.periods, columns=self.brokers.categories)
+
+    def period(self, period=None):
+        """
+        One period as the member / buy / sell / total / net_pct table of
+        the brokers that traded in it.
+        """
+        i = self._row(period)
+        df = pd.DataFrame({
+            "member": self.brokers.categories,
+            "buy": self.buy[i],
+            "sell": self.sell[i],
+        })
+        df["total"] = df["buy"] + df["sell"]
+        df = df[df["total"] > 0].reset_index(drop=True)
+        df["net_pct"] = (df["buy"] - df["sell"]) / df["total"] * 100
+        return df
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def top(self, n=10, period=None, by="net_pct", side="abs"):
+        """
+        The n brokers of a period ranked by a field: side="buy" largest
+        first, "sell" smallest (most negative) first, "abs" by magnitude.
+        """
+        if side not in ("buy", "sell", "abs"):
+            raise ValueError(f"side must be buy, sell or abs, not {side}")
+
+        df = self.period(period)
+        order = top_n_indices(df[by].to_numpy(), n, largest=side != "sell", absolute=side == "abs")
+        return df.iloc[order].reset_index(drop=True)
+
+    def top_per_period(self, n=10, name="net", side="buy"):
+        """(period x rank) frame of each period's n best brokers by a field."""
+        positions = top_n_per_row(self.field(name), n, largest=side == "buy")
+        names = np.asarray(self.brokers.categories)[positions]
+        return pd.DataFrame(names, index=self.periods, columns=range(1, positions.shape[1] + 1))
+
+    def hhi(self, name="total"):
+        """Herfindahl index of each period's broker shares of a field."""
+        v = self.field(name)
+        total = v.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = v / total[:, None]
+        return pd.Series((np.nan_to_num(shares) ** 2).sum(axis=1), index=self.periods, name=f"hhi_{name}")
+
+    def changes(self, name="net", periods=1):
+        """Period-over-period change of a field per broker (first rows NaN)."""
+        v = self.field(name)
+        out = np.full(v.shape, np.nan)
+        if periods < len(v):
+            out[periods:] = v[periods:] - v[:-periods]
+        return pd.DataFrame(out, index=self.periods, columns=self.brokers.categories)
+
+    def top_changes(self, n=10, name="net", period=None):
+        """The n largest absolute changes of a field into a period."""
+        i = self._row(period)
+        change = self.changes(name).iloc[i].dropna()
+        return change.iloc[top_n_indices(change.to_numpy(), n, absolute=True)]
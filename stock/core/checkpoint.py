@@ -0,0 +1,125 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+
+class ScrapeManifest:
+    """
+    Append-only journal of what the scraper has done, kept next to the
+    data file as <data file>.manifest.jsonl.
+
+    Each line records one business date as "ok", "holiday" or "failed",
+    plus the data file size after that date's rows were appended. On
+    open the journal is replayed (a few KB, not the whole CSV). A data
+    file longer than the last recorded size means an append was cut off,
+    so the partial tail is truncated and that date gets fetched again.
+    """
+
+    def __init__(self, data_path):
+        self.data_path = Path(data_path)
+        self.path = self.data_path.with_name(self.data_path.name + ".manifest.jsonl")
+
+        self.fetched = set()
+        self.holidays = set()
+        self.failed = {}
+        self.data_bytes = None
+
+    # -----------------------------
+    # Loading
+    # -----------------------------
+    @classmethod
+    def open(cls, data_path, date_column="business_date"):
+        manifest = cls(data_path)
+
+        if manifest.path.exists():
+            manifest._replay()
+            manifest._repair_data_file()
+        elif manifest.data_path.exists():
+            manifest._bootstrap(date_column)
+
+        return manifest
+
+    def _apply(self, entry):
+        day, status = entry["date"], entry["status"]
+
+        self.fetched.discard(day)
+        self.holidays.discard(day)
+        self.failed.pop(day, None)
+
+        if status == "ok":
+            self.fetched.add(day)
+        elif status == "holiday":
+            self.holidays.add(day)
+        else:
+            self.failed[day] = entry.get("error", "")
+
+        if "bytes" in entry:
+            self.data_bytes = entry["bytes"]
+
+    def _replay(self):
+        with open(self.path, "r") as file:
+            for line in file:
+                try:
+                    self._apply(json.loads(line))
+                except (ValueError, KeyError):
+                    # Half-written last line from a crash
+                    continue
+
+    def _repair_data_file(self):
+        if self.data_bytes is None or not self.data_path.exists():
+            return
+
+        size = self.data_path.stat().st_size
+        if size > self.data_bytes:
+            with open(self.data_path, "r+b") as file:
+                file.truncate(self.data_bytes)
+            print(f"⚠️ Dropped {size - self.data_bytes} bytes of unfinished append")
+
+    def _bootstrap(self, date_column):
+        """
+        One-off scan of an existing data file that has no journal yet.
+        """
+        dates = pd.read_csv(self.data_path, usecols=[date_column])[date_column]
+        dates = pd.to_datetime(dates, errors="coerce").dropna().dt.strftime("%Y-%m-%d")
+
+        self.data_bytes = self.data_path.stat().st_size
+        for day in sorted(set(dates)):
+            self._record(day, "ok", bytes=self.data_bytes)
+
+    # -----------------------------
+    # Recording
+    # -----------------------------
+    def _record(self, day, status, **extra):
+        entry = {"date": day, "status": status, **extra}
+        self._apply(entry)
+
+        with open(self.path, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def mark_fetched(self, day):
+        """Call after the day's rows were appended to the data file."""
+        self._record(day, "ok", bytes=self.data_path.stat().st_size)
+
+    def mark_holiday(self, day):
+        # Today's empty answer may just mean "not published yet"
+        if day < date.today().isoformat():
+            self._record(day, "holiday")
+
+    def mark_failed(self, day, error):
+        self._record(day, "failed", error=str(error))
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def pending(self, days):
+        """Dates in days not fetched yet and not known holidays."""
+        done = self.fetched | self.holidays
+        return [day for day in days if day not in done]
+
+    def last_fetched(self):
+        return max(self.fetched) if self.fetched else None
@@ -0,0 +1,187 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+# =============================
+# BATCH (whole history at once)
+# =============================
+
+# float64 cells of the (rows x sector x sector) work arrays per block
+BLOCK_CELLS = 1 << 18
+
+
+def _corr_from_sums(sum_x, sum_xx, count, min_periods):
+    """Correlation matrices from window sums, NaN below min_periods rows."""
+    cov = sum_xx - sum_x[:, :, None] * sum_x[:, None, :] / count[:, None, None]
+
+    var = np.clip(np.diagonal(cov, axis1=1, axis2=2), 0, None)
+    scale = np.sqrt(var[:, :, None] * var[:, None, :])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.clip(cov / scale, -1, 1)
+
+    corr[count < max(min_periods, 2)] = np.nan
+    return corr
+
+
+def rolling_corr(returns, window=None, min_periods=2, dtype=np.float32, block=None):
+    """
+    (time x sector x sector) correlation matrices of a returns array.
+
+    window=None gives expanding correlations. Each window is a
+    difference of two prefix sums, so the cost is O(time x sectors^2) no
+    matter the window length. Rows are processed in blocks of `block`
+    rows (default: BLOCK_CELLS / sectors^2) written straight into a
+    preallocated `dtype` output, so peak memory is the output plus one
+    block of float64 work arrays. Rolling prefix sums restart in every
+    block (covering the block plus one window), so they never span the
+    whole history; data is also centred on its overall mean first.
+    Rows with fewer than min_periods observations are NaN. Rows must be
+    free of NaNs (use returns.dropna()).
+    """
+    x = np.asarray(returns, dtype=np.float64)
+    x = x - x.mean(axis=0) if len(x) else x
+
+    n_rows, n_cols = x.shape
+    out = np.empty((n_rows, n_cols, n_cols), dtype=dtype)
+    if block is None:
+        block = max(1, BLOCK_CELLS // max(n_cols * n_cols, 1))
+
+    # Expanding windows carry the totals of the rows before the block
+    carry_x = np.zeros(n_cols)
+    carry_xx = np.zeros((n_cols, n_cols))
+
+    for b0 in range(0, n_rows, block):
+        b1 = min(b0 + block, n_rows)
+        end = np.arange(b0 + 1, b1 + 1)
+
+        if window is None:
+            xb = x[b0:b1]
+            sum_x = carry_x + np.cumsum(xb, axis=0)
+            sum_xx = carry_xx + np.cumsum(xb[:, :, None] * xb[:, None, :], axis=0)
+            carry_x, carry_xx = sum_x[-1], sum_xx[-1]
+            count = end.astype(np.float64)
+        else:
+            # Prefix sums anchored at the first row any window of the block needs
+            lo = max(b0 + 1 - window, 0)
+            xb = x[lo:b1]
+
+            s = np.zeros((len(xb) + 1, n_cols))
+            np.cumsum(xb, axis=0, out=s[1:])
+            ss = np.zeros((len(xb) + 1, n_cols, n_cols))
+            np.cumsum(xb[:, :, None] * xb[:, None, :], axis=0, out=ss[1:])
+
+            start = np.maximum(end - window, 0)
+            sum_x = s[end - lo] - s[start - lo]
+            sum_xx = ss[end - lo] - ss[start - lo]
+            count = (end - start).astype(np.float64)
+
+        out[b0:b1] = _corr_from_sums(sum_x, sum_xx, count, min_periods)
+
+    return out
+
+
+def window_corr(returns, window=None, min_periods=2, dtype=np.float32):
+    """
+    Correlation matrix of the last `window` rows only (all rows for
+    None): the final matrix of rolling_corr() without computing the
+    others.
+    """
+    x = np.asarray(returns, dtype=np.float64)
+    if window is not None:
+        x = x[-window:]
+    x = x - x.mean(axis=0) if len(x) else x
+
+    count = np.array([len(x)], dtype=np.float64)
+    corr = _corr_from_sums(x.sum(axis=0)[None], (x.T @ x)[None], count, min_periods)
+    return corr[0].astype(dtype, copy=False)
+
+
+def corr_frame(corr, columns, index=None):
+    """
+    Long DataFrame (date, sector) x sector of a 3-D correlation array,
+    or a plain sector x sector frame for a single 2-D matrix.
+    """
+    columns = pd.Index(columns)
+    if corr.ndim == 2:
+        return pd.DataFrame(corr, index=columns, columns=columns)
+
+    index = pd.RangeIndex(len(corr)) if index is None else pd.Index(index)
+    rows = pd.MultiIndex.from_product([index, columns])
+    return pd.DataFrame(corr.reshape(-1, len(columns)), index=rows, columns=columns)
+
+
+def average_pairwise(corr):
+    """
+    Mean off-diagonal correlation per matrix (a market "herding" gauge).
+    """
+    n = corr.shape[-1]
+    mask = ~np.eye(n, dtype=bool)
+    return corr[..., mask].mean(axis=-1)
+
+
+# =============================
+# STREAMING (one day at a time)
+# =============================
+
+class RollingCorrelation:
+    """
+    Running sums of returns and their cross products, updated in
+    O(sectors^2) per new day.
+
+    window=None is expanding. With a window, the oldest row is
+    subtracted when a new one pushes it out, so the last `window` rows
+    are the only history kept in memory.
+    """
+
+    def __init__(self, n_sectors, window=None, shift=None, dtype=np.float32):
+        self.window = window
+        self.dtype = dtype
+
+        # Subtracting a fixed shift (e.g. a long-run mean) keeps sums small
+        self.shift = np.zeros(n_sectors) if shift is None else np.asarray(shift, dtype=np.float64)
+
+        self.count = 0
+        self.sum_x = np.zeros(n_sectors)
+        self.sum_xx = np.zeros((n_sectors, n_sectors))
+        self.rows = deque()
+
+    def _add(self, x, sign):
+        self.count += sign
+        self.sum_x += sign * x
+        self.sum_xx += sign * np.outer(x, x)
+
+    def update(self, row):
+        """Add one day of returns, return the current correlation matrix."""
+        x = np.asarray(row, dtype=np.float64) - self.shift
+        self._add(x, 1)
+
+        if self.window is not None:
+            self.rows.append(x)
+            if len(self.rows) > self.window:
+                self._add(self.rows.popleft(), -1)
+
+        return self.corr()
+
+    def extend(self, rows):
+        """Add several days, return their (days x sector x sector) array."""
+        rows = np.asarray(rows, dtype=np.float64)
+        out = np.empty((len(rows), len(self.sum_x), len(self.sum_x)), dtype=self.dtype)
+        for i, row in enumerate(rows):
+            out[i] = self.update(row)
+        return out
+
+    def corr(self):
+        n = len(self.sum_x)
+        if self.count < 2:
+            return np.full((n, n), np.nan, dtype=self.dtype)
+
+        cov = self.sum_xx - np.outer(self.sum_x, self.sum_x) / self.count
+        var = np.clip(np.diag(cov), 0, None)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.clip(cov / np.sqrt(np.outer(var, var)), -1, 1)
+
+        return corr.astype(self.dtype, copy=False)
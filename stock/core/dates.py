@@ -0,0 +1,249 @@
+import re
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import nepali_datetime
+
+
+# -----------------------------
+# Limits (same as the old per-row parser)
+# -----------------------------
+BS_MIN_YEAR = 2070
+BS_MAX_YEAR = 2090
+
+AD_MIN_YEAR = 1990
+AD_MAX_YEAR = 2035
+
+EXCEL_SERIAL_MIN = 40000
+EXCEL_ORIGIN = "1899-12-30"
+
+BS_PATTERN = r"^(20\d{2})[/-](\d{1,2})[/-](\d{1,2})$"
+BS_REGEX = re.compile(BS_PATTERN)
+
+
+# -----------------------------
+# BS lookup table
+# -----------------------------
+@lru_cache(maxsize=1)
+def bs_lookup_table():
+    """
+    Precompute BS month starts for BS_MIN_YEAR..BS_MAX_YEAR.
+
+    Returns (month_start, month_length), both int64 arrays of shape
+    (years, 12). month_start holds the AD date of day 1 of each BS month
+    as days since 1970-01-01.
+    """
+    years = range(BS_MIN_YEAR, BS_MAX_YEAR + 2)
+    starts = np.array([
+        [nepali_datetime.date(y, m, 1).to_datetime_date().toordinal()
+         for m in range(1, 13)]
+        for y in years
+    ], dtype=np.int64)
+
+    # Month length = gap to the next month's first day
+    flat = starts.ravel()
+    lengths = np.diff(flat)[: (len(years) - 1) * 12].reshape(-1, 12)
+
+    epoch = pd.Timestamp("1970-01-01").toordinal()
+    return starts[:-1] - epoch, lengths
+
+
+def bs_to_ad(years, months, days):
+    """
+    Convert BS (year, month, day) arrays to datetime64[ns].
+
+    Any component outside the table or the month length gives NaT.
+    """
+    month_start, month_length = bs_lookup_table()
+
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+
+    yi = years - BS_MIN_YEAR
+    mi = months - 1
+
+    valid = (
+        (yi >= 0) & (yi < month_start.shape[0])
+        & (mi >= 0) & (mi < 12)
+        & (days >= 1)
+    )
+
+    yi = np.where(valid, yi, 0)
+    mi = np.where(valid, mi, 0)
+
+    valid &= days <= month_length[yi, mi]
+
+    epoch_days = month_start[yi, mi] + days - 1
+
+    out = epoch_days.astype("datetime64[D]").astype("datetime64[ns]")
+    out[~valid] = np.datetime64("NaT")
+    return out
+
+
+# -----------------------------
+# Scalar parser
+# -----------------------------
+@lru_cache(maxsize=65536)
+def _parse_cached(value, excel_serial):
+    # --- Excel serial numbers ---
+    if excel_serial and isinstance(value, (int, float)):
+        # Excel serials representing BS dates should NOT be treated as AD
+        if value < EXCEL_SERIAL_MIN:
+            return pd.NaT
+        try:
+            dt = pd.to_datetime(value, origin=EXCEL_ORIGIN, unit="D")
+            if dt.year < AD_MIN_YEAR:
+                return pd.NaT
+            return dt
+        except Exception:
+            return pd.NaT
+
+    value = str(value).strip()
+
+    # --- BS string dates (2078/01/05, 2078-1-5) ---
+    bs_match = BS_REGEX.match(value)
+    if bs_match:
+        y, m, d = map(int, bs_match.groups())
+        if BS_MIN_YEAR <= y <= BS_MAX_YEAR:
+            return pd.Timestamp(bs_to_ad([y], [m], [d])[0])
+
+    # --- AD parsing ---
+    try:
+        dt = pd.to_datetime(value, errors="coerce")
+        if pd.isna(dt):
+            return pd.NaT
+        if dt.year < AD_MIN_YEAR or dt.year > AD_MAX_YEAR:
+            return pd.NaT
+        return dt
+    except Exception:
+        return pd.NaT
+
+
+def parse_mixed_date(value, excel_serial=True):
+    """
+    Parse one cell that may be an Excel serial, a BS string or an AD date.
+
+    Set excel_serial=False to treat numbers as text, like the older
+    nepse.py parser did.
+    """
+    if pd.isna(value):
+        return pd.NaT
+
+    try:
+        return _parse_cached(value, excel_serial)
+    except TypeError:
+        # Unhashable cell, skip the cache
+        return _parse_cached.__wrapped__(value, excel_serial)
+
+
+# -----------------------------
+# Vectorized parser
+# -----------------------------
+def _clip_ad(values, upper=True):
+    values = pd.to_datetime(values, errors="coerce")
+    years = values.year
+    bad = years < AD_MIN_YEAR
+    if upper:
+        bad |= years > AD_MAX_YEAR
+    return values.where(~np.asarray(bad, dtype=bool))
+
+
+def _parse_excel_serials(values):
+    values = np.asarray(values, dtype=np.float64)
+    out = pd.to_datetime(
+        np.where(values >= EXCEL_SERIAL_MIN, values, np.nan),
+        origin=EXCEL_ORIGIN,
+        unit="D",
+        errors="coerce",
+    )
+    return _clip_ad(out, upper=False)
+
+
+def _parse_strings(values):
+    text = pd.Series(values, dtype=object).astype(str).str.strip()
+    out = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+
+    parts = text.str.extract(BS_PATTERN)
+    is_bs_form = parts[0].notna().to_numpy()
+
+    years = pd.to_numeric(parts[0], errors="coerce").to_numpy()
+    in_range = is_bs_form & (years >= BS_MIN_YEAR) & (years <= BS_MAX_YEAR)
+
+    if in_range.any():
+        bs = parts[in_range].astype(np.int64)
+        out[in_range] = bs_to_ad(bs[0], bs[1], bs[2])
+
+    rest = ~in_range
+    if rest.any():
+        ad = pd.to_datetime(text[rest], format="mixed", errors="coerce")
+        out[rest] = _clip_ad(pd.DatetimeIndex(ad)).to_numpy(dtype="datetime64[ns]")
+
+    return out.to_numpy()
+
+
+def parse_date_series(series, excel_serial=True):
+    """
+    Vectorized version of parse_mixed_date for a whole column.
+
+    Each distinct value is classified once (Excel serial, BS string or
+    AD date) and each class is converted in bulk, so repeated dates cost
+    nothing extra.
+    """
+    series = pd.Series(series)
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.Series(
+            _clip_ad(pd.DatetimeIndex(series)).to_numpy(dtype="datetime64[ns]"),
+            index=series.index,
+            name=series.name,
+        )
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+
+    parsed = np.full(len(uniques), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    is_num = np.fromiter(
+        (isinstance(v, (int, float, np.number)) for v in uniques),
+        dtype=bool,
+        count=len(uniques),
+    )
+    is_dt = np.fromiter(
+        (isinstance(v, (date, np.datetime64)) for v in uniques),
+        dtype=bool,
+        count=len(uniques),
+    ) & ~is_num
+
+    if excel_serial and is_num.any():
+        parsed[is_num] = _parse_excel_serials(uniques[is_num].astype(np.float64))
+        text = ~is_num & ~is_dt
+    else:
+        text = ~is_dt
+
+    if is_dt.any():
+        parsed[is_dt] = _clip_ad(
+            pd.DatetimeIndex(list(uniques[is_dt]))
+        ).to_numpy(dtype="datetime64[ns]")
+
+    if text.any():
+        parsed[text] = _parse_strings(uniques[text])
+
+    result = np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[ns]")
+    present = codes >= 0
+    result[present] = parsed[codes[present]]
+
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def normalize_date_column(df, column="Date", excel_serial=True):
+    """
+    Replace df[column] with parsed timestamps (in place, returns df).
+    """
+    if column not in df.columns:
+        return df
+
+    df[column] = parse_date_series(df[column], excel_serial=excel_serial)
+    return df
@@ -0,0 +1,161 @@
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------
+# Point budget
+# -----------------------------
+def pixel_width(ax, dpi=None):
+    """
+    Width of an axes in output pixels. dpi defaults to the dpi the
+    figure will be saved at (render() sets savefig.dpi while drawing).
+    """
+    fig = ax.figure
+    if dpi is None:
+        dpi = mpl.rcParams["savefig.dpi"]
+        if dpi == "figure":
+            dpi = fig.dpi
+
+    width_inches = ax.get_position().width * fig.get_figwidth()
+    return max(int(width_inches * dpi), 3)
+
+
+def _as_float(x):
+    """Numeric x positions (datetimes as ns) for the triangle areas."""
+    arr = np.asarray(x)
+    if arr.dtype.kind == "O":
+        arr = pd.to_datetime(arr).to_numpy()
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ns]").view(np.int64).astype(np.float64)
+    return arr.astype(np.float64)
+
+
+# -----------------------------
+# Selectors (return positions to keep)
+# -----------------------------
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last point and,
+    from each of n_out - 2 equal buckets, the point forming the largest
+    triangle with the previously kept point and the next bucket's mean.
+    Peaks and troughs survive, flat stretches collapse.
+    """
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    # Mean of every bucket up front; the last "next bucket" is the end point
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+    mean_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+    mean_x = np.append(mean_x, x[-1])
+    mean_y = np.append(mean_y, y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = starts[b], ends[b]
+        area = np.abs(
+            (x[prev] - mean_x[b + 1]) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (mean_y[b + 1] - y[prev])
+        )
+        prev = lo + int(np.argmax(area))
+        keep[b + 1] = prev
+
+    return keep
+
+
+def minmax_indices(y, n_buckets):
+    """
+    Min and max of every bucket (about one bucket per pixel column),
+    in original order. Exact vertical extent at up to 2 points/bucket.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(edges, n)))
+
+    # Sort by (bucket, value) once; first/last of each bucket are min/max
+    order = np.lexsort((y, bucket))
+    lo = order[edges]
+    hi = order[np.append(edges[1:], n) - 1]
+
+    return np.unique(np.concatenate([lo, hi]))
+
+
+# -----------------------------
+# Plotting
+# -----------------------------
+def _finite_runs(y):
+    """(starts, ends) of the runs of finite values in y."""
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], np.isfinite(y).astype(np.int8), [0]])))
+    return edges[::2], edges[1::2]
+
+
+def downsample(x, y, budget, method="lttb"):
+    """
+    (x, y) reduced to about `budget` points when longer. Shorter series
+    come back unchanged.
+
+    Each run of finite values is reduced on its own, with a share of the
+    budget matching its length, and runs are joined by one NaN, so gaps
+    stay gaps at any length or width (leading and trailing NaNs go).
+    """
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    if len(y) <= budget:
+        return x, y
+
+    starts, ends = _finite_runs(y)
+    total = max(int((ends - starts).sum()), 1)
+
+    xs, ys = [], []
+    for i, (lo, hi) in enumerate(zip(starts, ends)):
+        if i:
+            # First missing point after the previous run breaks the line
+            gap = ends[i - 1]
+            xs.append(x[gap:gap + 1])
+            ys.append(np.array([np.nan]))
+
+        share = max(budget * (hi - lo) // total, 3)
+        if method == "minmax":
+            keep = minmax_indices(y[lo:hi], share // 2)
+        else:
+            keep = lttb_indices(x[lo:hi], y[lo:hi], share)
+
+        xs.append(x[lo:hi][keep])
+        ys.append(y[lo:hi][keep])
+
+    if not xs:
+        return x[:0], y[:0]
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def plot_line(ax, x, y, method="lttb", budget=None, **kwargs):
+    """
+    ax.plot(x, y, **kwargs) through downsample(), with the budget set to
+    the axes' width in output pixels. method=None plots every point.
+    """
+    if method is not None:
+        if budget is None:
+            budget = pixel_width(ax)
+        x, y = downsample(x, y, budget, method=method)
+
+    return ax.plot(x, y, **kwargs)
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+
+# =============================
+# BATCH (all sectors at once)
+# =============================
+
+def drawdown_array(values):
+    """
+    Drawdown from the running peak for every column of a 2-D array
+    (same as (s - s.cummax()) / s.cummax() per column). NaNs are
+    skipped by the running peak and stay NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    peak = np.fmax.accumulate(values, axis=0)
+    return (values - peak) / peak
+
+
+def drawdown_episodes(values, index=None, columns=None):
+    """
+    One row per drawdown episode per column: peak, trough and recovery
+    dates, depth and lengths in rows.
+
+    An episode starts on the first row below the previous peak and ends
+    on the first row back at (or above) it. Unrecovered episodes have
+    no Recovery date. NaN rows (data gaps) neither end nor start an
+    episode, like DrawdownTracker. Found in one pass over the whole
+    2-D array.
+    """
+    dd = drawdown_array(values)
+    n_rows, n_cols = dd.shape
+
+    index = pd.RangeIndex(n_rows) if index is None else pd.Index(index)
+    columns = pd.RangeIndex(n_cols) if columns is None else pd.Index(columns)
+
+    # Row of the last non-NaN value at or before each row (-1 before
+    # the first one): gaps carry the previous row's state forward
+    valid = ~np.isnan(dd)
+    last_valid = np.maximum.accumulate(np.where(valid, np.arange(n_rows)[:, None], -1), axis=0)
+    state = np.take_along_axis(dd, np.maximum(last_valid, 0), axis=0)
+
+    # Work column by column in one flat array: pad each column with a
+    # "not underwater" row on both sides so every episode has an edge
+    under = np.zeros((n_cols, n_rows + 2), dtype=bool)
+    under[:, 1:-1] = ((state < 0) & (last_valid >= 0)).T
+
+    edges = np.diff(under.astype(np.int8), axis=1)
+    start_col, start_row = np.nonzero(edges == 1)
+    _, end_row = np.nonzero(edges == -1)
+
+    if len(start_row) == 0:
+        return pd.DataFrame(columns=[
+            "Sector", "Peak", "Trough", "Recovery", "Depth %",
+            "Decline Days", "Recovery Days", "Total Days",
+        ])
+
+    # Trough = row of the deepest drawdown inside [start, end)
+    flat = dd.T.ravel()
+    lengths = end_row - start_row
+    first = np.r_[0, np.cumsum(lengths)[:-1]]
+
+    episode = np.repeat(np.arange(len(start_row)), lengths)
+    rows = np.arange(lengths.sum()) - np.repeat(first - start_row, lengths)
+    depth_values = flat[start_col.repeat(lengths) * n_rows + rows]
+
+    order = np.lexsort((depth_values, episode))
+    trough_row = rows[order][first]
+    depth = depth_values[order][first]
+
+    recovered = end_row < n_rows
+    # The peak is the last real value before the episode, not a gap row
+    peak_row = np.maximum(last_valid[np.maximum(start_row - 1, 0), start_col], 0)
+
+    recovery = pd.Series(pd.NaT, index=range(len(start_row)), dtype=object)
+    recovery[recovered] = np.asarray(index[end_row[recovered]], dtype=object)
+
+    return pd.DataFrame({
+        "Sector": columns[start_col],
+        "Peak": index[peak_row],
+        "Trough": index[trough_row],
+        "Recovery": recovery.to_numpy(),
+        "Depth %": depth * 100,
+        "Decline Days": trough_row - peak_row,
+        "Recovery Days": np.where(recovered, end_row - trough_row, np.nan),
+        "Total Days": np.where(recovered, end_row - peak_row, n_rows - 1 - peak_row),
+    })
+
+
+def drawdown_summary(values, index=None, columns=None):
+    """
+    Per-column max drawdown, its peak/trough/recovery dates, time to
+    recover and the longest time spent under water.
+    """
+    dd = drawdown_array(values)
+    columns = pd.RangeIndex(dd.shape[1]) if columns is None else pd.Index(columns)
+
+    episodes = drawdown_episodes(values, index=index, columns=columns)
+
+    summary = pd.DataFrame({"Max Drawdown %": pd.DataFrame(dd, columns=columns).min() * 100})
+
+    if episodes.empty:
+        return summary
+
+    worst = episodes.loc[episodes.groupby("Sector", sort=False)["Depth %"].idxmin()]
+    worst = worst.set_index("Sector")
+
+    summary = summary.join(worst[["Peak", "Trough", "Recovery", "Recovery Days"]])
+    summary["Longest Underwater Days"] = episodes.groupby("Sector", sort=False)["Total Days"].max()
+    return summary
+
+
+# =============================
+# STREAMING (one day at a time)
+# =============================
+
+class DrawdownTracker:
+    """
+    Running peak, current drawdown and open episodes per column, so a new
+    day's values update everything in O(columns) without a rescan.
+    Closed episodes are kept in .episodes as dicts.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        n = len(self.columns)
+
+        self.peak = np.full(n, np.nan)
+        self.peak_date = [None] * n
+        self.max_drawdown = np.zeros(n)
+
+        self.trough = np.zeros(n)
+        self.trough_date = [None] * n
+        self.under = np.zeros(n, dtype=bool)
+
+        self.episodes = []
+
+    def update(self, date, row):
+        """Add one day, return the current drawdown per column."""
+        row = np.asarray(row, dtype=np.float64)
+        valid = ~np.isnan(row)
+
+        new_peak = valid & ~(row < self.peak)
+        dd = np.where(valid, (row - self.peak) / self.peak, np.nan)
+        dd[new_peak] = 0.0
+
+        # Episodes that just recovered
+        for i in np.nonzero(self.under & new_peak)[0]:
+            self.episodes.append({
+                "Sector": self.columns[i],
+                "Peak": self.peak_date[i],
+                "Trough": self.trough_date[i],
+                "Recovery": date,
+                "Depth %": self.trough[i] * 100,
+            })
+            self.under[i] = False
+
+        # New lows inside an episode (or a new episode)
+        deeper = valid & ~new_peak & (~self.under | (dd < self.trough))
+        for i in np.nonzero(deeper)[0]:
+            self.trough_date[i] = date
+        self.trough = np.where(deeper, dd, self.trough)
+        self.under |= valid & ~new_peak
+
+        for i in np.nonzero(new_peak)[0]:
+            self.peak_date[i] = date
+        self.peak = np.where(new_peak, row, self.peak)
+        self.max_drawdown = np.fmin(self.max_drawdown, dd)
+
+        return dd
+
+    def open_episodes(self):
+        return [
+            {
+                "Sector": self.columns[i],
+                "Peak": self.peak_date[i],
+                "Trough": self.trough_date[i],
+                "Recovery": None,
+                "Depth %": self.trough[i] * 100,
+            }
+            for i in np.nonzero(self.under)[0]
+        ]
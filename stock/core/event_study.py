@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------
+# Settings
+# -----------------------------
+PRE = 10           # trading days before the event in the window
+POST = 30          # trading days after it
+ESTIMATION = 120   # trading days before the window used to fit the market model
+BENCHMARK_FILL = 5 # missing benchmark days carried forward before giving up
+
+BOOTSTRAP = 2000
+BOOTSTRAP_CHUNK = 250   # resamples per task; fixed so results don't depend on workers
+CONFIDENCE = 0.95
+
+
+def event_positions(dates, event_dates):
+    """Row of the first trading day on or after each event (-1 if none)."""
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    when = np.asarray(pd.to_datetime(event_dates), dtype="datetime64[ns]")
+    pos = dates.searchsorted(when)
+    pos[(pos >= len(dates)) | (when < dates[0])] = -1
+    return pos
+
+
+class EventStudy:
+    """
+    Returns of every event x sector around each event, as
+    (event x offset x sector) arrays built with one fancy index:
+
+        ar   abnormal daily returns (sector minus benchmark, or minus the
+             market-model fit when model="market")
+        car  cumulative abnormal returns over the window
+        cr   cumulative raw returns over the window
+
+    Events whose window (plus the estimation period for the market
+    model) doesn't fit inside the panel are dropped and listed in
+    .skipped. Adding events or sectors only widens the arrays.
+    """
+
+    def __init__(self, returns, benchmark, dates, sectors, events,
+                 pre=PRE, post=POST, model="adjusted", estimation=ESTIMATION):
+        returns = np.asarray(returns, dtype=np.float64)
+        benchmark = np.asarray(benchmark, dtype=np.float64)
+        dates = pd.DatetimeIndex(dates)
+        events = events.reset_index(drop=True)
+
+        self.sectors = list(sectors)
+        self.offsets = np.arange(-pre, post + 1)
+        self.model = model
+
+        pos = event_positions(dates, events["Date"])
+        first = pos - pre - (estimation if model == "market" else 0)
+        ok = (pos >= 0) & (first >= 1) & (pos + post < len(dates))
+
+        self.skipped = events[~ok]
+        self.events = events[ok].reset_index(drop=True)
+        self.event_days = dates[pos[ok]] if ok.any() else dates[:0]
+        pos = pos[ok]
+
+        # (event x offset) rows into the panel
+        rows = pos[:, None] + self.offsets[None, :]
+        r = returns[rows]                 # event x offset x sector
+        b = benchmark[rows][:, :, None]   # event x offset x 1
+
+        if model == "market":
+            alpha, beta = self._market_model(returns, benchmark, pos - pre, estimation)
+            expected = alpha[:, None, :] + beta[:, None, :] * b
+        elif model == "adjusted":
+            expected = b
+        else:
+            raise ValueError(f"model must be 'adjusted' or 'market', not {model}")
+
+        self.returns = r
+        self.ar = r - expected
+        self.car = np.cumsum(self.ar, axis=1)
+        self.cr = np.cumprod(1 + r, axis=1) - 1
+
+    @staticmethod
+    def _market_model(returns, benchmark, window_start, estimation):
+        """OLS alpha and beta per event x sector over the estimation days."""
+        rows = window_start[:, None] + np.arange(-estimation, 0)[None, :]
+        r = returns[rows]                   # event x day x sector
+        b = benchmark[rows][:, :, None]     # event x day x 1
+
+        b_mean = b.mean(axis=1, keepdims=True)
+        r_mean = r.mean(axis=1, keepdims=True)
+        var = ((b - b_mean) ** 2).sum(axis=1)
+        cov = ((b - b_mean) * (r - r_mean)).sum(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.where(var > 0, cov / var, 0.0)
+        alpha = r_mean[:, 0, :] - beta * b_mean[:, 0, :]
+        return alpha, beta
+
+    @classmethod
+    def from_frame(cls, df, events, benchmark="NEPSE", fill=BENCHMARK_FILL, **kwargs):
+        """
+        Study of a (Date + sector levels) frame. The benchmark column is
+        left out of the sectors; up to `fill` missing days in a row are
+        carried forward. benchmark=None uses the equal-weighted mean of
+        the sectors' returns instead.
+
+        Raises ValueError when the benchmark column is missing or has
+        longer gaps, rather than quietly switching benchmarks.
+        """
+        df = df.sort_values("Date").reset_index(drop=True)
+        sectors = [c for c in df.columns if c not in ("Date", benchmark)]
+
+        prices = df[sectors].to_numpy(dtype=np.float64)
+        returns = np.zeros(prices.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns[1:] = prices[1:] / prices[:-1] - 1
+        returns = np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+        if benchmark is not None:
+            if benchmark not in df.columns:
+                raise ValueError(f"No {benchmark} column to use as the benchmark")
+            level = pd.to_numeric(df[benchmark], errors="coerce").ffill(limit=fill)
+            if level.isna().any():
+                first = df["Date"][level.isna()].iloc[0]
+                raise ValueError(f"{benchmark} has {int(level.isna().sum())} days missing beyond "
+                                 f"a {fill}-day fill (first {first:%Y-%m-%d})")
+
+            level = level.to_numpy(dtype=np.float64)
+            bench = np.zeros(len(level))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                bench[1:] = level[1:] / level[:-1] - 1
+            bench = np.nan_to_num(bench, nan=0.0, posinf=0.0, neginf=0.0)
+            name = benchmark
+        else:
+            bench = returns.mean(axis=1)
+            name = "equal-weighted sectors"
+
+        study = cls(returns, bench, df["Date"], sectors, events, **kwargs)
+        study.benchmark = name
+        return study
+
+    # -----------------------------
+    # Summaries
+    # -----------------------------
+    @property
+    def shape(self):
+        return self.ar.shape
+
+    def event_labels(self):
+        if "Label" in self.events.columns:
+            return list(self.events["Label"].astype(str))
+        return [f"{d:%Y-%m-%d}" for d in self.events["Date"]]
+
+    def car_table(self, offset=None):
+        """(event x sector) CAR at an offset (default: the window's end)."""
+        i = -1 if offset is None else int(np.flatnonzero(self.offsets == offset)[0])
+        return pd.DataFrame(self.car[:, i, :], index=self.event_labels(), columns=self.sectors)
+
+    def caar(self):
+        """(offset x sector) cumulative average abnormal return across events."""
+        return pd.DataFrame(self.car.mean(axis=0), index=self.offsets, columns=self.sectors)
+
+    def summary(self, ci=None):
+        """
+        Per sector at the window's end: CAAR, its t-statistic across
+        events, the share of events with a positive CAR, and the
+        bootstrap interval when one is given (from bootstrap()).
+        """
+        final = self.car[:, -1, :]
+        n = final.shape[0]
+        mean = final.mean(axis=0)
+        sd = final.std(axis=0, ddof=1) if n > 1 else np.full(final.shape[1], np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = mean / (sd / np.sqrt(n))
+
+        df = pd.DataFrame({
+            "CAAR %": mean * 100,
+            "t": t,
+            "Positive %": (final > 0).mean(axis=0) * 100,
+        }, index=pd.Index(self.sectors, name="Sector"))
+
+        if ci is not None:
+            low, high = ci
+            df["CI low %"] = low[-1] * 100
+            df["CI high %"] = high[-1] * 100
+
+        return df.sort_values("CAAR %", ascending=False)
+
+    # -----------------------------
+    # Bootstrap
+    # -----------------------------
+    def bootstrap(self, n=BOOTSTRAP, confidence=CONFIDENCE, seed=0, workers=None):
+        """
+        Percentile interval of the CAAR path per sector, resampling
+        events with replacement. Resamples run in fixed-size chunks on
+        run_batch workers, each with its own spawned seed, so the result
+        is the same for any number of workers.
+
+        Returns (low, high), each (offset x sector).
+        """
+        from core.batch import run_batch
+
+        chunks = [BOOTSTRAP_CHUNK] * (n // BOOTSTRAP_CHUNK)
+        if n % BOOTSTRAP_CHUNK:
+            chunks.append(n % BOOTSTRAP_CHUNK)
+
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        items = [(self.car, size, s) for size, s in zip(chunks, seeds)]
+
+        results = run_batch(bootstrap_chunk, items, workers=workers)
+        failed = [res for res in results if res["status"] == "error"]
+        if failed:
+            raise RuntimeError(f"Bootstrap failed: {failed[0]['error']}")
+
+        means = np.concatenate([res["result"] for res in results])
+        tail = (1 - confidence) / 2 * 100
+        low, high = np.percentile(means, [tail, 100 - tail], axis=0)
+        return low, high
+
+
+def bootstrap_chunk(item):
+    """
+    CAAR paths of `size` resamples of the events: (size x offset x
+    sector). Module-level so run_batch() can send it to a worker.
+    """
+    car, size, seed = item
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, car.shape[0], size=(size, car.shape[0]))
+    return car[picks].mean(axis=1)
@@ -0,0 +1,252 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+
+# -----------------------------
+# Cache location
+# -----------------------------
+STOCK_DIR = Path(__file__).resolve().parents[1]
+CACHE_DIR = Path(os.environ.get("STOCK_CACHE_DIR", STOCK_DIR / ".cache" / "excel"))
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def clean_header(df):
+    """
+    Header cleanup applied before a sheet is cached: surrounding spaces
+    are stripped from text labels. Other labels (ints, dates) are kept
+    as they are, so callers can still index by them.
+    """
+    df.columns = df.columns.map(lambda c: c.strip() if isinstance(c, str) else c)
+    return df
+
+
+def _file_state(path, use_hash):
+    if use_hash:
+        digest = hashlib.sha1()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _entry_prefix(path, sheet_name, read_kwargs):
+    """
+    Name shared by every cached version of one (file, sheet, options).
+    """
+    raw = json.dumps(
+        [str(path), sheet_name, sorted(read_kwargs.items())],
+        default=str,
+    )
+    args_hash = hashlib.sha1(raw.encode()).hexdigest()[:12]
+    sheet = re.sub(r"[^A-Za-z0-9]+", "_", str(sheet_name)).strip("_") or "sheet"
+    return f"{path.stem}-{sheet}-{args_hash}"
+
+
+def _read_entry(entry):
+    if entry.suffix == ".parquet":
+        return pd.read_parquet(entry)
+    return pd.read_pickle(entry)
+
+
+def _cached(base):
+    """The sheet cached at base, or None (unreadable entries are removed)."""
+    for suffix in (".parquet", ".pkl"):
+        entry = base.with_suffix(suffix)
+        if entry.exists():
+            try:
+                return _read_entry(entry)
+            except Exception:
+                entry.unlink(missing_ok=True)
+    return None
+
+
+def _write_entry(df, base):
+    """
+    Write df next to base as Parquet, or as a pickle when Parquet
+    can't hold it (no pyarrow, mixed-type object columns, duplicate
+    headers). Returns the written path.
+    """
+    base.parent.mkdir(parents=True, exist_ok=True)
+
+    target = base.with_suffix(".parquet")
+    tmp = target.with_suffix(".parquet.tmp")
+    try:
+        df.to_parquet(tmp)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        target = base.with_suffix(".pkl")
+        tmp = target.with_suffix(".pkl.tmp")
+        df.to_pickle(tmp)
+
+    os.replace(tmp, target)
+    return target
+
+
+# -----------------------------
+# Loader
+# -----------------------------
+def _entry_base(path, sheet_name, read_kwargs, use_hash, cache_dir):
+    prefix = _entry_prefix(path, sheet_name, read_kwargs)
+    state = hashlib.sha1(_file_state(path, use_hash).encode()).hexdigest()[:12]
+    return prefix, cache_dir / f"{prefix}-{state}"
+
+
+def _store(df, path, sheet_name, read_kwargs, use_hash, cache_dir):
+    prefix, base = _entry_base(path, sheet_name, read_kwargs, use_hash, cache_dir)
+    written = _write_entry(df, base)
+
+    for stale in cache_dir.glob(f"{prefix}-*"):
+        if stale != written:
+            stale.unlink(missing_ok=True)
+
+
+def read_excel_cached(path, sheet_name=0, use_hash=False, cache_dir=None, **read_kwargs):
+    """
+    pd.read_excel with a columnar on-disk cache.
+
+    Each (file, sheet, read options) is stored after clean_header() and
+    reused until the file's mtime/size changes (or its content hash, with
+    use_hash=True). Stale copies of the same sheet are removed on write.
+    sheet_name=None returns a dict of every sheet, like pd.read_excel;
+    each sheet is cached on its own and only missing ones are parsed.
+    """
+    path = Path(path).resolve()
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+
+    if sheet_name is None:
+        return _read_all_sheets(path, use_hash, cache_dir, read_kwargs)
+
+    _, base = _entry_base(path, sheet_name, read_kwargs, use_hash, cache_dir)
+
+    df = _cached(base)
+    if df is not None:
+        return df
+
+    df = pd.read_excel(path, sheet_name=sheet_name, **read_kwargs)
+    df = clean_header(df)
+
+    _store(df, path, sheet_name, read_kwargs, use_hash, cache_dir)
+    return df
+
+
+def _sheet_names(path, use_hash, cache_dir):
+    """Sheet names of a workbook, kept as JSON until the file changes."""
+    prefix, base = _entry_base(path, "__sheets__", {}, use_hash, cache_dir)
+    entry = base.with_suffix(".json")
+    if entry.exists():
+        return json.loads(entry.read_text())
+
+    with pd.ExcelFile(path) as book:
+        names = list(book.sheet_names)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{prefix}-*"):
+        stale.unlink(missing_ok=True)
+    tmp = entry.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(names))
+    os.replace(tmp, entry)
+    return names
+
+
+def _read_all_sheets(path, use_hash, cache_dir, read_kwargs):
+    """
+    Every sheet by name, from the cache where possible. Missing sheets
+    are parsed in one read_excel call and cached by name and (for the
+    first sheet) by index 0 so default read_excel calls hit the cache too.
+    """
+    names = _sheet_names(path, use_hash, cache_dir)
+
+    sheets = {}
+    for name in names:
+        _, base = _entry_base(path, name, read_kwargs, use_hash, cache_dir)
+        df = _cached(base)
+        if df is not None:
+            sheets[name] = df
+
+    missing = [name for name in names if name not in sheets]
+    if missing:
+        parsed = pd.read_excel(path, sheet_name=missing, **read_kwargs)
+        for name in missing:
+            df = clean_header(parsed[name])
+            sheets[name] = df
+            _store(df, path, name, read_kwargs, use_hash, cache_dir)
+            if name == names[0]:
+                _store(df, path, 0, read_kwargs, use_hash, cache_dir)
+
+    return {name: sheets[name] for name in names}
+
+
+# -----------------------------
+# Cache maintenance
+# -----------------------------
+def warm(paths, cache_dir=None):
+    """
+    Cache every sheet of every workbook in paths (files or folders).
+    """
+    count = 0
+    for path in _expand(paths):
+        sheets = read_excel_cached(path, sheet_name=None, cache_dir=cache_dir)
+        count += len(sheets)
+        print(f"✅ Cached {len(sheets)} sheet(s): {path}")
+    return count
+
+
+def purge(cache_dir=None):
+    """
+    Delete every cached sheet. Returns the number of files removed.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+    if not cache_dir.exists():
+        return 0
+
+    removed = 0
+    for entry in cache_dir.iterdir():
+        if entry.is_file():
+            entry.unlink()
+            removed += 1
+    return removed
+
+
+def _expand(paths):
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(
+                p for p in path.rglob("*.xlsx") if not p.name.startswith("~$")
+            )
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the Excel sheet cache")
+    parser.add_argument("--cache-dir", default=None)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    warm_cmd = sub.add_parser("warm", help="cache all sheets of the given workbooks")
+    warm_cmd.add_argument("paths", nargs="*", default=[str(STOCK_DIR)])
+
+    sub.add_parser("purge", help="delete all cached sheets")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "warm":
+        count = warm(args.paths, cache_dir=args.cache_dir)
+        print(f"\n{count} sheet(s) cached in {args.cache_dir or CACHE_DIR}")
+    else:
+        removed = purge(cache_dir=args.cache_dir)
+        print(f"🗑️  Removed {removed} cached file(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Unauthorized(Exception):
+    """The API rejected the token (HTTP 401); nothing else will succeed."""
+
+
+# -----------------------------
+# Rate limiting
+# -----------------------------
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` requests per second on average,
+    bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+# -----------------------------
+# Fetching
+# -----------------------------
+class SectorFetcher:
+    """
+    Fetch the sector-wise endpoint for many business dates at once.
+
+    Each worker thread keeps its own pooled keep-alive session. All
+    requests share one TokenBucket, 5xx/429 responses and connection
+    errors are retried with exponential backoff, and results come back
+    in the order the dates were given.
+    """
+
+    def __init__(self, base_url, headers=None, concurrency=4, rate=2.0, burst=None,
+                 retries=4, backoff=1.0, timeout=15, verify=False):
+        self.base_url = base_url
+        self.headers = headers or {}
+        self.concurrency = max(1, int(concurrency))
+        self.bucket = TokenBucket(rate, burst or self.concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.verify = verify
+
+        self._local = threading.local()
+        self._stop = threading.Event()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self._local.session = session
+        return session
+
+    def _sleep_backoff(self, attempt):
+        delay = self.backoff * (2 ** attempt)
+        time.sleep(delay + random.uniform(0, self.backoff))
+
+    def fetch_day(self, business_date):
+        """
+        Returns (status, payload): ("ok", rows), ("holiday", []) or
+        ("error", message). Raises Unauthorized on HTTP 401; any other
+        failure is an "error" the caller records and moves past.
+        """
+        params = {"businessDate": business_date}
+        last_error = None
+
+        for attempt in range(self.retries + 1):
+            if self._stop.is_set():
+                return "error", "cancelled"
+
+            self.bucket.acquire()
+
+            try:
+                response = self._session().get(
+                    self.base_url, params=params, timeout=self.timeout, verify=self.verify
+                )
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                last_error = f"connection error: {e}"
+            except requests.RequestException as e:
+                # Invalid URL, too many redirects...: retrying won't help
+                return "error", f"request failed: {type(e).__name__}: {e}"
+            else:
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError as e:
+                        return "error", f"malformed response: {e}"
+                    return ("ok", data) if data else ("holiday", [])
+
+                if response.status_code == 401:
+                    self._stop.set()
+                    raise Unauthorized(business_date)
+
+                last_error = f"HTTP {response.status_code}"
+                if response.status_code != 429 and response.status_code < 500:
+                    return "error", last_error
+
+            if attempt < self.retries:
+                self._sleep_backoff(attempt)
+
+        return "error", last_error
+
+    def fetch(self, business_dates):
+        """
+        Yield (business_date, status, payload) in input order.
+
+        At most concurrency * 4 requests are queued ahead of the one
+        being yielded, so memory stays flat on multi-year backfills.
+        """
+        self._stop.clear()
+        window = self.concurrency * 4
+        dates = iter(business_dates)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            try:
+                for day in dates:
+                    pending.append((day, pool.submit(self.fetch_day, day)))
+                    if len(pending) >= window:
+                        break
+
+                while pending:
+                    day, future = pending.popleft()
+                    status, payload = future.result()
+                    yield day, status, payload
+
+                    next_day = next(dates, None)
+                    if next_day is not None:
+                        pending.append((next_day, pool.submit(self.fetch_day, next_day)))
+            finally:
+                self._stop.set()
+                for _, future in pending:
+                    future.cancel()
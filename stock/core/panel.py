@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+class ReturnPanel:
+    """
+    Prices of a (date x sector) frame precomputed once for every consumer.
+
+    Log prices are kept as one contiguous float64 array, so momentum for
+    any lookback is a single difference of two row slices. Daily simple
+    returns are computed once from the prices and reused by the backtest,
+    the correlation matrix and the rotation detection.
+    """
+
+    def __init__(self, prices, index=None, columns=None, log_prices=None):
+        self.prices = np.ascontiguousarray(prices, dtype=np.float64)
+        self.index = index if index is not None else pd.RangeIndex(len(self.prices))
+        self.columns = pd.Index(columns if columns is not None else range(self.prices.shape[1]))
+
+        if log_prices is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_prices = np.log(self.prices)
+        self.log_prices = np.ascontiguousarray(log_prices, dtype=np.float64)
+
+        self._simple_returns = None
+        self._daily_returns = None
+        self._momentum = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(df.to_numpy(dtype=np.float64), index=df.index, columns=df.columns)
+
+    @property
+    def shape(self):
+        return self.prices.shape
+
+    # -----------------------------
+    # Returns
+    # -----------------------------
+    @property
+    def simple_returns(self):
+        """
+        1-day simple returns, NaN on the first row and wherever either
+        day's price is missing (same numbers as pct_change()).
+        """
+        if self._simple_returns is None:
+            out = np.full(self.prices.shape, np.nan)
+            out[1:] = self.prices[1:] / self.prices[:-1] - 1
+            out.flags.writeable = False
+            self._simple_returns = out
+        return self._simple_returns
+
+    @property
+    def daily_returns(self):
+        """
+        simple_returns with the first row and NaNs set to 0, for the
+        backtest: a day without a price earns nothing
+        (same numbers as pct_change().fillna(0)).
+        """
+        if self._daily_returns is None:
+            self._daily_returns = np.nan_to_num(self.simple_returns, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        return self._daily_returns
+
+    def returns_frame(self):
+        """
+        Daily returns as a DataFrame without the first row, gaps left as
+        NaN so statistics like corr() skip them instead of seeing 0%
+        (pct_change().iloc[1:]).
+        """
+        return pd.DataFrame(
+            self.simple_returns[1:], index=self.index[1:], columns=self.columns
+        )
+
+    def momentum(self, lookback):
+        """
+        lookback-day log return, NaN for the first lookback rows.
+
+        It ranks sectors exactly like pct_change(lookback) because log is
+        monotonic. Arrays are memoized per lookback and read-only.
+        """
+        if lookback not in self._momentum:
+            out = np.full(self.log_prices.shape, np.nan)
+            if lookback < len(out):
+                out[lookback:] = self.log_prices[lookback:] - self.log_prices[:-lookback]
+            out.flags.writeable = False
+            self._momentum[lookback] = out
+        return self._momentum[lookback]
+
+    # -----------------------------
+    # Leaders
+    # -----------------------------
+    def leaders(self, lookback):
+        """
+        Momentum leader per date as a Series of sector names, skipping
+        dates with no momentum yet (idxmax of the pct_change table).
+        """
+        momentum = self.momentum(lookback)
+        valid = ~np.isnan(momentum).all(axis=1)
+
+        filled = np.where(np.isnan(momentum[valid]), -np.inf, momentum[valid])
+        positions = filled.argmax(axis=1)
+
+        return pd.Series(
+            np.asarray(self.columns)[positions],
+            index=self.index[valid],
+        )
@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------
+# Top-N by partial sort
+# -----------------------------
+# np.argpartition finds the n best rows in O(rows); only those n are
+# then sorted. Results are ordered exactly like a stable full sort
+# (ties keep their original order, NaN ranks last), so switching a
+# sort_values().head(n) to these helpers never reorders a report.
+
+def _score(values, largest=True, absolute=False):
+    """float64 keys where smaller is better and NaN is +inf."""
+    v = np.asarray(values, dtype=np.float64)
+    if absolute:
+        v = np.abs(v)
+    v = -v if largest else v.copy()
+    v[np.isnan(v)] = np.inf
+    return v
+
+
+def _best(score, n):
+    """Positions of the n smallest scores, in stable sorted order."""
+    size = len(score)
+    if n <= 0 or size == 0:
+        return np.empty(0, dtype=np.intp)
+    if n >= size:
+        return np.argsort(score, kind="stable")
+
+    kth = score[np.argpartition(score, n - 1)[n - 1]]
+
+    # Everything strictly better, then ties with the n-th value in
+    # index order until n rows are picked
+    better = np.flatnonzero(score < kth)
+    ties = np.flatnonzero(score == kth)[: n - len(better)]
+    picked = np.concatenate([better, ties])
+
+    return picked[np.lexsort((picked, score[picked]))]
+
+
+def top_n_indices(values, n, largest=True, absolute=False):
+    """
+    Positions of the n largest (or smallest) values, best first.
+    absolute=True ranks by magnitude.
+    """
+    return _best(_score(values, largest, absolute), n)
+
+
+def top_n(df, n, by, ascending=False, absolute=False):
+    """
+    df.sort_values(by, ascending, kind="stable").head(n) without sorting
+    every row. by may be a list of keys; the first key is partitioned
+    and later keys only break ties among the candidates.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    orders = [ascending] * len(keys) if isinstance(ascending, bool) else list(ascending)
+
+    scores = [_score(df[key].to_numpy(), largest=not asc, absolute=absolute and i == 0)
+              for i, (key, asc) in enumerate(zip(keys, orders))]
+
+    if len(keys) == 1:
+        return df.iloc[_best(scores[0], n)]
+
+    # Rows that can still make the cut on the first key: every row up to
+    # and including all ties with the n-th value
+    primary = scores[0]
+    if n < len(primary):
+        kth = primary[np.argpartition(primary, n - 1)[n - 1]]
+        candidates = np.flatnonzero(primary <= kth)
+    else:
+        candidates = np.arange(len(primary))
+
+    # Last key passed to lexsort sorts first; row position breaks any tie left
+    order = np.lexsort([candidates] + [s[candidates] for s in reversed(scores)])
+    return df.iloc[candidates[order][:n]]
+
+
+def top_n_per_row(values, n, largest=True):
+    """
+    (rows x n) column positions of each row's n best values, best first
+    (e.g. the top sectors of every day of a date x sector matrix).
+    """
+    score = _score(values, largest)
+    n = min(n, score.shape[1])
+    if n <= 0:
+        return np.empty((score.shape[0], 0), dtype=np.intp)
+
+    kth = np.partition(score, n - 1, axis=1)[:, n - 1:n]
+
+    # Per row: everything strictly better, then the first ties with the
+    # n-th value in column order - exactly n cells per row
+    better = score < kth
+    ties = score == kth
+    need = n - better.sum(axis=1, keepdims=True)
+    picked = better | (ties & (np.cumsum(ties, axis=1) <= need))
+
+    part = np.nonzero(picked)[1].reshape(len(score), n)
+    order = np.argsort(np.take_along_axis(score, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def top_n_per_group(df, n, by, group, largest=True, absolute=False):
+    """
+    The n best rows of every group (e.g. top brokers per day), groups in
+    sorted order and rows best first within each.
+    """
+    codes, _ = pd.factorize(df[group], sort=True)
+    score = _score(df[by].to_numpy(), largest, absolute)
+
+    # Integer codes sort in linear time; each group is then one slice
+    order = np.argsort(codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+
+    picked = [
+        rows[_best(score[rows], n)]
+        for rows in np.split(order, bounds)
+        if len(rows)
+    ]
+    return df.iloc[np.concatenate(picked) if picked else []]
+
+
+# -----------------------------
+# Streaming
+# -----------------------------
+class StreamingTopN:
+    """
+    Running top-n over chunks that never fit in memory together. Only
+    the n best rows seen so far are kept between chunks.
+
+        top = StreamingTopN(10, by="turnOverValues")
+        for chunk in pd.read_csv(path, chunksize=100_000):
+            top.update(chunk)
+        top.result()
+    """
+
+    def __init__(self, n, by, largest=True, absolute=False):
+        self.n = n
+        self.by = by
+        self.largest = largest
+        self.absolute = absolute
+        self._kept = None
+        self.rows_seen = 0
+
+    def update(self, chunk):
+        self.rows_seen += len(chunk)
+        best = chunk.iloc[top_n_indices(chunk[self.by].to_numpy(), self.n, self.largest, self.absolute)]
+
+        # Kept rows first, so earlier chunks win ties like a stable sort
+        pool = best if self._kept is None else pd.concat([self._kept, best])
+        self._kept = pool.iloc[top_n_indices(pool[self.by].to_numpy(), self.n, self.largest, self.absolute)]
+        return self
+
+    def result(self):
+        return self._kept if self._kept is not None else pd.DataFrame()
@@ -0,0 +1,165 @@
+import glob
+import hashlib
+import inspect
+import json
+import os
+import threading
+from pathlib import Path
+
+import matplotlib
+
+# Batch runs never open windows; STOCK_SHOW=1 keeps the user's backend
+if os.environ.get("STOCK_SHOW") != "1":
+    matplotlib.use("Agg", force=True)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------
+# Settings
+# -----------------------------
+DEFAULT_DPI = 300
+PREVIEW_DPI = 72
+
+HASH_KEY = "Source-Hash"
+
+# pyplot keeps global state (current figure, rcParams); the server
+# renders from several threads, so drawing is serialized
+_LOCK = threading.Lock()
+
+# Shared figure layouts, so every script sizes the same kind of chart
+# the same way
+TEMPLATES = {
+    "line": {"figsize": (14, 7)},
+    "tall": {"figsize": (14, 8)},
+    "equity": {"figsize": (12, 6)},
+    "event": {"figsize": (16, 9)},
+    "bars": {"figsize": (12, 6)},
+    "dashboard": {"figsize": (14, 14)},
+}
+
+
+def preview_enabled():
+    return os.environ.get("STOCK_PREVIEW") == "1"
+
+
+def new_figure(template="line", **kwargs):
+    """plt.subplots() with one of the shared TEMPLATES."""
+    options = {**TEMPLATES[template], **kwargs}
+    return plt.subplots(**options)
+
+
+# -----------------------------
+# Content hash
+# -----------------------------
+def _update(digest, obj):
+    if obj is None:
+        digest.update(b"none")
+    elif isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(repr(getattr(obj, "columns", getattr(obj, "name", ""))).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        digest.update(f"{obj.dtype}{obj.shape}".encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            digest.update(str(key).encode())
+            _update(digest, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _update(digest, item)
+    else:
+        digest.update(json.dumps(obj, default=str, sort_keys=True).encode())
+
+
+def content_hash(draw, data=None, params=None, dpi=DEFAULT_DPI, savefig_kwargs=None):
+    """
+    Hash of everything that decides how a chart looks: the drawing
+    code, its input data, chart params and save options.
+    """
+    digest = hashlib.sha1()
+
+    try:
+        digest.update(inspect.getsource(draw).encode())
+    except (OSError, TypeError):
+        digest.update(draw.__code__.co_code)
+
+    _update(digest, data)
+    _update(digest, params)
+    _update(digest, {"dpi": dpi, **(savefig_kwargs or {})})
+    return digest.hexdigest()
+
+
+def stored_hash(path):
+    """Hash saved in a PNG by render(), or None."""
+    try:
+        from PIL import Image
+        with Image.open(path) as image:
+            return image.text.get(HASH_KEY)
+    except Exception:
+        return None
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def render(path, draw, data=None, params=None, dpi=DEFAULT_DPI, preview=None,
+           history=None, **savefig_kwargs):
+    """
+    Build a chart with draw(params) and save it, unless an up-to-date
+    PNG already exists.
+
+    draw must create its own figure and return it. The PNG stores a
+    content hash of (draw source, data, params, save options). If the
+    target, or with history= any file matching that glob, carries the
+    same hash, nothing is drawn. preview (or STOCK_PREVIEW=1) saves a
+    low-dpi copy next to the target as *_preview.png.
+
+    The PNG is written to a temporary file and moved into place, so a
+    reader never sees a half-written chart.
+
+    Returns (path, rendered).
+    """
+    path = Path(path)
+
+    if preview is None:
+        preview = preview_enabled()
+    if preview:
+        dpi = PREVIEW_DPI
+        path = path.with_name(f"{path.stem}_preview{path.suffix}")
+
+    digest = content_hash(draw, data, params, dpi, savefig_kwargs)
+
+    candidates = [path]
+    if history:
+        candidates += [Path(p) for p in sorted(glob.glob(str(history)))]
+
+    for candidate in candidates:
+        if candidate.exists() and stored_hash(candidate) == digest:
+            return candidate, False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Dot-prefixed, so history globs never match it
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}{path.suffix}")
+
+    with _LOCK:
+        # Let draw code size itself to the output (see core.downsample)
+        with plt.rc_context({"savefig.dpi": dpi}):
+            fig = draw(params) if params is not None else draw()
+        try:
+            fig.savefig(tmp, dpi=dpi, metadata={HASH_KEY: digest}, **savefig_kwargs)
+        finally:
+            plt.close(fig)
+
+    os.replace(tmp, path)
+
+    return path, True
+
+
+def report(path, rendered):
+    if rendered:
+        print(f"✅ Generated: {path}")
+    else:
+        print(f"⏭️  Unchanged, skipped: {path}")
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from core.panel import ReturnPanel
+
+
+# =============================
+# HOLDINGS
+# =============================
+
+def top_n_holdings(momentum, top_n=1):
+    """
+    Boolean (rows x sectors) mask of the top_n sectors by momentum
+    (simple or log returns, only the ranking matters).
+
+    Ties go to the first column, like idxmax. Rows must have at least
+    one non-NaN value.
+    """
+    filled = np.where(np.isnan(momentum), -np.inf, momentum)
+
+    if top_n == 1:
+        order = filled.argmax(axis=1)[:, None]
+    else:
+        order = np.argsort(-filled, axis=1, kind="stable")[:, :top_n]
+
+    held = np.zeros(filled.shape, dtype=bool)
+    np.put_along_axis(held, order, True, axis=1)
+    return held
+
+
+def portfolio_returns(daily_returns, momentum, top_n=1, rebalance=1, transaction_cost=0.002):
+    """
+    Daily returns of an equal-weight top_n momentum portfolio, without a
+    per-date loop.
+
+    Rows whose momentum is all NaN earn 0 and leave holdings unchanged.
+    Holdings are picked on every rebalance-th valid row and carried in
+    between. Each newly bought sector costs transaction_cost / positions,
+    so top_n=1 charges the full cost on every switch. A top_n above the
+    number of sectors holds every sector (weights stay 1 / positions).
+    """
+    valid = ~np.isnan(momentum).all(axis=1)
+    positions = min(top_n, momentum.shape[1])
+
+    held = top_n_holdings(momentum[valid], top_n)
+
+    if rebalance > 1:
+        anchor = (np.arange(len(held)) // rebalance) * rebalance
+        held = held[anchor]
+
+    bought = np.zeros(len(held))
+    bought[1:] = (held[1:] & ~held[:-1]).sum(axis=1)
+
+    picked = np.where(held, daily_returns[valid], 0.0).sum(axis=1) / positions
+
+    returns = np.zeros(len(valid), dtype=np.float64)
+    returns[valid] = picked - transaction_cost * bought / positions
+    return returns
+
+
+# =============================
+# STATS
+# =============================
+
+def sharpe_ratio(returns):
+    """
+    Annualized Sharpe ratio of daily returns (no risk-free rate), NaN
+    for a flat curve rather than inf.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    std = returns.std(ddof=1) if len(returns) > 1 else np.nan
+    return returns.mean() / std * np.sqrt(252) if std > 0 else np.nan
+
+
+def summarize(returns, index, lookback):
+    """
+    Equity curve and headline stats for a daily strategy return array.
+    """
+    returns = pd.Series(returns, index=index)
+
+    equity_curve = (1 + returns).cumprod()
+
+    total_return = equity_curve.iloc[-1] - 1
+
+    rolling_max = equity_curve.cummax()
+    drawdown = (equity_curve - rolling_max) / rolling_max
+    max_dd = drawdown.min()
+
+    return {
+        "Lookback": lookback,
+        "Total Return %": total_return * 100,
+        "Max Drawdown %": max_dd * 100,
+        "Sharpe Ratio": sharpe_ratio(returns),
+        "Equity Curve": equity_curve
+    }
+
+
+# =============================
+# ROTATION BACKTEST
+# =============================
+
+def rotation_backtest(df_base, lookback=20, transaction_cost=0.002, top_n=1, rebalance=1):
+    """
+    Hold the sector(s) with the best lookback momentum, paying
+    transaction_cost on every switch.
+
+    df_base may be a DataFrame or a ReturnPanel already built from it;
+    pass the panel when running several backtests on the same data.
+    """
+    if isinstance(df_base, ReturnPanel):
+        panel = df_base
+    else:
+        panel = ReturnPanel.from_frame(df_base)
+
+    returns = portfolio_returns(
+        panel.daily_returns,
+        panel.momentum(lookback),
+        top_n=top_n,
+        rebalance=rebalance,
+        transaction_cost=transaction_cost,
+    )
+
+    return summarize(returns, panel.index, lookback)
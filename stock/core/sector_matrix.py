@@ -0,0 +1,237 @@
+import numpy as np
+import pandas as pd
+
+from core.ranking import top_n_indices, top_n_per_row
+
+
+# Long-table column -> matrix field
+FIELDS = {
+    "turnOverValues": "turnover",
+    "turnOverVolume": "volume",
+    "totalTransaction": "transactions",
+}
+
+
+class SectorMatrix:
+    """
+    Sector-wise daily data pivoted once into (date x sector) arrays, one
+    per field (turnover, volume, transactions), with sectors as
+    categorical codes.
+
+    A sector's series is one column slice and per-sector totals are one
+    column sum computed on first use, so top-N selection and per-sector
+    lines never scan the long table again. Missing (date, sector) cells
+    are 0.
+    """
+
+    def __init__(self, dates, sectors, values):
+        self.dates = pd.DatetimeIndex(dates, name="businessDate")
+        self.sectors = pd.CategoricalIndex(sectors, name="sectorName")
+        self.values = {field: np.ascontiguousarray(v, dtype=np.float64) for field, v in values.items()}
+        self._code = {sector: i for i, sector in enumerate(self.sectors.categories)}
+        self._totals = {}
+
+    @classmethod
+    def from_long(cls, df):
+        """
+        Long (businessDate, sectorName, values...) rows, dates either in
+        a column or the index. Duplicate (date, sector) rows are summed.
+        """
+        if "businessDate" not in df.columns:
+            df = df.reset_index()
+
+        date_codes, dates = pd.factorize(df["businessDate"], sort=True)
+        sector_codes, sectors = pd.factorize(df["sectorName"].astype(str), sort=True)
+
+        # One flat cell index per row; bincount sums each field into place
+        cell = date_codes * len(sectors) + sector_codes
+        size = len(dates) * len(sectors)
+
+        values = {
+            field: np.bincount(cell, weights=df[column].to_numpy(dtype=np.float64), minlength=size)
+            .reshape(len(dates), len(sectors))
+            for column, field in FIELDS.items()
+            if column in df.columns
+        }
+        return cls(dates, pd.Categorical(sectors, categories=sectors), values)
+
+    @classmethod
+    def from_chunks(cls, chunks, canonical=True):
+        """Matrix of long chunks streamed through a SectorMatrixBuilder."""
+        builder = SectorMatrixBuilder(canonical=canonical)
+        for chunk in chunks:
+            builder.add(chunk)
+        return builder.build()
+
+    @classmethod
+    def from_csv(cls, path, chunksize=100_000):
+        """Scraper CSV streamed chunk by chunk (see sector_store.iter_csv)."""
+        from core.sector_store import iter_csv
+
+        return cls.from_chunks(iter_csv(path, chunksize))
+
+    @property
+    def shape(self):
+        return (len(self.dates), len(self.sectors))
+
+    def __len__(self):
+        return len(self.dates)
+
+    # -----------------------------
+    # Slices
+    # -----------------------------
+    def code(self, sector):
+        return self._code[sector]
+
+    def column(self, sector, field="turnover"):
+        """One sector's daily series (a view, no copy)."""
+        return pd.Series(self.values[field][:, self._code[sector]], index=self.dates, name=sector)
+
+    def frame(self, field="turnover", sectors=None):
+        """(date x sector) DataFrame of one field."""
+        if sectors is None:
+            return pd.DataFrame(self.values[field], index=self.dates, columns=self.sectors.categories)
+        idx = [self._code[sector] for sector in sectors]
+        return pd.DataFrame(self.values[field][:, idx], index=self.dates, columns=list(sectors))
+
+    def between(self, start=None, end=None):
+        """Matrix of the dates in [start, end] (row slice)."""
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), side="right")
+        if lo == 0 and hi == len(self.dates):
+            return self
+        return SectorMatrix(
+            self.dates[lo:hi], self.sectors, {field: v[lo:hi] for field, v in self.values.items()}
+        )
+
+    # -----------------------------
+    # Aggregates
+    # -----------------------------
+    def totals(self, field="turnover"):
+        """Whole-period total per sector (cached)."""
+        if field not in self._totals:
+            self._totals[field] = pd.Series(
+                self.values[field].sum(axis=0), index=self.sectors.categories, name=field
+            )
+        return self._totals[field]
+
+    def top(self, n=5, field="turnover"):
+        """The n sectors with the largest total, largest first."""
+        totals = self.totals(field)
+        return list(totals.index[top_n_indices(totals.to_numpy(), n)])
+
+    def top_per_day(self, n=5, field="turnover"):
+        """(date x rank) frame of each day's n largest sectors."""
+        positions = top_n_per_row(self.values[field], n)
+        names = np.asarray(self.sectors.categories)[positions]
+        return pd.DataFrame(names, index=self.dates, columns=range(1, positions.shape[1] + 1))
+
+    def daily_totals(self):
+        """Market-wide sum of every field per date."""
+        return pd.DataFrame(
+            {f"sector_{field}": v.sum(axis=1) for field, v in self.values.items()},
+            index=self.dates,
+        )
+
+    def breadth(self, field="turnover", n=5):
+        """
+        Per date: sectors that traded, the share of the day's total in
+        its n largest sectors, and the Herfindahl index of the shares.
+        """
+        v = self.values[field]
+        total = v.sum(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = v / total[:, None]
+        shares = np.nan_to_num(shares)
+
+        k = min(n, v.shape[1])
+        top_share = -np.partition(-shares, k - 1, axis=1)[:, :k].sum(axis=1) if k else np.zeros(len(v))
+
+        return pd.DataFrame({
+            "active_sectors": (v > 0).sum(axis=1),
+            f"top{n}_share": top_share,
+            "hhi": (shares ** 2).sum(axis=1),
+        }, index=self.dates)
+
+
+class SectorMatrixBuilder:
+    """
+    Builds a SectorMatrix from long chunks without keeping them: each
+    chunk is written into growing (date x sector) arrays and dropped.
+    Memory is the matrix plus one chunk, however many rows stream in.
+
+    A (date, sector) seen again overwrites the earlier value, so a later
+    snapshot of the same day wins, like SectorStore.append().
+    """
+
+    def __init__(self, canonical=True):
+        self.canonical = canonical
+        self.rows = 0
+        self._date_row = {}
+        self._sector_col = {}
+        self._values = {}
+
+    def _grow(self, n_dates, n_sectors):
+        for field, v in self._values.items():
+            if v.shape[0] < n_dates or v.shape[1] < n_sectors:
+                # Double the date axis so appends stay amortized O(1)
+                grown = np.zeros((max(n_dates, 2 * v.shape[0]), max(n_sectors, v.shape[1])), dtype=v.dtype)
+                grown[: v.shape[0], : v.shape[1]] = v
+                self._values[field] = grown
+
+    @staticmethod
+    def _positions(keys, lookup):
+        """Row/column of every key, new keys appended to lookup."""
+        codes, uniques = pd.factorize(keys)
+        uniques = list(uniques)
+        for key in uniques:
+            lookup.setdefault(key, len(lookup))
+        return np.array([lookup[key] for key in uniques], dtype=np.intp)[codes]
+
+    def add(self, chunk):
+        if "businessDate" not in chunk.columns:
+            chunk = chunk.reset_index()
+        if chunk.empty:
+            return self
+
+        sectors = chunk["sectorName"]
+        if self.canonical:
+            from core.sectors import canonicalize_values
+            sectors = canonicalize_values(sectors)
+
+        # Dates keyed by their int64 nanoseconds, sectors by category
+        dates = chunk["businessDate"].to_numpy(dtype="datetime64[ns]").view("int64")
+        rows = self._positions(dates, self._date_row)
+        cols = self._positions(sectors.astype("category"), self._sector_col)
+
+        for column, field in FIELDS.items():
+            if column in chunk.columns and field not in self._values:
+                self._values[field] = np.zeros((0, 0))
+        self._grow(len(self._date_row), len(self._sector_col))
+
+        # Last row of each (date, sector) in the chunk
+        cell = rows * len(self._sector_col) + cols
+        _, first_from_end = np.unique(cell[::-1], return_index=True)
+        last = len(cell) - 1 - first_from_end
+
+        for column, field in FIELDS.items():
+            if column in chunk.columns:
+                self._values[field][rows[last], cols[last]] = chunk[column].to_numpy(dtype=np.float64)[last]
+
+        self.rows += len(chunk)
+        return self
+
+    def build(self):
+        """SectorMatrix with dates and sectors sorted."""
+        dates = np.array(list(self._date_row), dtype="int64").view("datetime64[ns]")
+        sectors = np.array([str(sector) for sector in self._sector_col], dtype=object)
+        date_order = np.argsort(dates, kind="stable")
+        sector_order = np.argsort(sectors, kind="stable")
+
+        values = {
+            field: v[: len(dates), : len(sectors)][np.ix_(date_order, sector_order)]
+            for field, v in self._values.items()
+        }
+        sectors = sectors[sector_order]
+        return SectorMatrix(dates[date_order], pd.Categorical(sectors, categories=sectors), values)
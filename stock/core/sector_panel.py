@@ -0,0 +1,287 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.dates import normalize_date_column
+from core.excel_cache import read_excel_cached
+from core.sectors import SECTOR_ALIASES, canonicalize_columns
+
+
+# Values of the same date and sector from two sources within this
+# relative difference agree (workbooks round index levels differently)
+REL_TOL = 1e-4
+
+# Long layout of the persisted panel, one row per filled cell
+COLUMNS = ["Date", "sector", "value", "source", "overridden"]
+
+
+def read_source(item):
+    """
+    One workbook sheet as Date + canonical sector columns. Headers that
+    aren't a known sector are dropped, and so is a repeated sector (the
+    first column wins). Module-level so run_batch() can send it to a
+    worker.
+    """
+    path, sheet = item
+    df = read_excel_cached(path, sheet_name=sheet)
+    df = canonicalize_columns(df, source=Path(path).name)
+    df = df.loc[:, ~df.columns.duplicated()]
+
+    if "Date" not in df.columns:
+        raise ValueError(f"No date column in {Path(path).name} [{sheet}]")
+    df = normalize_date_column(df)
+
+    sectors = [c for c in df.columns if c in SECTOR_ALIASES and c != "Date"]
+    out = df[["Date"]].copy()
+    for sector in sectors:
+        out[sector] = pd.to_numeric(df[sector], errors="coerce")
+    return out
+
+
+class SectorPanel:
+    """
+    Every sector index level from every source merged into one
+    (date x sector) float64 array, NaN where no source has a value.
+
+    Sources are ranked (first = most trusted). Each cell keeps the value
+    of the best-ranked source that has one; .source holds that source's
+    code and .overridden the code of the best-ranked source that
+    disagreed with it (-1 for none), so every value can be traced back
+    to a file and every conflict to the file that lost it.
+
+    .extents lists what each source supplied (values, first and last
+    date) whether or not its values were kept.
+    """
+
+    def __init__(self, dates, sectors, values, source, overridden, sources, extents=None):
+        self.dates = pd.DatetimeIndex(dates, name="Date")
+        self.sectors = list(sectors)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.source = np.ascontiguousarray(source, dtype=np.int16)
+        self.overridden = np.ascontiguousarray(overridden, dtype=np.int16)
+        self.sources = list(sources)
+        if extents is None:
+            extents = pd.DataFrame({"values": 0, "first": pd.NaT, "last": pd.NaT}, index=self.sources)
+        self.extents = extents.rename_axis("source")
+
+    @classmethod
+    def from_frames(cls, frames, rel_tol=REL_TOL):
+        """
+        Panel of (name, Date + sector columns frame) pairs, best-ranked
+        first. Within one frame an earlier row beats a later duplicate.
+        """
+        dates, sectors, values, ranks = [], [], [], []
+        names, extents = [], []
+
+        for rank, (name, df) in enumerate(frames):
+            names.append(name)
+            columns = [c for c in df.columns if c != "Date"]
+            df = df[df["Date"].notna()]
+
+            # Long rows straight from the column arrays: date-major, sector-minor
+            block = df[columns].to_numpy(dtype=np.float64)
+            day = df["Date"].to_numpy(dtype="datetime64[ns]")
+            filled = ~np.isnan(block)
+            supplied = day[filled.any(axis=1)]
+            extents.append((int(filled.sum()), supplied.min() if len(supplied) else None,
+                            supplied.max() if len(supplied) else None))
+
+            dates.append(np.repeat(day, len(columns))[filled.ravel()])
+            sectors.append(np.tile(np.asarray(columns, dtype=object), len(df))[filled.ravel()])
+            values.append(block[filled])
+            ranks.append(np.full(int(filled.sum()), rank, dtype=np.int16))
+
+        extents = pd.DataFrame(extents, columns=["values", "first", "last"], index=names)
+        extents[["first", "last"]] = extents[["first", "last"]].apply(pd.to_datetime)
+
+        if not sum(len(v) for v in values):
+            empty = np.empty((0, 0))
+            return cls([], [], empty, empty, empty, names, extents)
+
+        return cls._merge(np.concatenate(dates), np.concatenate(sectors), np.concatenate(values),
+                          np.concatenate(ranks), names, extents, rel_tol)
+
+    @classmethod
+    def _merge(cls, dates, sectors, values, ranks, names, extents, rel_tol):
+        date_codes, date_index = pd.factorize(dates, sort=True)
+        sector_codes, sector_index = pd.factorize(sectors, sort=True)
+        shape = (len(date_index), len(sector_index))
+
+        # Rows grouped by cell, best rank then row order first in each
+        cell = date_codes * shape[1] + sector_codes
+        order = np.lexsort((np.arange(len(cell)), ranks, cell))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = cell[order][1:] != cell[order][:-1]
+        winners = order[first]
+
+        grid = np.full(shape, np.nan)
+        source = np.full(shape, -1, dtype=np.int16)
+        grid.flat[cell[winners]] = values[winners]
+        source.flat[cell[winners]] = ranks[winners]
+
+        # Other sources' rows that disagree with the kept value; the
+        # best-ranked one per cell is recorded
+        kept = grid.flat[cell]
+        differs = (ranks != source.flat[cell]) & ~np.isclose(values, kept, rtol=rel_tol, atol=0)
+        losers = order[differs[order]]
+        if len(losers):
+            lead = np.ones(len(losers), dtype=bool)
+            lead[1:] = cell[losers][1:] != cell[losers][:-1]
+            losers = losers[lead]
+
+        overridden = np.full(shape, -1, dtype=np.int16)
+        overridden.flat[cell[losers]] = ranks[losers]
+
+        return cls(date_index, sector_index, grid, source, overridden, names, extents)
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def to_long(self):
+        """One row per filled cell (see COLUMNS), sources as categories."""
+        rows, cols = np.nonzero(self.source >= 0)
+        categories = pd.Index(self.sources)
+        df = pd.DataFrame({
+            "Date": self.dates[rows],
+            "sector": pd.Categorical.from_codes(cols, categories=self.sectors),
+            "value": self.values[rows, cols],
+            "source": pd.Categorical.from_codes(self.source[rows, cols], categories=categories),
+            "overridden": pd.Categorical.from_codes(self.overridden[rows, cols], categories=categories),
+        })
+
+        # Kept in the Parquet metadata, so the artifact stays one file
+        df.attrs["extents"] = {
+            "source": self.sources,
+            "values": self.extents["values"].astype(int).tolist(),
+            "first": [None if pd.isna(d) else d.isoformat() for d in self.extents["first"]],
+            "last": [None if pd.isna(d) else d.isoformat() for d in self.extents["last"]],
+        }
+        return df
+
+    @classmethod
+    def from_long(cls, df):
+        """Inverse of to_long()."""
+        date_codes, dates = pd.factorize(df["Date"], sort=True)
+        sector = pd.Categorical(df["sector"])
+        shape = (len(dates), len(sector.categories))
+
+        sources = pd.Categorical(df["source"]).categories
+        extents = None
+        if "extents" in df.attrs:
+            meta = df.attrs["extents"]
+            extents = pd.DataFrame({
+                "values": meta["values"],
+                "first": pd.to_datetime(meta["first"]),
+                "last": pd.to_datetime(meta["last"]),
+            }, index=meta["source"])
+
+        values = np.full(shape, np.nan)
+        source = np.full(shape, -1, dtype=np.int16)
+        overridden = np.full(shape, -1, dtype=np.int16)
+        rows, cols = date_codes, sector.codes
+
+        values[rows, cols] = df["value"].to_numpy(dtype=np.float64)
+        source[rows, cols] = pd.Categorical(df["source"], categories=sources).codes
+        overridden[rows, cols] = pd.Categorical(df["overridden"], categories=sources).codes
+
+        return cls(dates, sector.categories, values, source, overridden, sources, extents)
+
+    def save(self, path):
+        self.to_long().to_parquet(path)
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_long(pd.read_parquet(path, columns=COLUMNS))
+
+    # -----------------------------
+    # Slices
+    # -----------------------------
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.dates)
+
+    def _rows(self, start=None, end=None):
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), side="left")
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), side="right")
+        return slice(lo, hi)
+
+    def _cols(self, sectors=None):
+        if sectors is None:
+            return list(range(len(self.sectors)))
+        return [self.sectors.index(sector) for sector in sectors]
+
+    def between(self, start=None, end=None):
+        """Panel of the dates in [start, end] (row slice)."""
+        rows = self._rows(start, end)
+        return SectorPanel(self.dates[rows], self.sectors, self.values[rows],
+                           self.source[rows], self.overridden[rows], self.sources, self.extents)
+
+    def frame(self, start=None, end=None, sectors=None, dropna=True):
+        """
+        Date + sector levels of [start, end], the layout every loader
+        returns (e.g. load_sector_index). Dates without any value and
+        sectors without any value in the range are dropped.
+        """
+        rows, cols = self._rows(start, end), self._cols(sectors)
+        values = self.values[rows][:, cols]
+        dates = self.dates[rows]
+        names = np.asarray([self.sectors[c] for c in cols], dtype=object)
+
+        if dropna:
+            filled = ~np.isnan(values)
+            has_row, has_col = filled.any(axis=1), filled.any(axis=0)
+            values, dates, names = values[has_row][:, has_col], dates[has_row], names[has_col]
+
+        df = pd.DataFrame(values, columns=list(names))
+        df.insert(0, "Date", dates)
+        return df
+
+    def source_frame(self, start=None, end=None, sectors=None):
+        """(date x sector) name of the source each value came from."""
+        rows, cols = self._rows(start, end), self._cols(sectors)
+        names = np.asarray(self.sources + [None], dtype=object)
+        return pd.DataFrame(names[self.source[rows][:, cols]], index=self.dates[rows],
+                            columns=[self.sectors[c] for c in cols])
+
+    def span(self, source):
+        """
+        (first, last) date one source supplied values for, kept or not,
+        or None for a source without values.
+        """
+        if source not in self.extents.index:
+            return None
+        first, last = self.extents.loc[source, ["first", "last"]]
+        return None if pd.isna(first) else (first, last)
+
+    # -----------------------------
+    # Report
+    # -----------------------------
+    def coverage(self):
+        """
+        Per source: values supplied, cells kept, cells it won against a
+        disagreeing source, cells it lost that way, and the first and
+        last date it supplied.
+        """
+        size = len(self.sources)
+        kept = np.bincount(self.source[self.source >= 0], minlength=size)
+        won = np.bincount(self.source[self.overridden >= 0], minlength=size)
+        lost = np.bincount(self.overridden[self.overridden >= 0], minlength=size)
+
+        df = self.extents.reindex(self.sources)
+        return pd.DataFrame({
+            "supplied": df["values"].to_numpy(),
+            "kept": kept,
+            "won conflicts": won,
+            "lost conflicts": lost,
+            "first": df["first"].to_numpy(),
+            "last": df["last"].to_numpy(),
+        }, index=pd.Index(self.sources, name="source"))
+
+    def conflicts(self):
+        """Long rows of every cell where two sources disagreed."""
+        df = self.to_long()
+        return df[df["overridden"].notna()].reset_index(drop=True)
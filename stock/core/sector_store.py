@@ -0,0 +1,204 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+
+
+# -----------------------------
+# Schema
+# -----------------------------
+KEY = ["businessDate", "sectorName"]
+
+DTYPES = {
+    "sectorName": "category",
+    "turnOverValues": "float64",
+    "turnOverVolume": "int64",
+    "totalTransaction": "int64",
+}
+
+# Rows with an epoch-like date are placeholders from the API
+MIN_YEAR = 2000
+
+# Streaming reads of the scraper CSV keep chunks small: one code per
+# sector name, float32 amounts and int32 counts
+CSV_DTYPES = {
+    "sectorName": "category",
+    "turnOverValues": "float32",
+    "turnOverVolume": "int32",
+    "totalTransaction": "int32",
+}
+
+
+def normalize_rows(df):
+    """
+    Raw API/CSV rows -> store schema: one parsed businessDate, compact
+    dtypes, junk dates dropped. The scraper's duplicate business_date
+    column only fills in a missing businessDate. Missing or non-numeric
+    amounts and counts become 0, like in iter_csv(), so one bad row
+    from the API can't fail a whole append.
+    """
+    df = df.copy()
+
+    dates = pd.to_datetime(df["businessDate"], errors="coerce")
+    if "business_date" in df.columns:
+        dates = dates.fillna(pd.to_datetime(df["business_date"], errors="coerce"))
+
+    df["businessDate"] = dates.astype("datetime64[ns]")
+    df = df[df["businessDate"].dt.year >= MIN_YEAR]
+
+    df = df[KEY + [c for c in DTYPES if c != "sectorName"]]
+    for column in DTYPES:
+        if column != "sectorName":
+            df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0)
+    return df.astype(DTYPES)
+
+
+def iter_csv(path, chunksize=100_000, dtypes=CSV_DTYPES):
+    """
+    Scraper CSV as chunks of (businessDate, sectorName, values) with
+    `dtypes` (compact CSV_DTYPES by default) and one parsed
+    businessDate. The duplicate business_date column only fills a
+    missing businessDate and is then dropped; junk dates are removed
+    like in normalize_rows(). Memory stays at about one chunk whatever
+    the size of the file.
+    """
+    columns = set(pd.read_csv(path, nrows=0).columns)
+    usecols = [c for c in ["businessDate", "business_date", *dtypes] if c in columns]
+
+    # Counts are parsed as float64 (fast, and an empty cell doesn't fail
+    # the chunk) and narrowed to their integer type below
+    counts = [c for c, t in dtypes.items() if pd.api.types.is_integer_dtype(t)]
+    dtype = {c: ("float64" if c in counts else t) for c, t in dtypes.items() if c in columns}
+
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=usecols, dtype=dtype):
+        dates = pd.to_datetime(chunk.pop("businessDate"), errors="coerce")
+        if "business_date" in chunk.columns:
+            fallback = chunk.pop("business_date")
+            missing = dates.isna()
+            if missing.any():
+                dates[missing] = pd.to_datetime(fallback[missing], errors="coerce")
+        chunk.insert(0, "businessDate", dates.astype("datetime64[ns]"))
+
+        chunk = chunk[chunk["businessDate"].dt.year >= MIN_YEAR]
+        for column in counts:
+            if column in chunk.columns:
+                chunk[column] = chunk[column].fillna(0).astype(dtypes[column])
+
+        yield chunk.reset_index(drop=True)
+
+
+class SectorStore:
+    """
+    Sector-wise daily data partitioned into one Parquet file per month
+    (root/YYYY-MM.parquet).
+
+    append() rewrites only the months it touches, deduplicates on
+    (businessDate, sectorName) with the newest row winning, and swaps
+    each file in atomically. read() opens only the months overlapping
+    the requested date range.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    # -----------------------------
+    # Partitions
+    # -----------------------------
+    def _partition_path(self, month):
+        return self.root / f"{month}.parquet"
+
+    def months(self):
+        if not self.root.exists():
+            return []
+        return sorted(p.stem for p in self.root.glob("*.parquet"))
+
+    def is_empty(self):
+        return not self.months()
+
+    def _read_partition(self, month, filters=None):
+        df = pd.read_parquet(self._partition_path(month), filters=filters)
+        return df.astype(DTYPES)
+
+    def _write_partition(self, month, df):
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        path = self._partition_path(month)
+        tmp = path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+    def append(self, df):
+        """
+        Upsert rows (raw or normalized). Returns the number of rows kept.
+        """
+        df = normalize_rows(df)
+        if df.empty:
+            return 0
+
+        month_keys = df["businessDate"].dt.strftime("%Y-%m")
+
+        for month, new_rows in df.groupby(month_keys, sort=True):
+            if self._partition_path(month).exists():
+                new_rows = pd.concat([self._read_partition(month), new_rows], ignore_index=True)
+
+            merged = (
+                new_rows.astype({"sectorName": "string"})
+                .drop_duplicates(KEY, keep="last")
+                .sort_values(KEY)
+                .astype(DTYPES)
+                .reset_index(drop=True)
+            )
+            self._write_partition(month, merged)
+
+        return len(df)
+
+    def import_csv(self, path, chunksize=100_000):
+        """
+        Load a scraper CSV chunk by chunk (iter_csv() with the store's
+        full-precision dtypes). Safe to re-run, rows are deduplicated.
+        """
+        total = 0
+        for chunk in iter_csv(path, chunksize, dtypes=DTYPES):
+            total += self.append(chunk)
+        return total
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    def iter_months(self):
+        """Every partition in date order, one month in memory at a time."""
+        for month in self.months():
+            yield self._read_partition(month)
+
+    def read(self, start=None, end=None, sectors=None):
+        """
+        Rows with start <= businessDate <= end, optionally limited to
+        some sectors. Whole months outside the range are never opened and
+        the filters are pushed down into the Parquet reader.
+        """
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+
+        months = self.months()
+        if start is not None:
+            months = [m for m in months if m >= start.strftime("%Y-%m")]
+        if end is not None:
+            months = [m for m in months if m <= end.strftime("%Y-%m")]
+
+        filters = []
+        if start is not None:
+            filters.append(("businessDate", ">=", start))
+        if end is not None:
+            filters.append(("businessDate", "<=", end))
+        if sectors is not None:
+            filters.append(("sectorName", "in", list(sectors)))
+
+        frames = [self._read_partition(m, filters or None) for m in months]
+        if not frames:
+            return normalize_rows(pd.DataFrame(columns=KEY + list(DTYPES)[1:]))
+
+        df = pd.concat(frames, ignore_index=True)
+        return df.astype(DTYPES)
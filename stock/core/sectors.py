@@ -0,0 +1,155 @@
+import re
+from collections import defaultdict
+from difflib import get_close_matches
+from functools import lru_cache
+
+import pandas as pd
+
+
+# -----------------------------
+# Canonical sector taxonomy
+# -----------------------------
+# canonical name -> spellings seen in NEPSE sheets, the sector API and
+# older workbooks. Matching ignores case, punctuation, spacing and a
+# trailing "index"/"sub-index", so only genuinely different words are
+# listed here.
+SECTOR_ALIASES = {
+    "Date": ["date", "business date", "businessdate"],
+
+    "NEPSE": ["nepse", "nepse index"],
+    "Sensitive": ["sensitive"],
+    "Float": ["float"],
+    "Sensitive Float": ["sensitive float"],
+
+    "Banking": ["banking", "commercial bank", "commercial banks", "com bank", "bank"],
+    "Development Bank": ["development bank", "development banks", "dev bank"],
+    "Finance": ["finance"],
+    "Microfinance": ["microfinance", "micro finance"],
+
+    "Hotels and Tourism": ["hotels and tourism", "hotels", "hotel", "hotels tourism"],
+    "Hydro Power": ["hydro power", "hydropower", "hydro"],
+    "Manufacturing and Processing": [
+        "manufacturing and processing", "manufacturing", "manufact",
+    ],
+    "Trading": ["trading", "tradings"],
+    "Others": ["others", "other"],
+    "Investment": ["investment"],
+
+    "Insurance": ["insurance"],
+    "Life Insurance": ["life insurance"],
+    "Non-Life Insurance": ["non life insurance", "nonlife insurance"],
+
+    "Mutual Fund": ["mutual fund", "mutual funds"],
+    "Corporate Debenture": ["corporate debenture", "corporate debentures", "debenture"],
+    "Promoter Share": ["promoter share", "promoter shares"],
+    "Preference Share": ["preference share", "preference shares"],
+}
+
+FUZZY_CUTOFF = 0.85
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+_SUFFIX = re.compile(r"(sub)?index$")
+
+
+def header_key(name):
+    """
+    Folded lookup key: casefold, "&" -> "and", drop punctuation,
+    whitespace, hyphens and newlines, then a trailing "index".
+    """
+    key = str(name).casefold().replace("&", "and")
+    key = _SEPARATORS.sub("", key)
+    stripped = _SUFFIX.sub("", key)
+    return stripped or key
+
+
+_LOOKUP = {
+    header_key(alias): canonical
+    for canonical, aliases in SECTOR_ALIASES.items()
+    for alias in [canonical, *aliases]
+}
+
+# header -> sources where it could not be mapped
+_UNMAPPED = defaultdict(set)
+
+
+@lru_cache(maxsize=None)
+def canonical_sector(name):
+    """
+    Canonical name for a header, or None when it isn't a known sector.
+
+    Exact folded matches are tried first, then a close fuzzy match.
+    Results are memoized for the life of the process.
+    """
+    key = header_key(name)
+    if key in _LOOKUP:
+        return _LOOKUP[key]
+
+    match = get_close_matches(key, list(_LOOKUP), n=1, cutoff=FUZZY_CUTOFF)
+    if match:
+        return _LOOKUP[match[0]]
+
+    return None
+
+
+# -----------------------------
+# DataFrame helpers
+# -----------------------------
+def clean_header(name):
+    """Trim and fold newlines/repeated spaces, keep the original words."""
+    return " ".join(str(name).replace("\n", " ").split())
+
+
+def canonicalize_columns(df, source=None):
+    """
+    Rename known sector (and date) columns to canonical names in place.
+    Unknown headers keep their cleaned text and are recorded for
+    unmapped_report().
+    """
+    columns = []
+    for col in df.columns:
+        canonical = canonical_sector(col)
+        if canonical is None:
+            canonical = clean_header(col)
+            _UNMAPPED[canonical].add(str(source) if source is not None else "?")
+        columns.append(canonical)
+
+    df.columns = columns
+    return df
+
+
+def canonicalize_values(series):
+    """
+    Canonical names for a column of sector names (categorical or text),
+    converting each distinct value once.
+    """
+    categories = pd.Series(series.astype("category").cat.categories)
+    mapping = {c: canonical_sector(c) or clean_header(c) for c in categories}
+    return series.map(mapping).astype("category")
+
+
+def unmapped_report():
+    """
+    DataFrame of headers that matched no sector, with the files they
+    came from.
+    """
+    return pd.DataFrame(
+        [(header, ", ".join(sorted(sources))) for header, sources in sorted(_UNMAPPED.items())],
+        columns=["Header", "Sources"],
+    )
+
+
+def merge_unmapped(report):
+    """
+    Fold an unmapped_report() from another process into this one.
+    """
+    for header, sources in report.itertuples(index=False):
+        _UNMAPPED[header].update(sources.split(", "))
+
+
+def print_unmapped_report():
+    report = unmapped_report()
+    if report.empty:
+        return
+
+    print("\n================ UNMAPPED HEADERS ================\n")
+    print(report.to_string(index=False))
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+class OffsetStack:
+    """
+    Several (date x sector) frames - years, or windows around events -
+    lined up by trading-day offset in one (label x offset x sector)
+    float64 array. Offset 0 is each frame's first row, or its event row
+    when origins are given; days a frame doesn't cover are NaN.
+    """
+
+    def __init__(self, values, labels, offsets, sectors):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.labels = list(labels)
+        self.offsets = np.asarray(offsets)
+        self.sectors = list(sectors)
+
+    @classmethod
+    def from_frames(cls, frames, origins=None, sectors=None, how="inner"):
+        """
+        frames: {label: DataFrame of sector columns} (a Date column is
+        ignored). origins: {label: row position of offset 0}, default 0.
+        sectors=None keeps the sectors every frame has (how="inner") or
+        any frame has (how="outer").
+        """
+        origins = origins or {}
+        frames = {
+            label: df.drop(columns=[c for c in df.columns if str(c).lower() == "date"])
+            for label, df in frames.items()
+        }
+
+        if sectors is None:
+            sets = [set(df.columns) for df in frames.values()]
+            sectors = set.intersection(*sets) if how == "inner" else set.union(*sets)
+            sectors = sorted(sectors)
+
+        starts = {label: -origins.get(label, 0) for label in frames}
+        first = min(starts.values())
+        last = max(starts[label] + len(df) for label, df in frames.items())
+
+        values = np.full((len(frames), last - first, len(sectors)), np.nan)
+        for i, (label, df) in enumerate(frames.items()):
+            block = df.reindex(columns=sectors).to_numpy(dtype=np.float64)
+            row = starts[label] - first
+            values[i, row:row + len(block)] = block
+
+        return cls(values, frames, np.arange(first, last), sectors)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def pct_change(self):
+        """Daily % change along the offset axis (the first offset dropped)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = (self.values[:, 1:] / self.values[:, :-1] - 1) * 100
+        return OffsetStack(changes, self.labels, self.offsets[1:], self.sectors)
+
+    def take(self, sectors):
+        """Stack with only these sectors (a copy, small enough to pickle)."""
+        idx = [self.sectors.index(sector) for sector in sectors]
+        return OffsetStack(self.values[:, :, idx].copy(), self.labels, self.offsets, sectors)
+
+    def frame(self, label):
+        """One label as an (offset x sector) DataFrame."""
+        i = self.labels.index(label)
+        return pd.DataFrame(self.values[i], index=pd.Index(self.offsets, name="offset"), columns=self.sectors)
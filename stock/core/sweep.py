@@ -0,0 +1,195 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from core.drawdown import drawdown_array
+from core.panel import ReturnPanel
+from core.rotation import portfolio_returns, sharpe_ratio
+
+
+# =============================
+# STATS
+# =============================
+
+def run_stats(returns):
+    """
+    Headline stats of one daily return array, numpy only.
+    """
+    equity = np.cumprod(1 + returns)
+
+    return {
+        "Total Return %": (equity[-1] - 1) * 100,
+        "Max Drawdown %": drawdown_array(equity).min() * 100,
+        "Sharpe Ratio": sharpe_ratio(returns),
+    }, equity
+
+
+def _run_group(panel, lookback, params):
+    momentum = panel.momentum(lookback)
+
+    out = []
+    for run, cost, rebalance, top_n in params:
+        returns = portfolio_returns(
+            panel.daily_returns, momentum,
+            top_n=top_n, rebalance=rebalance, transaction_cost=cost,
+        )
+        stats, equity = run_stats(returns)
+        row = {
+            "Run": run,
+            "Lookback": lookback,
+            "Cost": cost,
+            "Rebalance": rebalance,
+            "Top N": top_n,
+            **stats,
+        }
+        out.append((row, equity))
+    return out
+
+
+# =============================
+# WORKERS (shared price arrays)
+# =============================
+
+_WORKER = {}
+
+
+def _init_worker(shm_name, shape):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = np.ndarray((2, *shape), dtype=np.float64, buffer=shm.buf)
+    arrays.flags.writeable = False
+
+    _WORKER["shm"] = shm
+    _WORKER["panel"] = ReturnPanel(arrays[0], log_prices=arrays[1])
+
+
+def _worker_group(lookback, params):
+    return _run_group(_WORKER["panel"], lookback, params)
+
+
+# =============================
+# SWEEP
+# =============================
+
+def _grid(lookbacks, costs, rebalances, top_ns, n_sectors):
+    """
+    Group the grid by lookback so each momentum array is built once.
+    Run ids follow grid order, so they don't depend on which worker
+    finishes first. Top N values outside 1..n_sectors are reported and
+    left out (they would hold fewer positions than asked).
+    """
+    dropped = sorted({int(n) for n in top_ns if not 1 <= n <= n_sectors})
+    if dropped:
+        print(f"⚠️  Top N {dropped} skipped: only 1..{n_sectors} sectors available")
+
+    params = [
+        (float(c), int(r), int(n))
+        for c, r, n in itertools.product(costs, rebalances, top_ns)
+        if 1 <= n <= n_sectors
+    ]
+
+    groups = []
+    for i, lb in enumerate(lookbacks):
+        start = i * len(params)
+        groups.append((int(lb), [(start + j, *p) for j, p in enumerate(params)]))
+    return groups
+
+
+# Tasks per worker: enough to balance uneven lookbacks, few enough
+# that each task's pickling and scheduling stays small next to its runs
+TASKS_PER_WORKER = 4
+MIN_TASK_RUNS = 8
+
+
+def _tasks(groups, workers):
+    """
+    Split every lookback group into chunks sized so the whole grid makes
+    about workers * TASKS_PER_WORKER tasks. A chunk never mixes
+    lookbacks; each worker builds a lookback's momentum at most once.
+    """
+    total = sum(len(params) for _, params in groups)
+    size = max(MIN_TASK_RUNS, -(-total // (workers * TASKS_PER_WORKER)))
+    return [
+        (lookback, params[i:i + size])
+        for lookback, params in groups
+        for i in range(0, len(params), size)
+    ]
+
+
+def iter_sweep(df_base, lookbacks, costs=(0.002,), rebalances=(1,), top_ns=(1,), workers=None):
+    """
+    Yield (row, equity_curve) for every grid point as runs finish.
+
+    df_base may be a DataFrame or a ReturnPanel. workers=None uses every
+    core, workers=1 runs in this process. Workers read prices and log
+    prices from one shared-memory block instead of a copy per task.
+    """
+    if isinstance(df_base, ReturnPanel):
+        panel = df_base
+    else:
+        panel = ReturnPanel.from_frame(df_base)
+
+    groups = _grid(lookbacks, costs, rebalances, top_ns, panel.shape[1])
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = _tasks(groups, max(workers, 1))
+    workers = min(workers, len(tasks))
+
+    if workers <= 1:
+        for lookback, params in groups:
+            yield from _run_group(panel, lookback, params)
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=2 * panel.prices.nbytes)
+    try:
+        shared = np.ndarray((2, *panel.shape), dtype=np.float64, buffer=shm.buf)
+        shared[0] = panel.prices
+        shared[1] = panel.log_prices
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shm.name, panel.shape),
+        ) as pool:
+            futures = [pool.submit(_worker_group, lb, params) for lb, params in tasks]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def rotation_sweep(df_base, lookbacks, costs=(0.002,), rebalances=(1,), top_ns=(1,),
+                   workers=None, rank_by="Sharpe Ratio"):
+    """
+    Run the full grid and return (table, curves).
+
+    table has one row per run ranked by rank_by (best first), with a
+    "Run" column naming its equity curve in curves (date x run).
+    """
+    if isinstance(df_base, ReturnPanel):
+        panel = df_base
+    else:
+        panel = ReturnPanel.from_frame(df_base)
+
+    rows = []
+    curves = {}
+
+    for row, equity in iter_sweep(panel, lookbacks, costs, rebalances, top_ns, workers):
+        rows.append(row)
+        curves[row["Run"]] = equity
+
+    table = pd.DataFrame(rows)
+    if not table.empty:
+        table = table.sort_values(
+            [rank_by, "Run"],
+            ascending=[False, True],
+            na_position="last",
+        ).reset_index(drop=True)
+
+    curves = pd.DataFrame(dict(sorted(curves.items())), index=panel.index)
+    return table, curves
@@ -0,0 +1,294 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# -----------------------------
+# Settings
+# -----------------------------
+# STOCK_TRACE=1 writes a JSON trace to .cache/traces when the script
+# exits; any other value is used as the output path.
+# STOCK_PROFILE=1 also runs cProfile around each outermost stage; stages
+# nested in it are part of that profile
+# (STOCK_PROFILE=pyinstrument uses pyinstrument if it is installed).
+# Same .cache root as core.excel_cache, without importing pandas here
+STOCK_DIR = Path(__file__).resolve().parents[1]
+TRACE_DIR = Path(os.environ.get("STOCK_CACHE_DIR", STOCK_DIR / ".cache" / "excel")).parent / "traces"
+
+# Long-running processes (serve) keep only the newest records
+MAX_RECORDS = 10_000
+
+_RECORDS = []
+_DROPPED = 0          # records trimmed off the front so far
+_LOCAL = threading.local()  # .stack: names of the open stages, per thread
+_SCRIPT = None
+_LOCK = threading.Lock()
+_PROFILING = False    # only one profiler can run per process
+
+
+def _trace_setting():
+    return os.environ.get("STOCK_TRACE")
+
+
+def _profile_setting():
+    return os.environ.get("STOCK_PROFILE")
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# -----------------------------
+# Profilers
+# -----------------------------
+class _Profiler:
+    """
+    Profiles one stage. A stage that starts while another is being
+    profiled (a nested stage, or one on another server thread) isn't
+    profiled itself: Python 3.12+ refuses a second active cProfile and
+    earlier versions would cut the outer profile short.
+    """
+
+    def __init__(self, name):
+        global _PROFILING
+        self.name = name
+        self.kind = _profile_setting()
+        self.profiler = None
+
+        with _LOCK:
+            if not self.kind or _PROFILING:
+                self.kind = None
+                return
+            _PROFILING = True
+
+        if self.kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+                self.profiler = Profiler()
+            except ImportError:
+                print("⚠️  pyinstrument not installed, using cProfile")
+                self.kind = "1"
+
+        if self.kind and self.profiler is None:
+            import cProfile
+            self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        global _PROFILING
+        if self.profiler is not None:
+            try:
+                if self.kind == "pyinstrument":
+                    self.profiler.start()
+                else:
+                    self.profiler.enable()
+            except (RuntimeError, ValueError) as e:
+                # e.g. a debugger or coverage tool already profiling
+                print(f"⚠️  Not profiling {self.name}: {e}")
+                self.profiler = None
+                with _LOCK:
+                    _PROFILING = False
+        return self
+
+    def __exit__(self, *exc):
+        global _PROFILING
+        if self.profiler is None:
+            return
+
+        try:
+            self._write()
+        finally:
+            with _LOCK:
+                _PROFILING = False
+
+    def _write(self):
+        TRACE_DIR.mkdir(parents=True, exist_ok=True)
+        stem = f"{_SCRIPT or 'script'}_{self.name.replace('/', '-')}_{os.getpid()}"
+
+        if self.kind == "pyinstrument":
+            self.profiler.stop()
+            out = TRACE_DIR / f"{stem}.html"
+            out.write_text(self.profiler.output_html())
+        else:
+            self.profiler.disable()
+            out = TRACE_DIR / f"{stem}.prof"
+            self.profiler.dump_stats(out)
+
+        print(f"🔎 Profile for {self.name}: {out}")
+
+
+# -----------------------------
+# Stages
+# -----------------------------
+class Stage:
+    """One timed block. Set .rows inside the block to record its size."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, rows={self.rows})"
+
+
+def _stack():
+    if not hasattr(_LOCAL, "stack"):
+        _LOCAL.stack = []
+    return _LOCAL.stack
+
+
+@contextmanager
+def stage(name, rows=None):
+    """
+    Time a block and record its wall time, peak RSS and row count:
+
+        with stage("load") as s:
+            df = pd.read_excel(...)
+            s.rows = len(df)
+
+    Nested stages are recorded as "outer/inner". Each thread nests its
+    own stages, so server requests don't mix.
+    """
+    stack = _stack()
+    current = Stage("/".join([*stack, name]))
+    current.rows = rows
+    stack.append(name)
+
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        with _Profiler(current.name):
+            yield current
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        wall = time.perf_counter() - start
+        stack.pop()
+
+        rss_after = peak_rss_mb()
+        _append({
+            "stage": current.name,
+            "status": status,
+            "wall_s": round(wall, 6),
+            "peak_rss_mb": None if rss_after is None else round(rss_after, 1),
+            "rss_growth_mb": None if rss_after is None else round(rss_after - rss_before, 1),
+            "rows": None if current.rows is None else int(current.rows),
+            "pid": os.getpid(),
+        })
+
+
+def traced(name=None):
+    """Decorator form of stage(); the stage is named after the function."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# -----------------------------
+# Trace output
+# -----------------------------
+def _append(*new):
+    """Add records, trimming the oldest beyond MAX_RECORDS."""
+    global _DROPPED
+    with _LOCK:
+        _RECORDS.extend(new)
+        extra = len(_RECORDS) - MAX_RECORDS
+        if extra > 0:
+            del _RECORDS[:extra]
+            _DROPPED += extra
+
+
+def records():
+    return list(_RECORDS)
+
+
+def mark():
+    """Position of the next record, stable across trimming (see take_records)."""
+    return _DROPPED + len(_RECORDS)
+
+
+def take_records(since=0):
+    """Remove and return the records added after mark() returned `since`."""
+    with _LOCK:
+        start = max(since - _DROPPED, 0)
+        taken = _RECORDS[start:]
+        del _RECORDS[start:]
+    return taken
+
+
+def merge_records(other):
+    """Fold records collected in another process (see core.batch)."""
+    _append(*other)
+
+
+def trace_document():
+    return {
+        "script": _SCRIPT,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "argv": sys.argv,
+        "stages": records(),
+    }
+
+
+def write_trace(path=None):
+    if path is None:
+        TRACE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = TRACE_DIR / f"{_SCRIPT or 'script'}_{stamp}.json"
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(trace_document(), indent=2, default=str))
+    return path
+
+
+def print_trace():
+    print("\n================ STAGE TIMINGS ================\n")
+    print(f"{'stage':<36}{'wall s':>10}{'peak MB':>10}{'rows':>12}")
+    for rec in _RECORDS:
+        rows = "" if rec["rows"] is None else f"{rec['rows']:,}"
+        peak = "" if rec["peak_rss_mb"] is None else f"{rec['peak_rss_mb']:.0f}"
+        name = rec["stage"] if rec["status"] == "ok" else f"{rec['stage']} ❌"
+        print(f"{name:<36}{rec['wall_s']:>10.3f}{peak:>10}{rows:>12}")
+
+
+def _at_exit():
+    setting = _trace_setting()
+    if not setting or not _RECORDS:
+        return
+
+    print_trace()
+    path = write_trace(None if setting == "1" else setting)
+    print(f"\n🧾 Trace written to {path}")
+
+
+def enable(script_name):
+    """
+    Name the trace after the calling script and, when STOCK_TRACE is
+    set, write it out at exit. Stages are recorded either way.
+    """
+    global _SCRIPT
+    _SCRIPT = script_name
+    atexit.register(_at_exit)
@@ -0,0 +1,6 @@
+"""
+Reports behind cli.py and the old top-level scripts. Each module has
+plain load / normalize / analytics / render functions and a run()
+that prints the report, with pandas and matplotlib imported only when
+a report actually runs.
+"""
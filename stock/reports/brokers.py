@@ -0,0 +1,115 @@
+import os
+from datetime import datetime
+
+from core.trace import stage
+
+TOP_N = 10
+
+SIDES = {"abs": "Net Trading Percentage", "buy": "Net Buy Percentage", "sell": "Net Sell Percentage"}
+
+
+# -----------------------------
+# Analytics
+# -----------------------------
+
+def flow_summary(flows):
+    """Per period: brokers that traded, total amount and HHI of the brokers' shares."""
+    import pandas as pd
+
+    total = flows.field("total")
+    return pd.DataFrame({
+        "brokers": (total > 0).sum(axis=1),
+        "total": total.sum(axis=1),
+        "hhi": flows.hhi("total"),
+    }, index=flows.periods)
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def get_unique_filename(base_name, ext=".png", out_dir="."):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(out_dir, f"{base_name}_{timestamp}{ext}")
+
+
+def render_net_percentage(df, out_dir="."):
+    """Horizontal net buy / net sell bars, reusing an identical earlier chart."""
+    import numpy as np
+    from core.render import new_figure, render
+
+    y = np.arange(len(df))
+
+    net_buy_pct = df["net_pct"].clip(lower=0)
+    net_sell_pct = df["net_pct"].clip(upper=0)
+
+    def draw():
+        fig, ax = new_figure("bars")
+
+        ax.barh(y, net_buy_pct, label="Net Buy %")
+        ax.barh(y, net_sell_pct, label="Net Sell %")
+
+        ax.set_yticks(y, df["member"])
+        ax.set_xlabel("Net Trading Percentage (%)")
+        ax.set_title(f"Top {len(df)} Brokers by Net Buy/Sell Percentage")
+        ax.axvline(0)
+
+        ax.legend()
+        fig.tight_layout()
+        return fig
+
+    return render(
+        get_unique_filename("Broker_Net_Percentage", out_dir=out_dir),
+        draw,
+        data=[df[["member", "net_pct"]]],
+        history=os.path.join(out_dir, "Broker_Net_Percentage_*.png"),
+    )
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def run(datasets, top_n=TOP_N, period=None, side="abs", out_dir=".", charts=True):
+    """
+    Top brokers by net buy/sell percentage (formerly xlsxCheck.py) in
+    one period (default: the latest), with broker concentration per
+    period and the biggest changes in net flow since the previous one.
+    """
+    import pandas as pd
+
+    with stage("brokers"):
+        flows = datasets.get("broker_flows")
+        period = period or flows.periods[-1]
+
+        with stage("compute/net_pct") as s:
+            top = flows.top(top_n, period=period, by="net_pct", side=side)
+            s.rows = flows.shape[1]
+
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(f"\nTop {top_n} Brokers by {SIDES[side]} ({period}):\n")
+            print(top[["member", "net_pct"]].to_string(index=False))
+        print("\nRows:", len(top))
+
+        with stage("compute/concentration"):
+            summary = flow_summary(flows)
+        print("\nBroker concentration per period:\n")
+        print(summary.to_string(formatters={"total": "{:,.0f}".format, "hhi": "{:.4f}".format}))
+
+        if len(flows) > 1:
+            print("\nTop 3 net buyers per period:\n")
+            print(flows.top_per_period(3, "net", side="buy").to_string())
+
+        if len(flows) > 1 and flows.periods.get_loc(period) > 0:
+            changes = flows.top_changes(top_n, "net", period=period)
+            print(f"\nLargest changes in net flow into {period}:\n")
+            print(changes.to_string(float_format="{:,.0f}".format))
+
+        if charts:
+            with stage("render"):
+                output_file, rendered = render_net_percentage(top, out_dir)
+
+            if rendered:
+                print(f"\nChart saved as {output_file}")
+            else:
+                print(f"\nChart unchanged: {output_file}")
+
+    return {"top": top, "summary": summary}
@@ -0,0 +1,371 @@
+import json
+import os
+from functools import partial
+from pathlib import Path
+
+from core.trace import stage
+
+
+# -----------------------------
+# Paths
+# -----------------------------
+STOCK_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = STOCK_DIR / "data"
+
+ANNUAL_DIR = DATA_DIR / "annual"
+SECTOR_INDEX_FILE = ANNUAL_DIR / "main.xlsx"
+NONELECTION_DIR = DATA_DIR / "nonelection"
+EVENT_DIR = DATA_DIR / "finance"
+BROKER_FILE = STOCK_DIR / "1901522e5b7428bf3c331b51de40378e.xlsx"
+BROKER_DIR = DATA_DIR / "brokers"
+MARKET_CAP_FILE = STOCK_DIR / "data.json"
+MARKET_SUMMARY_FILE = STOCK_DIR / "marketsummary.json"
+SECTOR_CSV = STOCK_DIR / "nepse_sector_data.csv"
+SECTOR_STORE_DIR = DATA_DIR / "sector_store"
+# Same .cache root as core.excel_cache, without importing pandas here
+AGGREGATE_DIR = Path(os.environ.get("STOCK_CACHE_DIR", STOCK_DIR / ".cache" / "excel")).parent / "aggregates"
+
+
+# -----------------------------
+# Loaders
+# -----------------------------
+# Each loader returns a cleaned DataFrame. pandas and the core helpers
+# are imported inside, so importing this module stays cheap.
+
+def load_sector_index(path=SECTOR_INDEX_FILE):
+    """Daily sector index levels (main.xlsx) with canonical names, sorted by Date."""
+    import pandas as pd
+    from core.excel_cache import read_excel_cached
+    from core.sectors import canonicalize_columns
+
+    df = read_excel_cached(path, sheet_name="Sheet1")
+    df = canonicalize_columns(df, source=Path(path).name)
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    return df.sort_values("Date").reset_index(drop=True)
+
+
+def load_year(path):
+    """One data/nonelection/dataYYYY.xlsx with canonical sector names."""
+    import pandas as pd
+    from core.excel_cache import read_excel_cached
+    from core.sectors import canonicalize_columns
+
+    df = read_excel_cached(path)
+    df = canonicalize_columns(df, source=Path(path).name)
+    if "Date" in df.columns:
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    return df
+
+
+def broker_workbooks(broker_file=BROKER_FILE, broker_dir=BROKER_DIR):
+    """The original broker workbook plus every workbook in data/brokers."""
+    files = [Path(broker_file)] if Path(broker_file).exists() else []
+    if Path(broker_dir).exists():
+        files += sorted(Path(broker_dir).glob("*.xlsx"))
+    return files
+
+
+def load_broker_flows(paths=None, workers=None):
+    """
+    Every broker table of every broker workbook as a (period x broker)
+    BrokerFlows matrix, one workbook per worker process.
+    """
+    import pandas as pd
+    from core.batch import run_batch
+    from core.broker_flows import BrokerFlows, read_workbook
+
+    paths = broker_workbooks() if paths is None else paths
+    if not paths:
+        raise FileNotFoundError(f"No broker workbooks ({BROKER_FILE.name} or {BROKER_DIR}/*.xlsx)")
+
+    frames = []
+    for res in run_batch(read_workbook, paths, workers=workers):
+        if res["status"] == "error":
+            print(f"⚠️  Skipped {Path(res['item']).name}: {res['error']}")
+        else:
+            frames.append(res["result"])
+
+    return BrokerFlows.from_long(pd.concat(frames, ignore_index=True))
+
+
+def load_json_table(path):
+    """data.json / marketsummary.json as a DataFrame indexed by businessDate."""
+    import pandas as pd
+
+    with open(path, "r") as file:
+        df = pd.DataFrame(json.load(file))
+
+    df["businessDate"] = pd.to_datetime(df["businessDate"])
+    return df.set_index("businessDate").sort_index()
+
+
+def load_sector_turnover(store_dir=SECTOR_STORE_DIR, csv_path=SECTOR_CSV, start=None, end=None):
+    """Daily turnover per sector from the Parquet store (imported from the CSV once)."""
+    from core.sector_store import SectorStore
+    from core.sectors import canonicalize_values
+
+    store = SectorStore(store_dir)
+    if store.is_empty():
+        store.import_csv(csv_path)
+
+    # Parsed dates and junk rows are already handled by the store
+    df = store.read(start, end)
+    df["sectorName"] = canonicalize_values(df["sectorName"])
+    return df.set_index("businessDate").sort_index()
+
+
+def load_sector_matrix(store_dir=SECTOR_STORE_DIR, csv_path=SECTOR_CSV):
+    """
+    Sector turnover pivoted into a (date x sector) SectorMatrix, streamed
+    one store month at a time, or straight from the CSV in chunks when
+    there is no store yet.
+    """
+    from core.sector_matrix import SectorMatrix
+    from core.sector_store import SectorStore
+
+    store = SectorStore(store_dir)
+    if store.is_empty():
+        return SectorMatrix.from_csv(csv_path)
+    return SectorMatrix.from_chunks(store.iter_months())
+
+
+def build_daily_aggregates(matrix, df_cap=None, df_sum=None):
+    """
+    One row per business date: market cap, market summary, sector
+    totals and breadth. Sources that aren't available are left out.
+    """
+    import pandas as pd
+
+    parts = [df for df in (df_cap, df_sum) if df is not None]
+    parts += [matrix.daily_totals(), matrix.breadth()]
+
+    df = pd.concat(parts, axis=1).sort_index()
+    df.index.name = "businessDate"
+    return df
+
+
+def _aggregate_sources():
+    return [MARKET_CAP_FILE, MARKET_SUMMARY_FILE] + _store_files()
+
+
+def load_daily_aggregates(cache_dir=AGGREGATE_DIR):
+    """
+    build_daily_aggregates() of every available source, persisted as
+    Parquet and rebuilt only when a source file changes.
+    """
+    import hashlib
+
+    import pandas as pd
+
+    state = hashlib.sha1(repr(file_signature(_aggregate_sources())).encode()).hexdigest()[:12]
+    path = Path(cache_dir) / f"daily-{state}.parquet"
+    if path.exists():
+        return pd.read_parquet(path)
+
+    tables = {
+        name: load_json_table(source) if source.exists() else None
+        for name, source in (("cap", MARKET_CAP_FILE), ("sum", MARKET_SUMMARY_FILE))
+    }
+    df = build_daily_aggregates(load_sector_matrix(), tables["cap"], tables["sum"])
+
+    # Older versions are never read again
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for old in path.parent.glob("daily-*.parquet"):
+        old.unlink()
+    tmp = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp)
+    os.replace(tmp, path)
+    return df
+
+
+def panel_sources():
+    """
+    (path, sheet) of every workbook merged into the sector panel, most
+    trusted first: the NEPSE annual exports (year files, then main.xlsx),
+    the nonelection year files, then the event workbooks.
+    """
+    sources = [(path, "index") for path in sorted(ANNUAL_DIR.glob("annual*.xlsx"))]
+    if SECTOR_INDEX_FILE.exists():
+        sources.append((SECTOR_INDEX_FILE, "Sheet1"))
+    sources += [(path, 0) for path in sorted(NONELECTION_DIR.glob("data*.xlsx"))]
+    sources += [(path, "index") for path in sorted(EVENT_DIR.glob("*.xlsx"))]
+    return sources
+
+
+def _panel_files():
+    return [path for path, _ in panel_sources()]
+
+
+def load_sector_panel(cache_dir=AGGREGATE_DIR, workers=None):
+    """
+    SectorPanel of every annual, nonelection and event workbook, one
+    workbook per worker process. Persisted as one Parquet file and
+    rebuilt only when a workbook is added, removed or changed.
+    """
+    import hashlib
+
+    from core.batch import run_batch
+    from core.sector_panel import SectorPanel, read_source
+
+    sources = panel_sources()
+    state = hashlib.sha1(repr(file_signature(_panel_files())).encode()).hexdigest()[:12]
+    path = Path(cache_dir) / f"panel-{state}.parquet"
+    if path.exists():
+        return SectorPanel.load(path)
+
+    if not sources:
+        raise FileNotFoundError(f"No sector workbooks in {ANNUAL_DIR}, {NONELECTION_DIR} or {EVENT_DIR}")
+
+    frames = []
+    for res in run_batch(read_source, sources, workers=workers):
+        workbook = Path(res["item"][0]).name
+        if res["status"] == "error":
+            print(f"⚠️  Skipped {workbook}: {res['error']}")
+        else:
+            frames.append((workbook, res["result"]))
+
+    panel = SectorPanel.from_frames(frames)
+
+    # Older versions are never read again
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for old in path.parent.glob("panel-*.parquet"):
+        old.unlink()
+    tmp = path.with_suffix(".parquet.tmp")
+    panel.save(tmp)
+    os.replace(tmp, path)
+    return panel
+
+
+def _store_files(store_dir=SECTOR_STORE_DIR, csv_path=SECTOR_CSV):
+    files = [Path(csv_path)]
+    if Path(store_dir).exists():
+        files += sorted(Path(store_dir).glob("*.parquet"))
+    return files
+
+
+# name -> (loader, function returning the files it depends on)
+DATASETS = {
+    "sector_index": (load_sector_index, lambda: [SECTOR_INDEX_FILE]),
+    "broker_flows": (load_broker_flows, broker_workbooks),
+    "market_cap": (lambda: load_json_table(MARKET_CAP_FILE), lambda: [MARKET_CAP_FILE]),
+    "market_summary": (lambda: load_json_table(MARKET_SUMMARY_FILE), lambda: [MARKET_SUMMARY_FILE]),
+    "sector_turnover": (load_sector_turnover, _store_files),
+    "sector_matrix": (load_sector_matrix, _store_files),
+    "daily_aggregates": (load_daily_aggregates, _aggregate_sources),
+    "sector_panel": (load_sector_panel, _panel_files),
+}
+
+
+def file_signature(paths):
+    """(path, mtime, size) of every file, None for missing ones."""
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def _load_named(item):
+    name, loader = item
+    with stage(f"load/{name}") as s:
+        df = loader()
+        s.rows = len(df)
+    return df
+
+
+# -----------------------------
+# Loaded-once cache
+# -----------------------------
+class Datasets:
+    """
+    Loads each dataset on first use and keeps it in memory, so several
+    reports in one process share one parse. A dataset is loaded again
+    only when one of its source files has changed since it was read.
+
+    Extra datasets (e.g. one per year file) can be added with
+    register(name, loader, sources).
+    """
+
+    def __init__(self):
+        self.registry = dict(DATASETS)
+        self._data = {}
+        self._signature = {}
+
+    def register(self, name, loader, sources):
+        self.registry[name] = (loader, sources)
+
+    def _sources(self, name):
+        return file_signature(self.registry[name][1]())
+
+    def get(self, name):
+        signature = self._sources(name)
+
+        if name not in self._data or self._signature[name] != signature:
+            loader = self.registry[name][0]
+            with stage(f"load/{name}") as s:
+                self._data[name] = loader()
+                s.rows = len(self._data[name])
+            # Re-read: loading can create files (e.g. the sector store)
+            self._signature[name] = self._sources(name)
+
+        return self._data[name]
+
+    def year(self, year, directory=NONELECTION_DIR):
+        """data/nonelection/data<year>.xlsx as dataset "year/<year>"."""
+        return self.get(self._register_year(year, directory))
+
+    def _register_year(self, year, directory=NONELECTION_DIR):
+        path = Path(directory) / f"data{year}.xlsx"
+        name = f"year/{year}"
+        if name not in self.registry:
+            # partial(), not a lambda, so prefetch() can send it to a worker
+            self.register(name, partial(load_year, path), lambda: [path])
+        return name
+
+    def years(self, years, directory=NONELECTION_DIR, workers=None):
+        """{year: DataFrame} for several year files, parsed in parallel."""
+        names = [self._register_year(year, directory) for year in years]
+        self.prefetch(names, workers=workers)
+        return {year: self.get(name) for year, name in zip(years, names)}
+
+    def prefetch(self, names, workers=None):
+        """
+        Load every dataset in names that is missing or stale, one per
+        worker process. Loaders must pickle (module functions or
+        partials). A failed load is left for get() to raise.
+        """
+        from core.batch import run_batch
+
+        todo = [
+            name for name in dict.fromkeys(names)
+            if name not in self._data or self._sources(name) != self._signature[name]
+        ]
+        if len(todo) < 2 or workers == 1:
+            return
+
+        results = run_batch(_load_named, [(name, self.registry[name][0]) for name in todo], workers)
+        for name, res in zip(todo, results):
+            if res["status"] == "ok":
+                self._data[name] = res["result"]
+                self._signature[name] = self._sources(name)
+
+    def loaded(self):
+        return list(self._data)
+
+    def stale(self):
+        """Loaded datasets whose source files changed since they were read."""
+        return [name for name in self._data if self._sources(name) != self._signature[name]]
+
+    def reload_changed(self):
+        """Reload every stale dataset, return their names."""
+        changed = self.stale()
+        for name in changed:
+            self.get(name)
+        return changed
+
+    def drop(self, name):
+        self._data.pop(name, None)
+        self._signature.pop(name, None)
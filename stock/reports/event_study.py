@@ -0,0 +1,152 @@
+from pathlib import Path
+
+from core.trace import stage
+
+STOCK_DIR = Path(__file__).resolve().parents[1]
+OUTPUT_DIR = STOCK_DIR / "event_study"
+
+
+# -----------------------------
+# Load
+# -----------------------------
+def load_events(source="fm"):
+    """
+    Event table with Date and Label columns. "fm" is the Finance
+    Minister changes of reports.fm_impact; anything else is a CSV or
+    Excel file with a Date column (and optionally Label or a second
+    column naming the event).
+    """
+    import pandas as pd
+    from core.dates import normalize_date_column
+
+    if source == "fm":
+        from reports.fm_impact import FM_EVENTS
+
+        events = FM_EVENTS.rename(columns={"Finance Minister": "Label"}).copy()
+    else:
+        path = Path(source)
+        events = pd.read_excel(path) if path.suffix in (".xlsx", ".xls") else pd.read_csv(path)
+        events = normalize_date_column(events)
+        if "Label" not in events.columns:
+            others = [c for c in events.columns if c != "Date"]
+            events["Label"] = events[others[0]].astype(str) if others else events["Date"].dt.strftime("%Y-%m-%d")
+
+    events = events.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
+    events["Label"] = events["Label"] + events["Date"].dt.strftime(" (%Y-%m-%d)")
+    return events[["Date", "Label"]]
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def render_caar(study, ci, name, path=None):
+    """CAAR path per sector with its bootstrap band, one panel per sector."""
+    import math
+
+    from core.render import new_figure, render
+
+    caar = study.caar()
+    ncols = 3
+    nrows = math.ceil(len(study.sectors) / ncols)
+
+    def draw():
+        fig, axes = new_figure("event", nrows=nrows, ncols=ncols, sharex=True,
+                               figsize=(6 * ncols, 3.2 * nrows), squeeze=False)
+        axes = axes.ravel()
+
+        for j, (ax, sector) in enumerate(zip(axes, study.sectors)):
+            ax.plot(study.offsets, caar[sector] * 100, linewidth=1.8, label="CAAR")
+            if ci is not None:
+                ax.fill_between(study.offsets, ci[0][:, j] * 100, ci[1][:, j] * 100,
+                                alpha=0.25, label="Bootstrap CI")
+            ax.axhline(0, linewidth=1)
+            ax.axvline(0, color="red", linestyle="--", linewidth=1)
+            ax.set_title(sector, fontsize=11)
+            ax.grid(True)
+
+        for ax in axes[len(study.sectors):]:
+            ax.set_visible(False)
+
+        axes[0].legend(fontsize=8)
+        fig.supxlabel("Trading Days From Event")
+        fig.supylabel(f"Cumulative Abnormal Return % (vs {study.benchmark})")
+        fig.suptitle(f"Event Study: {name} ({len(study.events)} events, {study.model} model)")
+        fig.tight_layout(rect=(0, 0, 1, 0.98))
+        return fig
+
+    if path is None:
+        path = OUTPUT_DIR / f"{name}_caar.png"
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    return render(path, draw, data=[study.offsets, study.car, list(study.sectors), study.model,
+                                    study.benchmark, ci[0] if ci else None, ci[1] if ci else None])
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def run(datasets, events="fm", pre=10, post=30, model="adjusted", estimation=120,
+        bootstrap=2000, workers=None, charts=True, source="sector_index", benchmark="NEPSE"):
+    """
+    Cumulative and abnormal returns of every sector around every event
+    of an event table, from the daily sector index already in memory
+    (or the panel merged from every workbook, source="sector_panel"),
+    with bootstrap confidence intervals of the average.
+
+    benchmark=None measures sectors against their equal-weighted mean;
+    a benchmark column the data can't supply falls back to it with a
+    warning.
+    """
+    import pandas as pd
+    from core.event_study import EventStudy
+    from core.render import report
+
+    name = "fm" if events == "fm" else Path(events).stem
+
+    with stage("event_study"):
+        with stage("load/events") as s:
+            table = load_events(events)
+            s.rows = len(table)
+
+        panel = datasets.get(source)
+        if source == "sector_panel":
+            # Carry levels over days a sector is missing from every workbook
+            panel = panel.frame().ffill()
+
+        with stage("compute/returns") as s:
+            options = dict(pre=pre, post=post, model=model, estimation=estimation)
+            try:
+                study = EventStudy.from_frame(panel, table, benchmark=benchmark, **options)
+            except ValueError as e:
+                if benchmark is None:
+                    raise
+                print(f"⚠️  {e}; using the equal-weighted sectors as the benchmark")
+                study = EventStudy.from_frame(panel, table, benchmark=None, **options)
+            s.rows = study.car.size
+
+        for label in study.skipped["Label"]:
+            print(f"⚠️  {label}: window outside the sector index dates, skipped")
+        if not len(study.events):
+            print("❌ No event has a full window inside the sector index dates")
+            return {"study": study}
+
+        ci = None
+        if bootstrap:
+            with stage("compute/bootstrap") as s:
+                ci = study.bootstrap(bootstrap, workers=workers)
+                s.rows = bootstrap
+
+        print(f"\nEvent study: {len(study.events)} events x {len(study.sectors)} sectors, "
+              f"window [{-pre}, +{post}], {model} model, benchmark {study.benchmark}")
+
+        with pd.option_context("display.float_format", "{:.2f}".format, "display.width", 200):
+            print(f"\nCAR % at +{post} per event:\n")
+            print((study.car_table() * 100).T.to_string())
+            print("\nAverage across events:\n")
+            print(study.summary(ci).to_string())
+
+        if charts:
+            with stage("render"):
+                report(*render_caar(study, ci, name))
+
+    return {"study": study, "ci": ci}
@@ -0,0 +1,428 @@
+from functools import partial
+
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+
+from core.batch import Skipped, print_batch_logs, print_batch_summary, run_batch
+from core.dates import normalize_date_column
+from core.downsample import plot_line
+from core.excel_cache import read_excel_cached
+from core.render import render, report
+from core.sectors import (
+    canonicalize_columns,
+    merge_unmapped,
+    print_unmapped_report,
+    unmapped_report,
+)
+from core.trace import stage
+from reports.datasets import EVENT_DIR
+
+OUTPUT_DIR = EVENT_DIR / "fm_impact_graphs"
+
+# -----------------------------
+# Finance Minister events
+# -----------------------------
+FM_EVENTS = pd.DataFrame({
+    "Date": [
+        "2018-03-16",
+        "2020-10-14",
+        "2021-07-13",
+        "2022-12-26",
+        "2023-03-31",
+        "2024-03-06",
+        "2024-07-15",
+        "2025-09-15",
+    ],
+    "Finance Minister": [
+        "Yuba Raj Khatiwada",
+        "Bishnu Prasad Paudel",
+        "Janardan Sharma",
+        "Bishnu Prasad Paudel",
+        "Prakash Sharan Mahat",
+        "Barsaman Pun",
+        "Bishnu Prasad Paudel",
+        "Rameshwor Khanal",
+    ]
+})
+
+FM_EVENTS["Date"] = pd.to_datetime(FM_EVENTS["Date"])
+
+EVENT_FILES = [
+    "2074chaitra2.xlsx",
+    "2077asoj28.xlsx",
+    "2078ashar28.xlsx",
+    "2079chaitra17.xlsx",
+    "2079poush11.xlsx",
+    "2080chaitra3.xlsx",
+    "2081ashar31.xlsx",
+    "2082bhadra30.xlsx",
+]
+
+
+# -----------------------------
+# Chart: all sectors
+# -----------------------------
+def graph_all_sectors(file_name, df, fm_events, output_dir):
+    """
+    Create a graph showing all sector indices with Finance Minister change events
+    """
+    # Filter valid dates
+    df = df[df["Date"].notna()].copy()
+    df = df.sort_values("Date")
+    
+    if len(df) == 0:
+        print(f"⚠️  No valid data for {file_name}")
+        return
+    
+    # Get date range from data
+    min_date = df["Date"].min()
+    max_date = df["Date"].max()
+    
+    print(f"\n📊 Processing {file_name}")
+    print(f"   Date range: {min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}")
+    print(f"   Total rows: {len(df)}")
+    
+    # Filter FM events to those within the data range
+    relevant_fm_events = fm_events[
+        (fm_events["Date"] >= min_date) & 
+        (fm_events["Date"] <= max_date)
+    ]
+    
+    print(f"   FM events in range: {len(relevant_fm_events)}")
+    
+    # Define sectors to plot (excluding Date column)
+    sectors = [col for col in df.columns if col != "Date"]
+    
+    # Remove columns with all NaN values
+    sectors = [col for col in sectors if df[col].notna().any()]
+    
+    print(f"   Sectors found: {len(sectors)}")
+    for sector in sectors:
+        non_null = df[sector].notna().sum()
+        print(f"      - {sector}: {non_null} valid values")
+    
+    if len(sectors) == 0:
+        print(f"⚠️  No valid sector data for {file_name}")
+        return
+    
+    def draw():
+        # Create figure with more space on the right for labels
+        fig, ax = plt.subplots(figsize=(16, 9))
+    
+        # Color palette for different sectors
+        colors = plt.cm.tab20(np.linspace(0, 1, len(sectors)))
+    
+        # Plot all sectors
+        for idx, sector in enumerate(sectors):
+            # Filter non-null values
+            sector_data = df[["Date", sector]].dropna()
+            if len(sector_data) > 0:
+                plot_line(ax, sector_data["Date"], sector_data[sector], 
+                          linewidth=1.5, color=colors[idx], label=sector, alpha=0.8)
+    
+        # Add vertical lines for FM events
+        event_colors = ['#FF0000', '#FF4500', '#DC143C', '#B22222', '#8B0000']
+        for idx, (_, row) in enumerate(relevant_fm_events.iterrows()):
+            event_date = row["Date"]
+            fm_name = row["Finance Minister"]
+        
+            color = event_colors[idx % len(event_colors)]
+            ax.axvline(x=event_date, color=color, linestyle='--', linewidth=2, alpha=0.6)
+        
+            # Add label on the right side
+            ylim = ax.get_ylim()
+            y_range = ylim[1] - ylim[0]
+        
+            # Stagger labels vertically to avoid overlap
+            y_offset = ylim[1] - (idx * y_range * 0.08)
+        
+            # Add text on the right side
+            ax.text(1.01, y_offset / ylim[1], 
+                   f"{event_date.strftime('%Y-%m-%d')}\n{fm_name}", 
+                   transform=ax.get_yaxis_transform(),
+                   fontsize=9, color=color, weight='bold',
+                   verticalalignment='top',
+                   bbox=dict(boxstyle='round,pad=0.4', facecolor='lightyellow', 
+                            edgecolor=color, alpha=0.8))
+    
+        # Formatting
+        ax.set_xlabel("Date", fontsize=12, weight='bold')
+        ax.set_ylabel("Index Value", fontsize=12, weight='bold')
+        ax.set_title(f"Finance Minister Impact on Stock Market Sectors\n{file_name}", 
+                    fontsize=14, weight='bold', pad=20)
+    
+        # Format x-axis dates based on date range
+        date_range_days = (max_date - min_date).days
+    
+        if date_range_days < 90:  # Less than 3 months
+            ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        elif date_range_days < 365:  # Less than 1 year
+            ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        else:  # More than 1 year
+            ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+        # Add grid
+        ax.grid(True, alpha=0.3, linestyle=':', linewidth=0.5)
+    
+        # Legend - place outside plot area
+        ax.legend(loc='center left', bbox_to_anchor=(1.15, 0.5), 
+                 fontsize=9, framealpha=0.9)
+    
+        # Adjust layout to make room for right-side labels
+        fig.subplots_adjust(right=0.75)
+
+        return fig
+
+    # Save figure (skipped when data, events and code are unchanged)
+    output_path = output_dir / f"{file_name.replace('.xlsx', '_fm_impact.png')}"
+    with stage("render"):
+        output_path, rendered = render(
+            output_path,
+            draw,
+            data=[file_name, df[["Date", *sectors]], relevant_fm_events],
+            bbox_inches='tight',
+        )
+    report(output_path, rendered)
+
+
+
+# -----------------------------
+# Chart: selected sectors, Base 100
+# -----------------------------
+SECTORS_TO_COMPARE = [
+    # "NEPSE",
+    "Banking",
+    "Hydro Power",
+    # "Development Bank",
+    # "Finance",
+    # "Life Insurance",
+    # "Non-Life Insurance",
+    # "Microfinance",
+    "Hotels and Tourism",
+    "Manufacturing and Processing",
+    # "Trading",
+    # "Investment",
+    # "Mutual Fund",
+]
+
+def normalize_base_100(df, columns, base_date=None):
+    """
+    Normalize given columns to Base = 100
+    """
+    norm_df = df.copy()
+
+    if base_date is None:
+        base_date = norm_df["Date"].min()
+
+    base_row = norm_df[norm_df["Date"] == base_date]
+
+    if base_row.empty:
+        return norm_df
+
+    for col in columns:
+        if col not in norm_df.columns:
+            continue
+
+        base_value = base_row[col].values[0]
+
+        if pd.isna(base_value) or base_value == 0:
+            continue
+
+        norm_df[col] = (norm_df[col] / base_value) * 100
+
+    return norm_df
+
+def graph_base_100(file_name, df, fm_events, output_dir):
+    """
+    Create a normalized (Base 100) graph comparing sector reactions
+    """
+    df = df[df["Date"].notna()].copy()
+    df = df.sort_values("Date")
+
+    if len(df) == 0:
+        print(f"⚠️  No valid data for {file_name}")
+        return
+
+    # Find available sectors in this file
+    available_sectors = [s for s in SECTORS_TO_COMPARE if s in df.columns]
+
+    if len(available_sectors) < 2:
+        print(f"⚠️  Not enough sector data in {file_name}")
+        return
+
+    # Normalize to Base 100
+    df_norm = normalize_base_100(df, available_sectors)
+
+    min_date = df_norm["Date"].min()
+    max_date = df_norm["Date"].max()
+
+    print(f"\n📊 Processing {file_name}")
+    print(f"   Date range: {min_date.date()} → {max_date.date()}")
+    print(f"   Sectors compared: {available_sectors}")
+
+    relevant_fm_events = fm_events[
+        (fm_events["Date"] >= min_date) &
+        (fm_events["Date"] <= max_date)
+    ]
+
+    def draw():
+        fig, ax = plt.subplots(figsize=(16, 9))
+
+        # Plot normalized sectors
+        for sector in available_sectors:
+            plot_line(
+                ax,
+                df_norm["Date"],
+                df_norm[sector],
+                linewidth=2,
+                alpha=0.9,
+                label=sector
+            )
+
+        # Finance Minister event lines
+        for _, row in relevant_fm_events.iterrows():
+            ax.axvline(
+                x=row["Date"],
+                linestyle="--",
+                linewidth=2,
+                color="black",
+                alpha=0.6
+            )
+
+            ax.text(
+                row["Date"],
+                ax.get_ylim()[1],
+                f"{row['Finance Minister']}\n{row['Date'].strftime('%Y-%m-%d')}",
+                rotation=90,
+                fontsize=9,
+                verticalalignment="top",
+                horizontalalignment="right",
+                bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8)
+            )
+
+        ax.set_title(
+            f"Sectoral Reaction to Finance Minister Change (Base = 100)\n{file_name}",
+            fontsize=15,
+            weight="bold"
+        )
+        ax.set_xlabel("Date", fontsize=12, weight="bold")
+        ax.set_ylabel("Index (Base = 100)", fontsize=12, weight="bold")
+
+        ax.grid(True, linestyle=":", alpha=0.4)
+        ax.legend(loc="upper left", fontsize=10, ncol=2)
+
+        plt.setp(ax.get_xticklabels(), rotation=45)
+        fig.subplots_adjust(right=0.95)
+        return fig
+
+    output_path = output_dir / f"{file_name.replace('.xlsx', '_sector_base100.png')}"
+    with stage("render"):
+        output_path, rendered = render(
+            output_path,
+            draw,
+            data=[file_name, df_norm[["Date", *available_sectors]], relevant_fm_events],
+        )
+    report(output_path, rendered)
+
+
+# name -> (chart function, date parsing options)
+STYLES = {
+    # every sector's raw index level (formerly data/finance/index.py)
+    "sectors": (graph_all_sectors, {}),
+    # a few sectors rebased to 100 (formerly data/finance/nepse.py)
+    "base100": (graph_base_100, {"excel_serial": False}),
+}
+
+
+# SectorPanel handed to each worker once by run() (see _set_panel)
+_PANEL = None
+
+
+def _set_panel(panel):
+    global _PANEL
+    _PANEL = panel
+
+
+def render_event_file(file_name, style="sectors", panel=None):
+    """
+    Load one event workbook and save its chart. Runs in a worker process.
+    Returns the headers that didn't map to a sector.
+
+    With a SectorPanel (passed in, or set for the worker by run()) the
+    workbook isn't read: the chart covers the file's dates with every
+    sector and value the panel merged from all workbooks. A file the
+    panel has no values for raises Skipped.
+    """
+    graph, date_options = STYLES[style]
+    panel = panel if panel is not None else _PANEL
+
+    with stage(file_name):
+        if panel is not None:
+            with stage("slice") as s:
+                span = panel.span(file_name)
+                if span is None:
+                    raise Skipped("no values in the sector panel")
+                df = panel.frame(*span)
+                s.rows = len(df)
+                if df.empty:
+                    raise Skipped("no values in the sector panel")
+
+            graph(file_name, df, FM_EVENTS, OUTPUT_DIR)
+            return unmapped_report()
+
+        with stage("load") as s:
+            df = read_excel_cached(EVENT_DIR / file_name, sheet_name="index")
+            s.rows = len(df)
+
+        with stage("clean") as s:
+            df = canonicalize_columns(df, source=file_name)
+            df = normalize_date_column(df, **date_options)
+            s.rows = len(df)
+
+        graph(file_name, df, FM_EVENTS, OUTPUT_DIR)
+
+    return unmapped_report()
+
+
+def run(style="sectors", files=None, workers=None, panel=None):
+    """
+    Finance Minister impact chart for every event workbook, one file per
+    worker process. Logs are printed afterwards in file order. With a
+    SectorPanel each chart is drawn from the panel (see render_event_file).
+    """
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    print("=" * 60)
+    print("Generating Finance Minister Impact Graphs")
+    print("=" * 60)
+
+    # partial() of a module-level function still pickles for the workers;
+    # the panel goes to each worker once through the initializer
+    render_file = partial(render_event_file, style=style)
+    try:
+        results = run_batch(render_file, files or EVENT_FILES, workers=workers,
+                            initializer=_set_panel if panel is not None else None,
+                            initargs=(panel,))
+    finally:
+        _set_panel(None)
+
+    print_batch_logs(results)
+    for res in results:
+        if res["status"] == "ok":
+            merge_unmapped(res["result"])
+
+    print_unmapped_report()
+    print_batch_summary(results)
+
+    print("\n" + "=" * 60)
+    print(f"All graphs saved to: {OUTPUT_DIR}")
+    print("=" * 60)
+
+    return results
@@ -0,0 +1,243 @@
+from pathlib import Path
+
+from core.trace import stage
+from reports.datasets import NONELECTION_DIR
+
+STOCK_DIR = Path(__file__).resolve().parents[1]
+
+MOMENTUM_DIR = STOCK_DIR / "sector_momentum"
+
+# Sectors per chart: 1 = one file per sector, more = a grid per page
+PER_PAGE = 6
+GRID_COLUMNS = 2
+
+# Trading days kept around each event by run_events()
+EVENT_BEFORE = 20
+EVENT_AFTER = 60
+
+
+# -----------------------------
+# Load
+# -----------------------------
+def available_years(directory=NONELECTION_DIR):
+    """Years with a data<year>.xlsx, newest first."""
+    years = [int(path.stem[4:]) for path in Path(directory).glob("data*.xlsx") if path.stem[4:].isdigit()]
+    return sorted(years, reverse=True)
+
+
+def event_windows(df, events, before=EVENT_BEFORE, after=EVENT_AFTER):
+    """
+    Rows of a dated frame around each event date, and the row of the
+    event (the first trading day on or after it) within its window.
+    events: {label: date}.
+    """
+    import pandas as pd
+
+    dates = df["Date"].to_numpy()
+    frames, origins = {}, {}
+
+    for label, date in events.items():
+        when = pd.Timestamp(date).to_datetime64()
+        pos = dates.searchsorted(when)
+        if pos >= len(dates) or when < dates[0]:
+            print(f"⚠️  {label}: outside the sector index dates, skipped")
+            continue
+        start = max(pos - before, 0)
+        frames[label] = df.iloc[start:pos + after + 1].reset_index(drop=True)
+        origins[label] = pos - start
+
+    return frames, origins
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def pages(sectors, per_page=PER_PAGE):
+    return [sectors[i:i + per_page] for i in range(0, len(sectors), per_page)]
+
+
+def _slug(text):
+    return "".join(c if c.isalnum() else "_" for c in text).strip("_")
+
+
+def page_path(out_dir, number, sectors, per_page):
+    if per_page == 1:
+        return Path(out_dir) / f"{_slug(sectors[0])}.png"
+    return Path(out_dir) / f"page_{number:02d}.png"
+
+
+def render_page(item):
+    """
+    One page of momentum charts, one panel per sector and one line per
+    label. item: (path, OffsetStack of the page's sectors, xlabel, mark_zero).
+    Module-level so run_batch() can send it to a worker.
+    """
+    import math
+
+    from core.render import new_figure, render
+
+    path, stack, xlabel, mark_zero = item
+    ncols = 1 if len(stack.sectors) == 1 else GRID_COLUMNS
+    nrows = math.ceil(len(stack.sectors) / ncols)
+
+    def draw():
+        if ncols == 1 and nrows == 1:
+            fig, ax = new_figure("line")
+            axes = [ax]
+        else:
+            fig, axes = new_figure("line", nrows=nrows, ncols=ncols, sharex=True,
+                                   figsize=(9 * ncols, 4 * nrows), squeeze=False)
+            axes = axes.ravel()
+
+        for j, (ax, sector) in enumerate(zip(axes, stack.sectors)):
+            for i, label in enumerate(stack.labels):
+                ax.plot(stack.offsets, stack.values[i, :, j], label=str(label), linewidth=1.8)
+
+            ax.axhline(0, linewidth=1)  # zero line = expansion vs contraction
+            if mark_zero:
+                ax.axvline(0, color="red", linestyle="--", linewidth=1)
+            ax.set_title(f"{sector} – % Change (Momentum View)", fontsize=14)
+            ax.set_ylabel("% Change")
+            if j >= len(stack.sectors) - ncols:  # bottom panel of each column
+                ax.set_xlabel(xlabel)
+            ax.grid(True)
+            ax.legend()
+
+        # Unused cells of the last page's grid
+        for ax in axes[len(stack.sectors):]:
+            ax.set_visible(False)
+
+        fig.tight_layout()
+        return fig
+
+    return render(path, draw, data=[stack.labels, stack.offsets, stack.values, stack.sectors, xlabel, mark_zero])
+
+
+def render_momentum(changes, out_dir=MOMENTUM_DIR, per_page=PER_PAGE, workers=None,
+                    xlabel="Trading Day", mark_zero=False):
+    """
+    Every sector of an OffsetStack of % changes, per_page sectors per
+    file, pages rendered in parallel. Each worker only receives its own
+    page's slice of the stack.
+    """
+    from core.batch import print_batch_summary, run_batch
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    items = [
+        (page_path(out_dir, number, sectors, per_page), changes.take(sectors), xlabel, mark_zero)
+        for number, sectors in enumerate(pages(changes.sectors, per_page), start=1)
+    ]
+    results = run_batch(render_page, items, workers=workers)
+
+    if any(res["status"] == "error" for res in results):
+        print_batch_summary(results)
+    return [res["result"] for res in results if res["status"] == "ok"]
+
+
+def render_levels(df, year, path=None):
+    """Every sector's level over one year's dates (formerly basic.py)."""
+    from core.downsample import plot_line
+    from core.render import new_figure, render
+
+    def draw():
+        fig, ax = new_figure("tall")
+
+        for column in df.columns:
+            if column != "Date":
+                plot_line(ax, df["Date"], df[column], label=column)
+
+        # Formatting
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Value")
+        ax.set_title(f"Sector-wise Market Data ({year})")
+        ax.legend(loc="upper left", fontsize=8)
+
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.grid(True)
+
+        fig.tight_layout()
+        return fig
+
+    if path is None:
+        path = STOCK_DIR / f"basic_{year}.png"
+    return render(path, draw, data=[df, year])
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def _report(stack, title, out_dir, per_page, workers, charts, xlabel, mark_zero=False):
+    with stage("compute/pct_change") as s:
+        changes = stack.pct_change()
+        s.rows = changes.shape[0] * changes.shape[1]
+
+    print(f"\n{title}: {', '.join(str(label) for label in stack.labels)}")
+    print(f"Sectors ({len(stack.sectors)}): {', '.join(stack.sectors)}")
+
+    if charts:
+        with stage("render"):
+            outputs = render_momentum(changes, out_dir, per_page, workers, xlabel, mark_zero)
+
+        rendered = sum(1 for _, done in outputs if done)
+        print(f"✅ {rendered} page(s) rendered, {len(outputs) - rendered} unchanged, in:")
+        print(out_dir)
+
+    return {"sectors": stack.sectors, "changes": changes}
+
+
+def run(datasets, years=None, per_page=PER_PAGE, workers=None, out_dir=MOMENTUM_DIR,
+        charts=True, how="inner"):
+    """
+    Sector momentum of several years side by side (formerly
+    election.py), aligned by trading day of the year. years=None
+    compares every data<year>.xlsx in data/nonelection.
+    """
+    from core.stack import OffsetStack
+
+    with stage("momentum"):
+        years = years or available_years()
+        if not years:
+            raise FileNotFoundError(f"No data<year>.xlsx files in {NONELECTION_DIR}")
+
+        frames = datasets.years(years, workers=workers)
+
+        with stage("clean"):
+            stack = OffsetStack.from_frames(frames, how=how)
+
+        return _report(stack, "Years", out_dir, per_page, workers, charts, "Trading Day of Year")
+
+
+def run_events(datasets, events, before=EVENT_BEFORE, after=EVENT_AFTER, per_page=PER_PAGE,
+               workers=None, out_dir=MOMENTUM_DIR / "events", charts=True):
+    """
+    Sector momentum around several event dates of the daily sector
+    index, aligned so every event falls on trading day 0.
+    events: {label: date} or a list of dates.
+    """
+    from core.stack import OffsetStack
+
+    if not isinstance(events, dict):
+        events = {str(date): date for date in events}
+
+    with stage("momentum_events"):
+        df = datasets.get("sector_index")
+
+        with stage("clean"):
+            frames, origins = event_windows(df, events, before, after)
+            if not frames:
+                raise ValueError("No event falls inside the sector index dates")
+            stack = OffsetStack.from_frames(frames, origins=origins)
+
+        return _report(stack, "Events", out_dir, per_page, workers, charts,
+                       "Trading Days From Event", mark_zero=True)
+
+
+def run_levels(datasets, year=2080):
+    """Chart of one year's sector levels (formerly basic.py)."""
+    from core.render import report
+
+    with stage("levels"):
+        df = datasets.year(year)
+        with stage("render"):
+            report(*render_levels(df, year))
@@ -0,0 +1,164 @@
+import os
+import re
+
+from core.trace import stage
+
+TOP_N = 5
+
+CAP_COLUMNS = {
+    "marCap": "Market Cap",
+    "floatMarCap": "Float Market Cap",
+    "senMarCap": "Sensitive Market Cap",
+    "senFloatMarCap": "Sensitive Float Market Cap",
+}
+SUMMARY_COLUMNS = ["totalTurnover", "totalTradedShares", "totalTransactions", "tradedScrips"]
+
+
+# -----------------------------
+# Analytics
+# -----------------------------
+def activity_metrics(df_sum):
+    """Market summary with turnover per scrip and a scaled turnover column."""
+    df_sum = df_sum.copy()
+    df_sum["avgTurnoverPerScrip"] = df_sum["totalTurnover"] / df_sum["tradedScrips"]
+    df_sum["totalTurnover_scaled"] = df_sum["totalTurnover"] / 1e2
+    return df_sum
+
+
+def top_sectors(matrix, n=TOP_N):
+    """
+    The n sectors with the largest total turnover, and their daily
+    turnover as a (date x sector) frame of column slices.
+    """
+    top = matrix.top(n, "turnover")
+    return top, matrix.frame("turnover", top)
+
+
+def activity(daily):
+    """
+    Market activity lines from the daily aggregates: the market summary
+    when it's available, the sector-wise totals otherwise.
+    """
+    if all(column in daily.columns for column in SUMMARY_COLUMNS):
+        df_sum = activity_metrics(daily[SUMMARY_COLUMNS].dropna())
+        return {
+            "Total Turnover (×1e2)": df_sum["totalTurnover_scaled"],
+            "Total Traded Shares": df_sum["totalTradedShares"],
+            "Total Transactions": df_sum["totalTransactions"],
+            "Avg Turnover per Scrip": df_sum["avgTurnoverPerScrip"],
+        }
+
+    print("⚠️  No market summary, showing sector-wise totals instead")
+    return {
+        "Sector Turnover (×1e2)": daily["sector_turnover"] / 1e2,
+        "Sector Traded Shares": daily["sector_volume"],
+        "Sector Transactions": daily["sector_transactions"],
+    }
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def get_unique_filename(base_name, extension=".png", out_dir="."):
+    counter = 0
+    filename = os.path.join(out_dir, f"{base_name}{extension}")
+    while os.path.exists(filename):
+        counter += 1
+        filename = os.path.join(out_dir, f"{base_name}_{counter}{extension}")
+    return filename
+
+
+def render_overview(daily, lines, top_turnover, out_dir="."):
+    """
+    Three-panel dashboard: market cap, activity and top-sector turnover.
+    Never overwrites; an identical earlier chart is reused instead.
+    """
+    from core.render import new_figure, render
+
+    cap = {label: daily[column].dropna() for column, label in CAP_COLUMNS.items() if column in daily.columns}
+
+    def draw():
+        fig, (ax_cap, ax_sum, ax_sector) = new_figure("dashboard", nrows=3, ncols=1)
+
+        # ---- Subplot 1: Market Capitalization ----
+        for label, series in cap.items():
+            ax_cap.plot(series.index, series, label=label)
+
+        ax_cap.set_title("Market Capitalization Over Time")
+        ax_cap.set_ylabel("Market Cap Value")
+        ax_cap.legend()
+        ax_cap.grid(True)
+
+        # ---- Subplot 2: Market Activity & Quality ----
+        for label, series in lines.items():
+            ax_sum.plot(series.index, series, label=label)
+
+        ax_sum.set_title("Market Activity & Breadth Quality")
+        ax_sum.set_ylabel("Value")
+        ax_sum.legend()
+        ax_sum.grid(True)
+
+        # ---- Subplot 3: Sector-wise Turnover (Top 5) ----
+        for sector in top_turnover.columns:
+            ax_sector.plot(top_turnover.index, top_turnover[sector], label=sector)
+
+        ax_sector.set_title(f"Top {top_turnover.shape[1]} Sectors by Turnover")
+        ax_sector.set_xlabel("Business Date")
+        ax_sector.set_ylabel("Turnover Value")
+        ax_sector.legend()
+        ax_sector.grid(True)
+
+        fig.tight_layout()
+        return fig
+
+    return render(
+        get_unique_filename("market_overview", out_dir=out_dir),
+        draw,
+        data=[list(cap), list(cap.values()), list(lines), list(lines.values()), top_turnover],
+        history=os.path.join(out_dir, "market_overview*.png"),
+    )
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def run(datasets, top_n=TOP_N, out_dir=".", charts=True):
+    """
+    Market overview (formerly index.py): market cap, market activity and
+    the top sectors by turnover, from the persisted daily aggregates
+    and the (date x sector) matrix.
+    """
+    with stage("overview"):
+        daily = datasets.get("daily_aggregates")
+        matrix = datasets.get("sector_matrix")
+
+        with stage("compute/metrics"):
+            lines = activity(daily)
+
+        with stage("compute/top_sectors") as s:
+            top, top_turnover = top_sectors(matrix, top_n)
+            s.rows = top_turnover.size
+
+        print(f"\nTop {top_n} sectors by turnover: {', '.join(map(str, top))}")
+
+        latest_day = matrix.top_per_day(top_n).iloc[-1]
+        print(f"Top {top_n} on {latest_day.name:%Y-%m-%d}: {', '.join(latest_day)}")
+
+        # The aggregates name the share after the n they were built with
+        share = next(m for m in (re.fullmatch(r"top(\d+)_share", str(c)) for c in daily.columns) if m)
+        latest = daily[["active_sectors", share[0], "hhi"]].dropna().iloc[-1]
+        print(
+            f"Latest breadth: {int(latest['active_sectors'])} sectors traded, "
+            f"top {share[1]} share {latest[share[0]]:.1%}, HHI {latest['hhi']:.3f}"
+        )
+
+        if charts:
+            with stage("render"):
+                output_file, rendered = render_overview(daily, lines, top_turnover, out_dir)
+
+            if rendered:
+                print(f"Chart saved as {output_file}")
+            else:
+                print(f"Chart unchanged: {output_file}")
+
+    return {"top_sectors": list(top)}
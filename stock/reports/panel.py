@@ -0,0 +1,39 @@
+from core.trace import stage
+
+
+def run(datasets, start=None, end=None, export=None, conflicts=10):
+    """
+    Build (or load) the unified sector panel and print where its values
+    came from: coverage and conflicts per source workbook, optionally
+    exporting the [start, end] slice as CSV.
+    """
+    import pandas as pd
+
+    with stage("panel"):
+        panel = datasets.get("sector_panel")
+
+        print(f"\nSector panel: {len(panel)} dates x {len(panel.sectors)} sectors "
+              f"from {len(panel.sources)} workbooks")
+        if len(panel):
+            print(f"Dates: {panel.dates[0]:%Y-%m-%d} to {panel.dates[-1]:%Y-%m-%d}")
+
+        with pd.option_context("display.width", 200):
+            print("\nValues kept per source (most trusted first):\n")
+            print(panel.coverage().to_string())
+
+            with stage("compute/conflicts") as s:
+                table = panel.conflicts()
+                s.rows = len(table)
+
+            if len(table):
+                print(f"\n{len(table)} values disagreed between sources; the first {conflicts}:\n")
+                print(table.head(conflicts).to_string(index=False))
+            else:
+                print("\n✅ No conflicting values between sources")
+
+        if export:
+            df = panel.frame(start, end)
+            df.to_csv(export, index=False)
+            print(f"✅ Exported {len(df)} rows to {export}")
+
+    return panel
@@ -0,0 +1,243 @@
+from pathlib import Path
+
+from core.trace import stage
+
+STOCK_DIR = Path(__file__).resolve().parents[1]
+
+LEADER_LOOKBACK = 20
+CORRELATION_WINDOWS = [20, 60, 120]
+LOOKBACKS = [10, 20, 30, 60, 90, 120]
+TRANSACTION_COST = 0.002
+
+BASE_100_FILE = STOCK_DIR / "base_main_0.png"
+STRATEGY_FILE = STOCK_DIR / "best_rotation_strategy.png"
+
+
+# -----------------------------
+# Normalize
+# -----------------------------
+def base_100(df, sectors=None):
+    """
+    Sector levels rebased to 100 on the first row, and their
+    ReturnPanel. sectors=None uses every column except Date.
+    """
+    from core.panel import ReturnPanel
+
+    if sectors is None:
+        sectors = df.columns.drop("Date")
+
+    # Keep only existing columns
+    sectors = [col for col in sectors if col in df.columns]
+
+    sector_df = df[sectors].copy()
+    df_base = sector_df / sector_df.iloc[0] * 100
+
+    # Prices, log prices and daily returns computed once for every analysis
+    return df_base, ReturnPanel.from_frame(df_base)
+
+
+# -----------------------------
+# Analytics
+# -----------------------------
+def correlations(panel, windows=CORRELATION_WINDOWS):
+    """
+    Full-period correlation matrix and the latest average pairwise
+    correlation for each rolling window.
+    """
+    import pandas as pd
+    from core.correlation import average_pairwise, window_corr
+
+    # Days where any sector has no return are left out, as in the
+    # original pct_change().dropna()
+    returns = panel.returns_frame().dropna()
+    matrix = returns.corr()
+
+    # Average pairwise correlation on the latest date, per window: only
+    # the last window of each is needed, not the rolling history
+    values = returns.to_numpy()
+    herding = pd.Series({
+        f"{window}D": average_pairwise(window_corr(values, window=window))
+        for window in windows
+    }, name="Avg Pairwise Corr")
+
+    return matrix, herding
+
+
+def leadership(df_base):
+    """Total return % per sector since the base date, best first."""
+    total_return = df_base.iloc[-1] - 100
+    return total_return.sort_values(ascending=False)
+
+
+def rotations(panel, dates, lookback=LEADER_LOOKBACK):
+    """
+    Momentum leader per date, the dates it changed, the (From, To)
+    rotation table and the transition counts between sectors.
+    """
+    import pandas as pd
+
+    # Dates without enough momentum history are skipped
+    leader = panel.leaders(lookback)
+
+    rotation_points = leader.ne(leader.shift())
+    rotation_dates = dates.loc[leader.index[rotation_points]]
+
+    table = pd.DataFrame({"From": leader.shift(), "To": leader})
+    table = table[table["From"] != table["To"]].dropna()
+
+    transitions = pd.crosstab(table["From"], table["To"])
+    return leader, rotation_dates, table, transitions
+
+
+def drawdowns(panel, dates):
+    """drawdown_summary() of every sector, dated."""
+    from core.drawdown import drawdown_summary
+
+    # All sectors in one pass, with the dates of each sector's worst episode
+    return drawdown_summary(panel.prices, dates, panel.columns)
+
+
+def lookback_test(panel, lookbacks=LOOKBACKS, cost=TRANSACTION_COST):
+    """Rotation backtests ranked by Sharpe, and their equity curves."""
+    from core.sweep import rotation_sweep
+
+    # A handful of runs is cheaper in-process than starting a worker pool
+    return rotation_sweep(panel, lookbacks=lookbacks, costs=[cost], workers=1)
+
+
+def month_starts(dates):
+    """Dates that open a new calendar month (first row excluded)."""
+    periods = dates.dt.to_period("M")
+    mask = periods.ne(periods.shift())
+    mask.iloc[0] = False
+    return dates[mask]
+
+
+# -----------------------------
+# Render
+# -----------------------------
+def render_base_100(dates, df_base, path=BASE_100_FILE):
+    from core.downsample import plot_line
+    from core.render import new_figure, render
+
+    change_dates = month_starts(dates)
+
+    def draw_base100():
+        fig, ax = new_figure("line")
+
+        for col in df_base.columns:
+            plot_line(ax, dates, df_base[col], label=col)
+
+        for date in change_dates:
+            ax.axvline(x=date, linestyle="--", linewidth=1, alpha=0.5)
+
+        ax.axhline(y=100, linestyle="--", linewidth=1)
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Index Value (Base 100)")
+        ax.set_title("Base 100 Sector Comparison with Monthly Markers")
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.legend()
+        fig.tight_layout()
+        return fig
+
+    return render(path, draw_base100, data=[dates, df_base, change_dates])
+
+
+def render_best_strategy(curve, lookback, path=STRATEGY_FILE):
+    from core.render import new_figure, render
+
+    def draw_best_strategy():
+        fig, ax = new_figure("equity")
+        ax.plot(curve)
+        ax.set_title(f"Best Rotation Strategy (Lookback={int(lookback)})")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Growth of $1")
+        return fig
+
+    return render(path, draw_best_strategy, data=[curve, int(lookback)])
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def _section(title):
+    print(f"\n================ {title} ================\n")
+
+
+def run(datasets, lookbacks=LOOKBACKS, cost=TRANSACTION_COST, charts=True):
+    """
+    Sector rotation report on the daily sector index (formerly
+    moneyflow.py): correlations, leadership, rotations, drawdowns and
+    the lookback test, plus the Base 100 and best-strategy charts.
+    """
+    import pandas as pd
+
+    with stage("rotation"):
+        df = datasets.get("sector_index")
+        dates = df["Date"]
+
+        with stage("compute/base100") as s:
+            df_base, panel = base_100(df)
+            s.rows = len(df_base)
+
+        with stage("compute/correlation") as s:
+            matrix, herding = correlations(panel)
+            s.rows = len(df_base) - 1
+
+        _section("CORRELATION MATRIX")
+        print(matrix.round(2))
+
+        _section("ROLLING CORRELATION (LATEST)")
+        print(herding.round(2))
+
+        ranking = leadership(df_base)
+        _section("SECTOR LEADERSHIP RANKING (%)")
+        print(ranking.round(2))
+
+        with stage("compute/leaders"):
+            leader, rotation_dates, table, transitions = rotations(panel, dates)
+
+        _section("ROTATION DATES")
+        print(rotation_dates)
+
+        with stage("compute/drawdown"):
+            drawdown_table = drawdowns(panel, dates)
+        max_drawdown = drawdown_table["Max Drawdown %"]
+
+        _section("MAX DRAWDOWN (%)")
+        print(max_drawdown.round(2))
+
+        _section("WORST DRAWDOWN EPISODES")
+        print(drawdown_table.drop(columns=["Max Drawdown %"]).to_string())
+
+        summary = pd.DataFrame({
+            "Total Return %": df_base.iloc[-1] - 100,
+            "Max Drawdown %": max_drawdown
+        }).sort_values("Total Return %", ascending=False)
+
+        _section("SUMMARY TABLE")
+        print(summary.round(2))
+
+        _section("ROTATION TABLE")
+        print(table)
+
+        _section("TRANSITION MATRIX")
+        print(transitions.to_string())
+
+        with stage("compute/rotation_sweep") as s:
+            results, curves = lookback_test(panel, lookbacks, cost)
+            s.rows = len(results)
+
+        _section("ROTATION STRATEGY RESULTS")
+        print(results[["Lookback", "Total Return %", "Max Drawdown %", "Sharpe Ratio"]].round(2))
+
+        best = results.iloc[0]
+
+        if charts:
+            from core.render import report
+
+            with stage("render"):
+                report(*render_base_100(dates, df_base))
+                report(*render_best_strategy(curves[best["Run"]], best["Lookback"]))
+
+    return {"ranking": ranking, "drawdowns": drawdown_table, "results": results}
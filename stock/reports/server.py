@@ -0,0 +1,354 @@
+"""
+Long-running analytics server. Datasets are parsed once and kept in
+memory, source files are polled for changes and reloaded on their own,
+and reports come back over a local HTTP API (TCP or a Unix socket):
+
+    python cli.py serve --port 8765
+    curl "localhost:8765/rotation?days=60"
+    curl "localhost:8765/ranking?days=20"
+    curl "localhost:8765/chart/base100.png?days=120" -o base100.png
+"""
+import json
+import os
+import signal
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from core.excel_cache import CACHE_DIR
+from reports import rotation
+from reports.datasets import Datasets
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+POLL_SECONDS = 2.0
+
+# Loaded at startup so the first request is already warm
+PRELOAD = ["sector_index", "sector_matrix", "daily_aggregates"]
+
+# Memoized query results kept per generation (least recently used dropped)
+CACHE_SIZE = 256
+
+CHART_DIR = CACHE_DIR.parent / "server_charts"
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _to_json(obj):
+    """JSON-ready form of the pandas objects the queries return."""
+    if isinstance(obj, pd.DataFrame):
+        return json.loads(obj.to_json(orient="split", date_format="iso"))
+    if isinstance(obj, pd.Series):
+        return json.loads(obj.to_json(orient="split", date_format="iso"))
+    if isinstance(obj, dict):
+        return {str(k): _to_json(v) for k, v in obj.items()}
+    return obj
+
+
+# -----------------------------
+# In-memory state
+# -----------------------------
+class Analytics:
+    """
+    Datasets plus memoized windows and query results. Every reload goes
+    through reload_changed(), which bumps the generation and drops every
+    cached result. The lock guards the datasets and the cache only;
+    queries compute outside it.
+    """
+
+    def __init__(self, datasets=None, cache_size=CACHE_SIZE):
+        self.datasets = datasets or Datasets()
+        self.lock = threading.RLock()
+        self.generation = 0
+        self.loaded_at = {}
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    # ---------- loading ----------
+    def preload(self, names=PRELOAD):
+        for name in names:
+            try:
+                self._load(name)
+                print(f"✅ Loaded {name}")
+            except FileNotFoundError as e:
+                print(f"⚠️  Skipped {name}: {e}")
+
+    def _load(self, name):
+        with self.lock:
+            # A changed source is reloaded here, not silently by get()
+            if self.datasets.stale():
+                self.reload_changed()
+            df = self.datasets.get(name)
+            self.loaded_at.setdefault(name, time.time())
+            return df
+
+    def get(self, name):
+        try:
+            return self._load(name)
+        except FileNotFoundError as e:
+            raise BadRequest(f"dataset {name} is not available: {e}")
+
+    def reload_changed(self):
+        with self.lock:
+            changed = self.datasets.reload_changed()
+            if changed:
+                self.generation += 1
+                self._cache.clear()
+                for name in changed:
+                    self.loaded_at[name] = time.time()
+        return changed
+
+    def status(self):
+        with self.lock:
+            if self.datasets.stale():
+                self.reload_changed()
+            return {
+                "generation": self.generation,
+                "datasets": {
+                    name: {
+                        "rows": len(self.datasets.get(name)),
+                        "loaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.loaded_at[name])),
+                    }
+                    for name in self.datasets.loaded()
+                },
+            }
+
+    def cached(self, key, compute):
+        """
+        compute() once per key until the next reload. The lock is not
+        held while computing, so a slow query never blocks the others;
+        two requests missing the same key may both compute it. A result
+        computed across a reload isn't kept.
+        """
+        with self.lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            generation = self.generation
+
+        value = compute()
+
+        with self.lock:
+            if generation == self.generation:
+                self._cache[key] = value
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    # ---------- sector index windows ----------
+    def window(self, days, warmup=0):
+        """
+        (dates, df_base, panel) over the last `days` trading days plus
+        `warmup` earlier rows, rebased to 100 on the first row.
+        """
+        def compute():
+            df = self.get("sector_index")
+            if days:
+                df = df.tail(days + warmup).reset_index(drop=True)
+            df_base, panel = rotation.base_100(df)
+            return df["Date"], df_base, panel
+
+        return self.cached(("window", days, warmup), compute)
+
+    # ---------- queries ----------
+    def ranking(self, days=None):
+        _, df_base, _ = self.window(days)
+        return {"Total Return %": rotation.leadership(df_base).round(4).rename(None)}
+
+    def rotation_table(self, days=None, lookback=rotation.LEADER_LOOKBACK):
+        warmup = lookback if days else 0
+        dates, _, panel = self.window(days, warmup)
+
+        leader, _, table, _ = rotation.rotations(panel, dates, lookback)
+
+        # Only changes inside the requested window
+        table = table[table.index >= warmup]
+        table.index = dates.loc[table.index]
+
+        return {
+            "current_leader": leader.iloc[-1] if len(leader) else None,
+            "rotations": table,
+            "transitions": pd.crosstab(table["From"], table["To"]),
+        }
+
+    def drawdowns(self, days=None):
+        dates, _, panel = self.window(days)
+        return {"drawdowns": rotation.drawdowns(panel, dates)}
+
+    def correlation(self, days=None):
+        _, _, panel = self.window(days)
+        matrix, herding = rotation.correlations(panel)
+        return {"matrix": matrix.round(4), "herding": herding.round(4)}
+
+    def top_turnover(self, n=5, start=None, end=None):
+        matrix = self.get("sector_matrix").between(start, end)
+        return {"turnover": matrix.totals("turnover")[matrix.top(n)]}
+
+    def base100_chart(self, days=None):
+        """
+        PNG path of the base-100 chart, rendered once per generation.
+        core.render serializes pyplot and moves the finished file into
+        place, so concurrent requests never read a torn PNG.
+        """
+        def compute():
+            dates, df_base, _ = self.window(days)
+            path = CHART_DIR / f"base100_{days or 'all'}.png"
+            path, _ = rotation.render_base_100(dates, df_base, path=path)
+            return path
+
+        return self.cached(("chart/base100", days), compute)
+
+
+# -----------------------------
+# HTTP
+# -----------------------------
+def _int(query, name, default=None):
+    value = query.get(name, [None])[0]
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+
+
+class Handler(BaseHTTPRequestHandler):
+    analytics = None  # set by make_server()
+
+    def address_string(self):
+        # Unix sockets have no (host, port) pair
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} {format % args}")
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, default=str).encode())
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        a = self.analytics
+        start = time.perf_counter()
+
+        routes = {
+            "/health": lambda: a.status(),
+            "/ranking": lambda: a.ranking(_int(query, "days")),
+            "/rotation": lambda: a.rotation_table(
+                _int(query, "days"), _int(query, "lookback", rotation.LEADER_LOOKBACK)
+            ),
+            "/drawdowns": lambda: a.drawdowns(_int(query, "days")),
+            "/correlation": lambda: a.correlation(_int(query, "days")),
+            "/turnover/top": lambda: a.top_turnover(
+                _int(query, "n", 5),
+                query.get("start", [None])[0],
+                query.get("end", [None])[0],
+            ),
+        }
+
+        try:
+            if url.path == "/chart/base100.png":
+                path = a.base100_chart(_int(query, "days"))
+                self._send(200, Path(path).read_bytes(), "image/png")
+                return
+
+            if url.path not in routes:
+                self._send_json(404, {"error": f"unknown path {url.path}", "paths": sorted(routes)})
+                return
+
+            if url.path == "/health":
+                result = _to_json(a.status())
+            else:
+                # Same path and query -> same answer until the next reload
+                key = (url.path, tuple(sorted((k, tuple(v)) for k, v in query.items())))
+                result = dict(a.cached(key, lambda: _to_json(routes[url.path]())))
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            self._send_json(200, result)
+
+        except BadRequest as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/reload":
+            self._send_json(404, {"error": "POST /reload is the only write"})
+            return
+        self._send_json(200, {"reloaded": self.analytics.reload_changed()})
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(analytics, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    handler = type("BoundHandler", (Handler,), {"analytics": analytics})
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return UnixHTTPServer(socket_path, handler)
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+# -----------------------------
+# File watcher
+# -----------------------------
+def watch(analytics, stop, interval=POLL_SECONDS):
+    """Poll source files and reload changed datasets until stop is set."""
+    while not stop.wait(interval):
+        try:
+            changed = analytics.reload_changed()
+        except Exception as e:
+            print(f"⚠️  Reload failed, keeping the old data: {type(e).__name__}: {e}")
+            continue
+        if changed:
+            print(f"🔄 Reloaded: {', '.join(changed)}")
+
+
+def _terminate(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(datasets=None, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, interval=POLL_SECONDS):
+    analytics = Analytics(datasets)
+    analytics.preload()
+
+    stop = threading.Event()
+    watcher = threading.Thread(target=watch, args=(analytics, stop, interval), daemon=True)
+    watcher.start()
+
+    server = make_server(analytics, host, port, socket_path)
+    where = socket_path or f"http://{host}:{port}"
+    print(f"🚀 Serving on {where} (watching sources every {interval:g}s, Ctrl+C to stop)")
+
+    # Stop the same way on Ctrl+C and on a service manager's SIGTERM
+    signal.signal(signal.SIGTERM, _terminate)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
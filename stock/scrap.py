@@ -1,10 +1,13 @@
-import requests
+import argparse
 import pandas as pd
-import time
 import os
 from datetime import datetime, timedelta
 import urllib3
 
+from core.checkpoint import ScrapeManifest
+from core.fetcher import SectorFetcher, Unauthorized
+from core.sector_store import SectorStore
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # --- CONFIGURATION ---
@@ -12,7 +15,11 @@ SALTER_TOKEN = "Salter eyJlbmMiOiJBMTI4Q0JDLUhTMjU2IiwiYWxnIjoiZGlyIn0..rHbAGHTG
 BASE_URL = "https://www.nepalstock.com/api/nots/sectorwise"
 DEFAULT_START_DATE = datetime(2025, 2, 2)
 END_DATE = datetime(2026, 2, 1)
-OUTPUT_FILE = "nepse_sector_data.csv"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "nepse_sector_data.csv")
+STORE_DIR = os.path.join(SCRIPT_DIR, "data", "sector_store")
+CONCURRENCY = 4
+REQUESTS_PER_SECOND = 2.0
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -22,67 +29,68 @@ HEADERS = {
 }
 
 def get_last_scraped_date():
-    """Checks the CSV file and returns the last business_date found."""
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            df_existing = pd.read_csv(OUTPUT_FILE)
-            if not df_existing.empty:
-                # Get the last date from the 'business_date' column
-                last_date_str = df_existing['business_date'].iloc[-1]
-                return datetime.strptime(last_date_str, "%Y-%m-%d")
-        except Exception as e:
-            print(f"⚠️ Error reading existing file: {e}")
+    """Returns the last business_date recorded in the scrape manifest."""
+    last_date_str = ScrapeManifest.open(OUTPUT_FILE).last_fetched()
+    if last_date_str:
+        return datetime.strptime(last_date_str, "%Y-%m-%d")
     return None
 
-def get_sector_data():
-    # 1. Determine the actual start date
-    last_date = get_last_scraped_date()
-    if last_date:
-        start_from = last_date + timedelta(days=1)
-        print(f"📂 Found existing data. Resuming from: {start_from.date()}")
+def business_dates(start, end):
+    """Yields YYYY-MM-DD strings from start to end, skipping Fri/Sat."""
+    current_date = start
+    while current_date <= end:
+        if current_date.weekday() not in [4, 5]:
+            yield current_date.strftime("%Y-%m-%d")
+        current_date += timedelta(days=1)
+
+def get_sector_data(concurrency=CONCURRENCY, rate=REQUESTS_PER_SECOND):
+    # 1. Work out which dates are still missing (gaps included)
+    manifest = ScrapeManifest.open(OUTPUT_FILE)
+    pending = manifest.pending(business_dates(DEFAULT_START_DATE, END_DATE))
+
+    if manifest.fetched:
+        print(f"📂 Found existing data up to {manifest.last_fetched()}. "
+              f"{len(pending)} date(s) left to fetch.")
     else:
-        start_from = DEFAULT_START_DATE
-        print(f"🆕 No existing file found. Starting fresh from: {start_from.date()}")
-
-    current_date = start_from
-    
-    while current_date <= END_DATE:
-        if current_date.weekday() in [4, 5]:  # Skip Fri/Sat
-            current_date += timedelta(days=1)
-            continue
-
-        formatted_date = current_date.strftime("%Y-%m-%d")
-        params = {"businessDate": formatted_date}
-
-        try:
-            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=15, verify=False)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    new_df = pd.DataFrame(data)
-                    new_df['business_date'] = formatted_date
-                    
-                    # 2. Save incrementally (Append mode)
-                    file_exists = os.path.isfile(OUTPUT_FILE)
-                    new_df.to_csv(OUTPUT_FILE, mode='a', index=False, header=not file_exists)
-                    
-                    print(f"✅ Fetched and Appended: {formatted_date}")
-                else:
-                    print(f"⚪ No data for {formatted_date} (Holiday)")
-            elif response.status_code == 401:
-                print(f"❌ 401 Unauthorized! Update your SALTER_TOKEN.")
-                break
-            else:
-                print(f"❌ Error {response.status_code} for {formatted_date}")
+        print(f"🆕 No existing data found. Starting fresh from: {DEFAULT_START_DATE.date()}")
 
-        except Exception as e:
-            print(f"⚠️ Connection error on {formatted_date}: {e}")
+    store = SectorStore(STORE_DIR)
+    fetcher = SectorFetcher(BASE_URL, headers=HEADERS, concurrency=concurrency, rate=rate)
 
-        time.sleep(1.5)  # Slightly longer delay to keep the connection stable
-        current_date += timedelta(days=1)
+    # 2. Fetch concurrently, results arrive in date order
+    try:
+        for formatted_date, status, data in fetcher.fetch(pending):
+            if status == "ok":
+                new_df = pd.DataFrame(data)
+                new_df['business_date'] = formatted_date
+
+                # 3. Save incrementally (Append mode), then checkpoint
+                file_exists = os.path.isfile(OUTPUT_FILE)
+                new_df.to_csv(OUTPUT_FILE, mode='a', index=False, header=not file_exists)
+                store.append(new_df)
+                manifest.mark_fetched(formatted_date)
+
+                print(f"✅ Fetched and Appended: {formatted_date}")
+            elif status == "holiday":
+                manifest.mark_holiday(formatted_date)
+                print(f"⚪ No data for {formatted_date} (Holiday)")
+            else:
+                manifest.mark_failed(formatted_date, data)
+                print(f"❌ {data} for {formatted_date}")
+    except Unauthorized:
+        print(f"❌ 401 Unauthorized! Update your SALTER_TOKEN.")
+
+    if manifest.failed:
+        print(f"\n⚠️ {len(manifest.failed)} date(s) failed, they will be retried next run.")
 
     print(f"\n✨ Scraping session finished.")
 
 if __name__ == "__main__":
-    get_sector_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape NEPSE sector-wise data")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help="parallel requests (1 = one date at a time)")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                        help="max requests per second across all workers")
+    args = parser.parse_args()
+
+    get_sector_data(concurrency=args.concurrency, rate=args.rate)
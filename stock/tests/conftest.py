@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Scripts import core.* and reports.* with stock/ on the path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from core.drawdown import DrawdownTracker, drawdown_episodes
+
+
+def tracker_episodes(values, columns):
+    tracker = DrawdownTracker(columns)
+    for i, row in enumerate(values):
+        tracker.update(i, row)
+    return tracker.episodes + tracker.open_episodes()
+
+
+def test_gaps_do_not_end_episodes():
+    values = np.array([100, 90, np.nan, 95, 100, 80, np.nan, np.nan])
+    episodes = drawdown_episodes(values)
+
+    assert len(episodes) == 2
+    assert list(episodes["Peak"]) == [0, 4]
+    assert list(episodes["Trough"]) == [1, 5]
+    assert episodes["Recovery"].iloc[0] == 4
+    assert pd.isna(episodes["Recovery"].iloc[1])
+
+
+def test_peak_before_a_gap():
+    values = np.array([100, np.nan, 90, np.nan, np.nan, 101])
+    episodes = drawdown_episodes(values)
+
+    assert len(episodes) == 1
+    assert episodes.iloc[0][["Peak", "Trough", "Recovery"]].tolist() == [0, 2, 5]
+
+
+def test_matches_tracker_with_gaps():
+    rng = np.random.default_rng(0)
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.02, size=(300, 4)), axis=0)
+    values[rng.random(values.shape) < 0.1] = np.nan
+    columns = ["A", "B", "C", "D"]
+
+    batch = drawdown_episodes(values, columns=columns)
+    stream = pd.DataFrame(tracker_episodes(values, columns))
+
+    key = ["Sector", "Peak", "Trough"]
+    batch = batch.sort_values(key).reset_index(drop=True)
+    stream = stream.sort_values(key).reset_index(drop=True)
+
+    assert batch[key].values.tolist() == stream[key].values.tolist()
+    np.testing.assert_allclose(batch["Depth %"], stream["Depth %"].astype(float))
+    recovery = [[None if pd.isna(r) else int(r) for r in df["Recovery"]] for df in (batch, stream)]
+    assert recovery[0] == recovery[1]
@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from core.fetcher import SectorFetcher, Unauthorized
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Sector-wise endpoint stand-in. plan[date] lists the responses to
+    give, in order, as (status, body, delay); the last one repeats.
+    """
+
+    plan = {}
+    hits = Counter()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        day = parse_qs(urlparse(self.path).query)["businessDate"][0]
+        with self.lock:
+            responses = self.plan[day]
+            status, body, delay = responses[min(self.hits[day], len(responses) - 1)]
+            self.hits[day] += 1
+
+        time.sleep(delay)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def stub():
+    handler = type("Handler", (StubHandler,), {"plan": {}, "hits": Counter(), "lock": threading.Lock()})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield handler, f"http://127.0.0.1:{server.server_port}/sectorwise"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def fetcher(url, **kwargs):
+    options = dict(rate=0, backoff=0, retries=3, timeout=5)
+    return SectorFetcher(url, **{**options, **kwargs})
+
+
+ROWS = [{"sectorName": "Banking", "turnOver": 1}]
+
+
+def test_retries_5xx_and_429(stub):
+    handler, url = stub
+    handler.plan["2024-01-01"] = [(503, {}, 0), (429, {}, 0), (200, ROWS, 0)]
+    handler.plan["2024-01-02"] = [(500, {}, 0)]
+
+    f = fetcher(url)
+    assert f.fetch_day("2024-01-01") == ("ok", ROWS)
+    assert handler.hits["2024-01-01"] == 3
+
+    assert f.fetch_day("2024-01-02") == ("error", "HTTP 500")
+    assert handler.hits["2024-01-02"] == 4   # first try + 3 retries
+
+
+def test_client_errors_are_not_retried(stub):
+    handler, url = stub
+    handler.plan["2024-01-01"] = [(404, {}, 0)]
+
+    assert fetcher(url).fetch_day("2024-01-01") == ("error", "HTTP 404")
+    assert handler.hits["2024-01-01"] == 1
+
+
+def test_unauthorized_stops_the_fetch(stub):
+    handler, url = stub
+    handler.plan["2024-01-01"] = [(401, {}, 0)]
+    handler.plan["2024-01-02"] = [(200, ROWS, 0)]
+
+    with pytest.raises(Unauthorized):
+        fetcher(url).fetch_day("2024-01-01")
+    assert handler.hits["2024-01-01"] == 1
+
+    with pytest.raises(Unauthorized):
+        list(fetcher(url, concurrency=1).fetch(["2024-01-01", "2024-01-02"]))
+
+
+def test_yields_in_date_order(stub):
+    handler, url = stub
+    days = [f"2024-01-{d:02d}" for d in range(1, 13)]
+    for i, day in enumerate(days):
+        # Earlier dates answer later, so completion order is reversed
+        body = [] if i % 5 == 4 else [{"sectorName": "Banking", "day": day}]
+        handler.plan[day] = [(200, body, 0.02 * (len(days) - i) / len(days))]
+
+    results = list(fetcher(url, concurrency=4).fetch(days))
+
+    assert [day for day, _, _ in results] == days
+    statuses = defaultdict(list)
+    for day, status, payload in results:
+        statuses[status].append(day)
+        if status == "ok":
+            assert payload[0]["day"] == day
+    assert statuses["holiday"] == [days[4], days[9]]
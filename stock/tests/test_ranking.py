@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.ranking import StreamingTopN, top_n, top_n_per_group, top_n_per_row
+
+
+def random_frame(seed, rows=400):
+    """Few distinct values, so ties are everywhere, and some NaNs."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "value": rng.integers(-20, 20, rows).astype(np.float64),
+        "second": rng.integers(0, 5, rows).astype(np.float64),
+        "group": rng.choice(["a", "b", "c", "d"], rows),
+    })
+    df.loc[rng.random(rows) < 0.1, "value"] = np.nan
+    df.loc[rng.random(rows) < 0.1, "second"] = np.nan
+    return df.set_index(rng.permutation(rows))
+
+
+def stable_head(df, n, by, ascending):
+    return df.sort_values(by, ascending=ascending, kind="stable", na_position="last").head(n)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n", [0, 1, 7, 50, 1000])
+@pytest.mark.parametrize("ascending", [False, True])
+def test_top_n_matches_stable_sort(seed, n, ascending):
+    df = random_frame(seed)
+    pd.testing.assert_frame_equal(top_n(df, n, "value", ascending), stable_head(df, n, "value", ascending))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n", [1, 7, 50])
+@pytest.mark.parametrize("ascending", [False, True, [False, True], [True, False]])
+def test_top_n_several_keys(seed, n, ascending):
+    df = random_frame(seed)
+    by = ["value", "second"]
+    pd.testing.assert_frame_equal(top_n(df, n, by, ascending), stable_head(df, n, by, ascending))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_top_n_absolute(seed):
+    df = random_frame(seed)
+    expected = df.iloc[np.argsort(-df["value"].abs().fillna(-np.inf).to_numpy(), kind="stable")[:25]]
+    pd.testing.assert_frame_equal(top_n(df, 25, "value", absolute=True), expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n", [1, 3, 200])
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_n_per_group_matches_groupby_head(seed, n, largest):
+    df = random_frame(seed)
+    expected = (stable_head(df, len(df), "value", not largest)
+                .groupby("group", sort=True).head(n)
+                .sort_values("group", kind="stable"))
+    pd.testing.assert_frame_equal(top_n_per_group(df, n, "value", "group", largest), expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n", [1, 3, 6])
+def test_top_n_per_row_matches_stable_sort(seed, n):
+    values = random_frame(seed, rows=360)["value"].to_numpy().reshape(60, 6)
+    score = np.where(np.isnan(values), np.inf, -values)
+    expected = np.argsort(score, axis=1, kind="stable")[:, :n]
+    np.testing.assert_array_equal(top_n_per_row(values, n), expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("chunk", [1, 13, 100, 1000])
+def test_streaming_matches_stable_sort(seed, chunk):
+    df = random_frame(seed)
+    top = StreamingTopN(10, by="value")
+    for start in range(0, len(df), chunk):
+        top.update(df.iloc[start:start + chunk])
+
+    assert top.rows_seen == len(df)
+    pd.testing.assert_frame_equal(top.result(), stable_head(df, 10, "value", False))
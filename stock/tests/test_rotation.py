@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.rotation import rotation_backtest
+
+
+# Old per-date loop of moneyflow.py, the behaviour the vectorized
+# backtest has to keep
+def legacy_rotation_backtest(df_base, lookback=20, transaction_cost=0.002):
+    momentum = df_base.pct_change(lookback)
+    momentum = momentum.dropna(how="all")
+
+    daily_returns = df_base.pct_change().fillna(0)
+
+    leader = momentum.idxmax(axis=1)
+
+    strategy_returns = []
+    current_sector = None
+
+    for date in df_base.index:
+        if date not in leader.index:
+            strategy_returns.append(0)
+            continue
+
+        new_sector = leader.loc[date]
+
+        if current_sector is not None and new_sector != current_sector:
+            cost = transaction_cost
+        else:
+            cost = 0
+
+        strategy_returns.append(daily_returns.loc[date, new_sector] - cost)
+        current_sector = new_sector
+
+    strategy_returns = pd.Series(strategy_returns, index=df_base.index)
+    equity_curve = (1 + strategy_returns).cumprod()
+
+    rolling_max = equity_curve.cummax()
+    drawdown = (equity_curve - rolling_max) / rolling_max
+
+    return {
+        "Lookback": lookback,
+        "Total Return %": (equity_curve.iloc[-1] - 1) * 100,
+        "Max Drawdown %": drawdown.min() * 100,
+        "Sharpe Ratio": (strategy_returns.mean() / strategy_returns.std()) * np.sqrt(252),
+        "Equity Curve": equity_curve,
+    }
+
+
+@pytest.fixture
+def df_base():
+    rng = np.random.default_rng(42)
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.015, size=(250, 5)), axis=0)
+    df = pd.DataFrame(prices, columns=["Banking", "Hydro", "Finance", "Hotels", "Others"])
+    return df / df.iloc[0] * 100
+
+
+@pytest.mark.parametrize("lookback", [1, 5, 20, 60])
+@pytest.mark.parametrize("cost", [0.0, 0.002])
+def test_matches_legacy_loop(df_base, lookback, cost):
+    old = legacy_rotation_backtest(df_base, lookback, cost)
+    new = rotation_backtest(df_base, lookback, cost)
+
+    pd.testing.assert_series_equal(old["Equity Curve"], new["Equity Curve"], rtol=1e-12)
+    for key in ["Lookback", "Total Return %", "Max Drawdown %", "Sharpe Ratio"]:
+        assert new[key] == pytest.approx(old[key], rel=1e-12), key
+
+
+def test_flat_curve_has_no_sharpe():
+    from core.sweep import run_stats
+
+    flat = pd.DataFrame({"A": [100.0] * 30, "B": [100.0] * 30})
+    assert np.isnan(rotation_backtest(flat, lookback=5, transaction_cost=0)["Sharpe Ratio"])
+    assert np.isnan(run_stats(np.zeros(30))[0]["Sharpe Ratio"])